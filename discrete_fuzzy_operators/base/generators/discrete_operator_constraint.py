@@ -0,0 +1,72 @@
+import numpy
+
+from enum import Enum
+from typing import Iterable, Tuple
+
+
+class DiscreteOperatorConstraint(Enum):
+    """
+    Object that stores the properties that the generators of binary operators can enforce while the cells of the
+    matrices are filled, instead of filtering the generated operators afterwards.
+
+    The properties are stated for conjunctive operators C, such as conjunctions or t-norms, and they are the ones
+    satisfied by C when the implication I(x,y)=n-C(x,n-y) satisfies the corresponding principle:
+        - NEUTRALITY_PRINCIPLE: C(n,y)=y for all y in Ln.
+        - IDENTITY_PRINCIPLE: C(x,n-x)=0 for all x in Ln.
+        - ORDERING_PRINCIPLE: C(x,y)=0 if, and only if, x <= n-y.
+        - CONSEQUENT_BOUNDARY: C(x,y) <= y for all x,y in Ln.
+    """
+    NEUTRALITY_PRINCIPLE = "NP"
+    IDENTITY_PRINCIPLE = "IP"
+    ORDERING_PRINCIPLE = "OP"
+    CONSEQUENT_BOUNDARY = "CB"
+
+    @staticmethod
+    def compute_cell_bounds(constraints: Iterable["DiscreteOperatorConstraint"], n: int,
+                            lower_bounds: numpy.ndarray = None,
+                            upper_bounds: numpy.ndarray = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Computes the lower and upper bounds of each cell of the matrix of an increasing operator which satisfies the
+        given constraints, where the entry (y, x) of the matrix is the value of the operator at (x, y).
+
+        The bounds are closed under the monotonicity, so that both the lower and the upper bounds are increasing; this
+        way, any increasing matrix which is between the bounds in a prefix of the cells, in
+        row-major order, can be completed by assigning to each remaining cell the maximum of its lower bound and its
+        previous neighbours.
+
+        Args:
+            constraints: An iterable of DiscreteOperatorConstraint values.
+            n: An integer, representing the dimension of the finite chain.
+            lower_bounds: A numpy array of shape (n+1, n+1), representing the bounds of the family without
+                          constraints. By default, 0.
+            upper_bounds: A numpy array of shape (n+1, n+1), representing the bounds of the family without
+                          constraints. By default, n.
+
+        Returns:
+            Two numpy arrays of integers of shape (n+1, n+1), representing the lower and the upper bounds of the cells.
+            If some lower bound is greater than the corresponding upper bound, no operator satisfies the constraints.
+        """
+        lower = numpy.zeros((n + 1, n + 1), dtype=numpy.int64) if lower_bounds is None else \
+            numpy.array(lower_bounds, dtype=numpy.int64)
+        upper = numpy.full((n + 1, n + 1), n, dtype=numpy.int64) if upper_bounds is None else \
+            numpy.array(upper_bounds, dtype=numpy.int64)
+
+        # The row index is the second argument y and the column index is the first argument x.
+        y, x = numpy.indices((n + 1, n + 1))
+        for constraint in set(constraints):
+            if constraint == DiscreteOperatorConstraint.NEUTRALITY_PRINCIPLE:
+                lower[:, n] = numpy.maximum(lower[:, n], numpy.arange(0, n + 1))
+                upper[:, n] = numpy.minimum(upper[:, n], numpy.arange(0, n + 1))
+            elif constraint == DiscreteOperatorConstraint.IDENTITY_PRINCIPLE:
+                upper[x + y == n] = 0
+            elif constraint == DiscreteOperatorConstraint.ORDERING_PRINCIPLE:
+                upper[x + y <= n] = 0
+                lower[x + y > n] = numpy.maximum(lower[x + y > n], 1)
+            elif constraint == DiscreteOperatorConstraint.CONSEQUENT_BOUNDARY:
+                upper = numpy.minimum(upper, y)
+            else:
+                raise Exception("The constraint is not supported by the generators.")
+
+        lower = numpy.maximum.accumulate(numpy.maximum.accumulate(lower, axis=0), axis=1)
+        upper = numpy.minimum.accumulate(numpy.minimum.accumulate(upper[::-1, ::-1], axis=0), axis=1)[::-1, ::-1]
+        return lower, numpy.ascontiguousarray(upper)
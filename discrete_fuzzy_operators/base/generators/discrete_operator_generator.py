@@ -1,10 +1,22 @@
-from typing import Generator
+from discrete_fuzzy_operators.base.generators.discrete_operator_constraint import DiscreteOperatorConstraint
+from typing import Generator, Iterable
 
 
 class DiscreteOperatorGenerator:
 
-    def __init__(self, n: int):
+    def __init__(self, n: int, constraints: Iterable[DiscreteOperatorConstraint] = None):
+        """
+        Initializes the object that generates discrete operators defined over the finite chain Ln.
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            constraints: An iterable of DiscreteOperatorConstraint values, representing the properties that the
+                         generated operators must satisfy. The generators which support them enforce the constraints
+                         while the operators are built, so that the operators which violate them are never explored.
+                         Optional.
+        """
         self.n = n
+        self.constraints = frozenset(constraints) if constraints is not None else frozenset()
 
     def generate_operators(self) -> Generator:
         """
@@ -2,14 +2,138 @@ import numpy
 
 
 class NumericComparator:
-    def __init__(self, rtol: float = 1e-05, atol: float = 1e-08):
+    DEFAULT_RTOL = 1e-05
+    DEFAULT_ATOL = 1e-08
+
+    def __init__(self, rtol: float = DEFAULT_RTOL, atol: float = DEFAULT_ATOL, chunk_size: int = 2 ** 20):
+        """
+        Initializes the object that compares real numbers up to a tolerance. Two numbers a and b are considered equal
+        if |a - b| <= atol + rtol*|b|, which is the criterion of numpy.isclose.
+
+        The comparisons work with numbers and with numpy arrays, which are broadcast against each other. The
+        reductions (all_equal, all_less_equal and all_greater_equal) are computed over blocks of chunk_size elements
+        and stop at the first block which contains a failed comparison.
+
+        Args:
+            rtol: A float, representing the relative tolerance.
+            atol: A float, representing the absolute tolerance.
+            chunk_size: An integer, representing the number of elements compared at once in the reductions.
+        """
+        if rtol < 0 or atol < 0:
+            raise Exception("The tolerances of the comparator must be non-negative.")
+        if chunk_size < 1:
+            raise Exception("The size of the blocks of the comparator must be positive.")
+
         self.rtol = rtol
         self.atol = atol
+        self.chunk_size = chunk_size
+
+    # region Elementwise comparisons
+    def equal(self, a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        """
+        Checks elementwise if a = b up to the tolerance.
+
+        Args:
+            a: A float or a numpy array of floats.
+            b: A float or a numpy array of floats, representing the reference values.
+
+        Returns:
+            A boolean or a numpy array of booleans.
+        """
+        return numpy.isclose(a, b, rtol=self.rtol, atol=self.atol)
+
+    def less_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        """
+        Checks elementwise if a <= b up to the tolerance.
+
+        Args:
+            a: A float or a numpy array of floats.
+            b: A float or a numpy array of floats, representing the reference values.
+
+        Returns:
+            A boolean or a numpy array of booleans.
+        """
+        return numpy.less_equal(a, b) | self.equal(a, b)
+
+    def greater_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        """
+        Checks elementwise if a >= b up to the tolerance.
+
+        Args:
+            a: A float or a numpy array of floats.
+            b: A float or a numpy array of floats, representing the reference values.
+
+        Returns:
+            A boolean or a numpy array of booleans.
+        """
+        return numpy.greater_equal(a, b) | self.equal(a, b)
+
+    def excess_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes elementwise the residual of the equality a = b, which is positive if and only if the values are not
+        equal up to the tolerance. The magnitude of the residual measures how far the comparison is from failing.
+
+        Args:
+            a: A float or a numpy array of floats.
+            b: A float or a numpy array of floats, representing the reference values.
+
+        Returns:
+            A float or a numpy array of floats.
+        """
+        return numpy.abs(numpy.subtract(a, b)) - (self.atol + self.rtol * numpy.abs(b))
+
+    def excess_less_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes elementwise the residual of the inequality a <= b, which is positive if and only if a is greater than
+        b and both values are not equal up to the tolerance.
+
+        Args:
+            a: A float or a numpy array of floats.
+            b: A float or a numpy array of floats, representing the reference values.
+
+        Returns:
+            A float or a numpy array of floats.
+        """
+        return numpy.subtract(a, b) - (self.atol + self.rtol * numpy.abs(b))
+    # endregion
+
+    # region Reductions
+    def all_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> bool:
+        """
+        Checks if a = b up to the tolerance for all the elements.
+        """
+        return self.__reduce_all(self.equal, a, b)
+
+    def all_less_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> bool:
+        """
+        Checks if a <= b up to the tolerance for all the elements.
+        """
+        return self.__reduce_all(self.less_equal, a, b)
+
+    def all_greater_equal(self, a: numpy.ndarray, b: numpy.ndarray) -> bool:
+        """
+        Checks if a >= b up to the tolerance for all the elements.
+        """
+        return self.__reduce_all(self.greater_equal, a, b)
+
+    def __reduce_all(self, comparison, a: numpy.ndarray, b: numpy.ndarray) -> bool:
+        """
+        Applies an elementwise comparison to the flattened, broadcast arguments by blocks, and stops at the first
+        block which contains a failed comparison.
+        """
+        a, b = numpy.broadcast_arrays(numpy.asarray(a, dtype=float), numpy.asarray(b, dtype=float))
+        a, b = a.reshape(-1), b.reshape(-1)
+        for start in range(0, a.size, self.chunk_size):
+            if not comparison(a[start:start + self.chunk_size], b[start:start + self.chunk_size]).all():
+                return False
+        return True
+    # endregion
 
+    # region Comparisons of numbers with the default tolerances
     @staticmethod
     def compare_equal(a: float, b: float) -> bool:
-        rtol = NumericComparator().rtol
-        atol = NumericComparator().atol
+        rtol = NumericComparator.DEFAULT_RTOL
+        atol = NumericComparator.DEFAULT_ATOL
         return abs(a - b) <= (atol + rtol * abs(b))
 
     @staticmethod
@@ -19,3 +143,4 @@ class NumericComparator:
     @staticmethod
     def compare_greater_equal(a: float, b: float) -> bool:
         return a >= b or NumericComparator.compare_equal(a, b)
+    # endregion
@@ -300,6 +300,74 @@ class DiscreteBinaryOperator:
                 first_argument=False)
     # endregion
 
+    # region Unit extension
+    def evaluate_unit_extension(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the piecewise linear extension of the operator to the unit square. The operator is embedded in the
+        unit cube through the points (i/n, j/n, F(i,j)/n), and each square of size 1/n is split by its diagonal in two
+        triangles, where the extension is the plane which interpolates the three vertices of the triangle.
+
+        The arguments can be arrays of any shape, which are broadcast against each other.
+
+        Args:
+            x: A numpy array of floats in [0,1], representing the first coordinates of the points.
+            y: A numpy array of floats in [0,1], representing the second coordinates of the points.
+
+        Returns:
+            A numpy array of floats, representing the value of the unit extension in the given points.
+        """
+        x, y = numpy.broadcast_arrays(numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float))
+        if not ((0 <= x).all() and (x <= 1).all() and (0 <= y).all() and (y <= 1).all()):
+            raise Exception("To evaluate the unit extension of the operator, the arguments must be between 0 and 1.")
+
+        scaled_x = self.n * x
+        scaled_y = self.n * y
+        i = numpy.minimum(numpy.floor(scaled_x).astype(int), self.n - 1)
+        j = numpy.minimum(numpy.floor(scaled_y).astype(int), self.n - 1)
+        dx = scaled_x - i
+        dy = scaled_y - j
+
+        # Warning: The matrix is evaluated in the reversed point, where rows represent Y coordinates.
+        unit_matrix = self.operator_matrix / self.n
+        value_i_j = unit_matrix[j, i]
+        value_i1_j = unit_matrix[j, i + 1]
+        value_i_j1 = unit_matrix[j + 1, i]
+        value_i1_j1 = unit_matrix[j + 1, i + 1]
+
+        upper_triangle = value_i_j + dx * (value_i1_j1 - value_i_j1) + dy * (value_i_j1 - value_i_j)
+        lower_triangle = value_i_j + dx * (value_i1_j - value_i_j) + dy * (value_i1_j1 - value_i1_j)
+        return numpy.where(dy >= dx, upper_triangle, lower_triangle)
+
+    def generate_unit_extension_mesh(self, **kwargs) -> go.Mesh3d:
+        """
+        Generates the mesh of the piecewise linear extension of the operator to the unit square. Since the extension is
+        linear in each triangle of the grid, the mesh with the discrete points as vertices and two triangles per square
+        represents it exactly.
+
+        Args:
+            **kwargs: Additional arguments passed to the Mesh3d object.
+
+        Returns:
+            A Mesh3d object, representing the unit extension of the operator.
+        """
+        grid = numpy.arange(0, self.n + 1)
+        x_index, y_index = numpy.meshgrid(grid, grid)
+        z = self.operator_matrix[y_index, x_index] / self.n
+
+        # The vertex associated to the point (i, j) is stored in the position j*(n+1)+i.
+        i, j = numpy.meshgrid(grid[:-1], grid[:-1])
+        vertex_i_j = (j * (self.n + 1) + i).ravel()
+        vertex_i1_j = vertex_i_j + 1
+        vertex_i_j1 = vertex_i_j + self.n + 1
+        vertex_i1_j1 = vertex_i_j1 + 1
+
+        return go.Mesh3d(x=(x_index / self.n).ravel(), y=(y_index / self.n).ravel(), z=z.ravel(),
+                         i=numpy.concatenate([vertex_i_j, vertex_i_j]),
+                         j=numpy.concatenate([vertex_i_j1, vertex_i1_j]),
+                         k=numpy.concatenate([vertex_i1_j1, vertex_i1_j1]),
+                         intensity=z.ravel(), cmin=0, cmax=1, showscale=False, **kwargs)
+    # endregion
+
     # region Plot generation
     def plot_operator(self, figure_size: Tuple[int, int] = (700, 700), figure_title: str = "Discrete operator"):
         """
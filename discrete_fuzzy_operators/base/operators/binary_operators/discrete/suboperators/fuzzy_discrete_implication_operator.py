@@ -196,61 +196,24 @@ class DiscreteImplicationOperator(DiscreteBinaryOperator):
 
         return x, y, z
 
-    def __extend_continually_implication(self, x_point: int, y_point: int, intermediate_steps: int = 20) -> Tuple[List[float], List[float], numpy.ndarray]:
-        """
-        Computes the unit extension of a discrete implication. In the square generated with the point
-        (x_point/n, y_point/n) and size 1/n, two planes are computed; the first one is located in the upper triangle
-        respect the diagonal, and the second one is located in the lower triangle respect the diagonal.
-
-        Args:
-            x_point: An integer, representing the first component of the point to carry out the interpolation.
-            y_point: An integer, representing the second component of the point to carry out the interpolation.
-            intermediate_steps: An integer, representing the number of steps to plot the unit plot.
-
-        Returns:
-            A tuple of three elements: two lists containing the components of the points and a matrix representing the
-            mapping to be plotted.
-        """
-        x_values = numpy.linspace(x_point/self.n, (x_point+1)/self.n, intermediate_steps)
-        y_values = numpy.linspace(y_point/self.n, (y_point+1)/self.n, intermediate_steps)
-        continuous_function_values = numpy.zeros((len(x_values), len(y_values)))
-        for x_idx, x in enumerate(x_values):
-            for y_idx, y in enumerate(y_values):
-                adv_i1_j1 = self.evaluate_operator(x_point+1, y_point+1)/self.n
-                adv_i_j1 = self.evaluate_operator(x_point, y_point+1)/self.n
-                adv_i1_j = self.evaluate_operator(x_point+1, y_point)/self.n
-                adv_i_j = self.evaluate_operator(x_point, y_point)/self.n
-
-                if y-y_point/self.n >= x-x_point/self.n:
-                    z = adv_i_j + self.n * (x - x_point / self.n) * (adv_i1_j1 - adv_i_j1) + self.n * (
-                                y - y_point / self.n) * (adv_i_j1 - adv_i_j)
-                else:
-                    z = adv_i_j + self.n * (x - x_point / self.n) * (adv_i1_j - adv_i_j) + self.n * (
-                                y - y_point / self.n) * (adv_i1_j1 - adv_i1_j)
-
-                continuous_function_values[y_idx, x_idx] = z
-
-        return x_values, y_values, continuous_function_values
-
     def plot_continuous_extension(self, figure_size: Tuple[int, int], figure_title: str,
                                   show_contour: bool = True, **kwargs):
         """
         Plots the unit extension of a discrete implication; that is, the unit implication defined in the
-        unit interval such that its discretization is the given discrete implication.
+        unit interval such that its discretization is the given discrete implication. The extension is drawn as a
+        single mesh, with two triangles for each square of the grid.
 
         Args:
             figure_size: A tuple of two integers, representing the size of the figure. The order is WIDTH and HEIGHT.
             figure_title: A string, representing the label of the operator.
             show_contour: A boolean, indicating if the contour of the cube has to be shown.
+            **kwargs: Additional arguments passed to the Mesh3d object of the extension.
         """
         x_discrete, y_discrete, z_discrete = self.__generate_discrete_points()
 
-        plot = []
-
-        for i in range(0, self.n):
-            for j in range(0, self.n):
-                x_continuous, y_continuous, z_continuous = self.__extend_continually_implication(x_point=i, y_point=j, **kwargs)
-                plot.append(go.Surface(x=x_continuous, y=y_continuous, z=z_continuous, showscale=False, cmin=0, cmax=1))
+        # The extension is exact, so the former resolution of each square is no longer needed.
+        kwargs.pop("intermediate_steps", None)
+        plot = [self.generate_unit_extension_mesh(**kwargs)]
 
         plot.append(go.Scatter3d(x=x_discrete, y=y_discrete, z=z_discrete,
                                  mode="markers", name=figure_title,
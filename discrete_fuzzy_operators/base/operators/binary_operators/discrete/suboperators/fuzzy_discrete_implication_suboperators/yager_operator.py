@@ -6,6 +6,8 @@ from discrete_fuzzy_operators.base.operators.binary_operators.discrete.fuzzy_dis
     DiscreteBinaryOperator
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_implication_operator import \
     DiscreteImplicationOperator
+from discrete_fuzzy_operators.base.operators.unary_operators.discrete.fuzzy_discrete_unary_operator import \
+    DiscreteUnaryOperator
 from discrete_fuzzy_operators.base.operators.unary_operators.discrete.suboperators.yager_generator_operator import \
     YagerGeneratorOperator
 
@@ -37,9 +39,6 @@ class YagerImplication(DiscreteImplicationOperator):
             raise Exception("The dimensions of the generator, the binary function and the provided dimension do not "
                             "match.")
 
-        matrix = numpy.zeros((n + 1, n + 1), dtype=int)
-        for x in range(0, n + 1):
-            for y in range(0, n + 1):
-                matrix[y, x] = generator.get_pseudoinverse().evaluate_operator(
-                    binary_operator.evaluate_operator(x, generator.evaluate_operator(y)))
-        return matrix
+        # The matrix of the binary operator is indexed as [y, x], so the row f(y) contains the values F(x, f(y)).
+        pseudoinverse = DiscreteUnaryOperator.compute_pseudoinverse_vectors(generator.operator_vector)
+        return pseudoinverse[binary_operator.operator_matrix[numpy.asarray(generator.operator_vector, dtype=int), :]]
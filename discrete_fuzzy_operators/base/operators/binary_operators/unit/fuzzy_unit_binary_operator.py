@@ -1,17 +1,21 @@
 import numpy
 import plotly.graph_objects as go
 from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
-from math import ceil, floor, isclose
-from typing import Callable, List, Tuple
+from math import isclose
+from typing import Callable, Dict, List, Tuple
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.fuzzy_discrete_binary_operator import \
     DiscreteBinaryOperator
+from discrete_fuzzy_operators.base.property_verification.adaptive_property_checker import AdaptiveCheckResult, \
+    AdaptivePropertyChecker
 
 
 class FuzzyUnitBinaryOperator:
 
     def __init__(self,
                  operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the base object representing the operator defined in the unit interval from its analytical
         expression. Since the class works with numbers between 0 and 1, in order to prevent rounding errors the
@@ -22,12 +26,20 @@ class FuzzyUnitBinaryOperator:
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       It must broadcast its arguments and return the same values as the analytical
+                                       expression. Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
         if operator_expression is None:
             raise Exception("In order to define a binary operator, its analytical expression must be provided.")
 
         self.operator_expression = operator_expression
+        self.operator_array_expression = operator_array_expression
+        self.comparator = comparator if comparator is not None else NumericComparator()
+        self.supports_arrays = None
 
     def evaluate_operator(self, x: float, y: float) -> float:
         """
@@ -45,6 +57,63 @@ class FuzzyUnitBinaryOperator:
                             "0 and 1.")
         return self.operator_expression(x, y)
 
+    def evaluate_operator_array(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in several points at once. The arguments are broadcast against each other and the range
+        of the arguments is checked once for the whole arrays.
+
+        If an array expression has been provided, it is used. Otherwise, if the analytical expression supports numpy
+        arrays, it is called once with the arrays; and if it does not, it is evaluated point by point. The decision is
+        taken in the first evaluation and kept in the attribute supports_arrays: the expression is evaluated point by
+        point if it raises a TypeError or a ValueError with arrays, if its result does not have the shape of the
+        arguments, or if its result differs from the scalar evaluation in some of the points, as happens with
+        expressions which reduce their arguments, such as numpy.min([x, y]).
+
+        Args:
+            x: A numpy array of floats, representing the first coordinates of the points.
+            y: A numpy array of floats, representing the second coordinates of the points.
+
+        Returns:
+            A numpy array of floats, representing the value of the function in the given points.
+        """
+        x, y = numpy.broadcast_arrays(numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float))
+        if not ((0 <= x).all() and (x <= 1).all() and (0 <= y).all() and (y <= 1).all()):
+            raise Exception("To evaluate a binary operator defined in the unit interval, the arguments must be between "
+                            "0 and 1.")
+
+        if self.operator_array_expression is not None:
+            values = numpy.asarray(self.operator_array_expression(x, y), dtype=float)
+            return numpy.broadcast_to(values, x.shape).copy()
+
+        if self.supports_arrays is not False and x.size > 1:
+            try:
+                values = numpy.asarray(self.operator_expression(x, y), dtype=float)
+            except (TypeError, ValueError):
+                # The expression relies on scalar operations: the truth value of an array is ambiguous in comparisons,
+                # min or max (ValueError), and functions such as math.exp only accept scalars (TypeError). Any other
+                # exception is an error of the expression and is raised.
+                values = None
+
+            if values is not None and values.shape == x.shape and \
+                    (self.supports_arrays or self.__agrees_with_scalar_expression(x, y, values)):
+                self.supports_arrays = True
+                return values.copy()
+            self.supports_arrays = False
+
+        return numpy.vectorize(self.operator_expression, otypes=[float])(x, y)
+
+    def __agrees_with_scalar_expression(self, x: numpy.ndarray, y: numpy.ndarray, values: numpy.ndarray,
+                                        number_of_points: int = 4) -> bool:
+        """
+        Checks if the values computed by calling the analytical expression with arrays coincide with its scalar
+        evaluation in some points spread over the arrays.
+        """
+        indices = numpy.unique(numpy.linspace(0, x.size - 1, number_of_points).astype(int))
+        x_points, y_points = x.reshape(-1)[indices], y.reshape(-1)[indices]
+        scalar_values = numpy.array([self.operator_expression(float(a), float(b)) for a, b in zip(x_points, y_points)],
+                                    dtype=float)
+        return self.comparator.all_equal(values.reshape(-1)[indices], scalar_values)
+
     def evaluate_operator_power(self, x: float, n: int) -> float:
         """
         Evaluates the n-th power of the operator for the given number.
@@ -60,10 +129,57 @@ class FuzzyUnitBinaryOperator:
         if not n > 1:
             raise Exception("Introduce an exponent bigger than 1.")
         xn = x
-        for i in range(0,n):
+        for i in range(1, n):
             xn = self.evaluate_operator(x, xn)
         return xn
 
+    def evaluate_operator_power_array(self, x: numpy.ndarray, n) -> numpy.ndarray:
+        """
+        Evaluates the n-th powers of the operator, defined as x^1 = x and x^n = F(x, x^(n-1)), for several numbers at
+        once. The powers of all the numbers are iterated together over arrays; each number stops being iterated when
+        its exponent is reached or when its power becomes stable, since then all the later powers coincide.
+
+        Args:
+            x: A numpy array of floats, representing the numbers to be powered.
+            n: An integer or a numpy array of integers broadcastable to x, representing the exponents of the powers.
+
+        Returns:
+            A numpy array of floats with the shape of x, representing the n-th powers.
+        """
+        x = numpy.asarray(x, dtype=float)
+        exponents = numpy.broadcast_to(numpy.asarray(n, dtype=int), x.shape).reshape(-1)
+        if (exponents < 1).any():
+            raise Exception("Introduce positive exponents.")
+
+        bases = x.reshape(-1)
+        powers = bases.copy()
+        active = numpy.flatnonzero(exponents > 1)
+        exponent = 1
+        while active.size > 0:
+            exponent += 1
+            next_powers = self.evaluate_operator_array(bases[active], powers[active])
+            stable = next_powers == powers[active]
+            powers[active] = next_powers
+            active = active[~stable & (exponents[active] > exponent)]
+        return powers.reshape(x.shape)
+
+    # region Grid evaluation
+    def evaluate_operator_grid(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in the cartesian product of two sets of points, with a single evaluation over arrays.
+
+        Args:
+            x: A numpy array of floats, representing the values of the first coordinate.
+            y: A numpy array of floats, representing the values of the second coordinate.
+
+        Returns:
+            A numpy array of shape (len(x), len(y)), whose entry (i, j) is the value of the operator in (x_i, y_j).
+        """
+        x = numpy.asarray(x, dtype=float).reshape(-1)
+        y = numpy.asarray(y, dtype=float).reshape(-1)
+        return self.evaluate_operator_array(x[:, None], y[None, :])
+    # endregion
+
     # region Plot of the operators
     def plot_operator(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50,
                       figure_size: Tuple[int, int] = (700, 700)):
@@ -77,11 +193,7 @@ class FuzzyUnitBinaryOperator:
         """
         x = numpy.linspace(0, 1, scatter_grid_x)
         y = numpy.linspace(0, 1, scatter_grid_y)
-        z = numpy.zeros((len(x), len(y)))
-
-        for x_idx, x_val in enumerate(x):
-            for y_idx, y_val in enumerate(y):
-                z[y_idx, x_idx] = self.evaluate_operator(x_val, y_val)
+        z = self.evaluate_operator_grid(x, y).T
 
         figure = go.Figure(
             data=[go.Surface(x=x, y=y, z=z, cmin=0, cmax=1, showscale=False)] + self.generate_unit_cube_contour(
@@ -114,11 +226,7 @@ class FuzzyUnitBinaryOperator:
         """
         x = numpy.linspace(0, 1, scatter_grid_x)
         y = numpy.linspace(0, 1, scatter_grid_y)
-        z = numpy.zeros((len(x), len(y)))
-
-        for x_idx, x_val in enumerate(x):
-            for y_idx, y_val in enumerate(y):
-                z[y_idx, x_idx] = self.evaluate_operator(x_val, y_val)
+        z = self.evaluate_operator_grid(x, y).T
 
         figure = go.Figure(
             data=[go.Contour(x=x, y=y, z=z, contours=dict(start=0, end=1, size=0.025, ))])
@@ -146,16 +254,8 @@ class FuzzyUnitBinaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-
-        x = numpy.linspace(0, 1, scatter_grid_x)
-        y = numpy.linspace(0, 1, scatter_grid_y)
-
-        for i in range(0, scatter_grid_x - 1):
-            for j in range(0, scatter_grid_y):
-                if not NumericComparator.compare_less_equal(self.evaluate_operator(x[i + 1], y[j]),
-                                                            self.evaluate_operator(x[i], y[j])):
-                    return False
-        return True
+        z = self.evaluate_operator_grid(numpy.linspace(0, 1, scatter_grid_x), numpy.linspace(0, 1, scatter_grid_y))
+        return self.comparator.all_less_equal(z[1:, :], z[:-1, :])
 
     def is_decreasing_y(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50) -> bool:
         """
@@ -165,16 +265,8 @@ class FuzzyUnitBinaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-
-        x = numpy.linspace(0, 1, scatter_grid_x)
-        y = numpy.linspace(0, 1, scatter_grid_y)
-
-        for i in range(0, scatter_grid_x):
-            for j in range(0, scatter_grid_y - 1):
-                if not NumericComparator.compare_less_equal(self.evaluate_operator(x[i], y[j + 1]),
-                                                            self.evaluate_operator(x[i], y[j])):
-                    return False
-        return True
+        z = self.evaluate_operator_grid(numpy.linspace(0, 1, scatter_grid_x), numpy.linspace(0, 1, scatter_grid_y))
+        return self.comparator.all_less_equal(z[:, 1:], z[:, :-1])
 
     def is_increasing_x(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50) -> bool:
         """
@@ -184,16 +276,8 @@ class FuzzyUnitBinaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-
-        x = numpy.linspace(0, 1, scatter_grid_x)
-        y = numpy.linspace(0, 1, scatter_grid_y)
-
-        for i in range(0, scatter_grid_x - 1):
-            for j in range(0, scatter_grid_y):
-                if not NumericComparator.compare_greater_equal(self.evaluate_operator(x[i + 1], y[j]),
-                                                               self.evaluate_operator(x[i], y[j])):
-                    return False
-        return True
+        z = self.evaluate_operator_grid(numpy.linspace(0, 1, scatter_grid_x), numpy.linspace(0, 1, scatter_grid_y))
+        return self.comparator.all_greater_equal(z[1:, :], z[:-1, :])
 
     def is_increasing_y(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50) -> bool:
         """
@@ -203,16 +287,8 @@ class FuzzyUnitBinaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-
-        x = numpy.linspace(0, 1, scatter_grid_x)
-        y = numpy.linspace(0, 1, scatter_grid_y)
-
-        for i in range(0, scatter_grid_x):
-            for j in range(0, scatter_grid_y - 1):
-                if not NumericComparator.compare_greater_equal(self.evaluate_operator(x[i], y[j + 1]),
-                                                               self.evaluate_operator(x[i], y[j])):
-                    return False
-        return True
+        z = self.evaluate_operator_grid(numpy.linspace(0, 1, scatter_grid_x), numpy.linspace(0, 1, scatter_grid_y))
+        return self.comparator.all_greater_equal(z[:, 1:], z[:, :-1])
 
     def is_commutative(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50) -> bool:
         """
@@ -222,78 +298,246 @@ class FuzzyUnitBinaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-
         x = numpy.linspace(0, 1, scatter_grid_x)
         y = numpy.linspace(0, 1, scatter_grid_y)
+        return self.comparator.all_equal(self.evaluate_operator_grid(x, y), self.evaluate_operator_grid(y, x).T)
 
-        for x_idx, x_val in enumerate(x):
-            for y_idx, y_val in enumerate(y):
-                if not NumericComparator.compare_equal(self.evaluate_operator(x_val, y_val),
-                                                       self.evaluate_operator(y_val, x_val)):
-                    return False
-        return True
-
-    def is_associative(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50, scatter_grid_z: int = 50) -> bool:
+    def is_associative(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50, scatter_grid_z: int = 50,
+                       max_chunk_elements: int = 2 ** 21) -> bool:
         """
-        Checks if the operator is commutative in a grid of a specified size.
+        Checks if the operator is associative in a grid of a specified size.
+
+        The inner values F(x,y) and F(y,z) are evaluated once as grids. The outer evaluations are done over blocks of
+        consecutive values of x, so that each block contains at most max_chunk_elements points; the check stops at the
+        first block which contains a violation.
 
         Args:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
             scatter_grid_z: An integer, representing the number of points to consider in the Z grid.
+            max_chunk_elements: An integer, representing the maximum number of points evaluated at once.
         """
-
         x = numpy.linspace(0, 1, scatter_grid_x)
         y = numpy.linspace(0, 1, scatter_grid_y)
         z = numpy.linspace(0, 1, scatter_grid_z)
 
-        for x_idx, x_val in enumerate(x):
-            for y_idx, y_val in enumerate(y):
-                for z_idx, z_val in enumerate(z):
-                    if not NumericComparator.compare_equal(
-                            self.evaluate_operator(x_val, self.evaluate_operator(y_val, z_val)),
-                            self.evaluate_operator(self.evaluate_operator(x_val, y_val), z_val)):
-                        return False
+        xy = self.evaluate_operator_grid(x, y)
+        yz = self.evaluate_operator_grid(y, z)
+
+        chunk_size = max(1, max_chunk_elements // (scatter_grid_y * scatter_grid_z))
+        for start in range(0, scatter_grid_x, chunk_size):
+            stop = min(start + chunk_size, scatter_grid_x)
+            left = self.evaluate_operator_array(x[start:stop, None, None], yz[None, :, :])
+            right = self.evaluate_operator_array(xy[start:stop, :, None], z[None, None, :])
+            if not self.comparator.all_equal(left, right):
+                return False
         return True
 
+    # region Adaptive verification
+    def verify_commutativity_adaptively(self, evaluation_budget: int = 200000, initial_divisions: int = 8,
+                                        max_depth: int = 12) -> AdaptiveCheckResult:
+        """
+        Checks if the operator is commutative by adaptive refinement of a coarse grid, which concentrates the
+        evaluations around suspected violations and discontinuities.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            initial_divisions: An integer, representing the number of divisions of each axis in the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample (x, y) if there is one.
+        """
+        def point_function(points: numpy.ndarray):
+            values = self.evaluate_operator_array(points[:, 0], points[:, 1])
+            swapped_values = self.evaluate_operator_array(points[:, 1], points[:, 0])
+            return self.comparator.excess_equal(values, swapped_values), values
+
+        return AdaptivePropertyChecker(dimension=2,
+                                       cell_evaluator=AdaptivePropertyChecker.point_cell_evaluator(
+                                           point_function, 2, evaluations_per_point=2),
+                                       initial_divisions=initial_divisions, evaluation_budget=evaluation_budget,
+                                       max_depth=max_depth).check()
+
+    def verify_associativity_adaptively(self, evaluation_budget: int = 720000, initial_divisions: int = 6,
+                                        max_depth: int = 12) -> AdaptiveCheckResult:
+        """
+        Checks if the operator is associative by adaptive refinement of a coarse grid, which concentrates the
+        evaluations around suspected violations and discontinuities.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            initial_divisions: An integer, representing the number of divisions of each axis in the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample (x, y, z) if there is one.
+        """
+        def point_function(points: numpy.ndarray):
+            x, y, z = points[:, 0], points[:, 1], points[:, 2]
+            left_values = self.evaluate_operator_array(x, self.evaluate_operator_array(y, z))
+            right_values = self.evaluate_operator_array(self.evaluate_operator_array(x, y), z)
+            return self.comparator.excess_equal(left_values, right_values), left_values
+
+        return AdaptivePropertyChecker(dimension=3,
+                                       cell_evaluator=AdaptivePropertyChecker.point_cell_evaluator(
+                                           point_function, 3, evaluations_per_point=4),
+                                       initial_divisions=initial_divisions, evaluation_budget=evaluation_budget,
+                                       max_depth=max_depth).check()
+
+    def verify_monotonicity_adaptively(self, increasing_x: bool = True, increasing_y: bool = True,
+                                       evaluation_budget: int = 80000, initial_divisions: int = 8,
+                                       max_depth: int = 12) -> AdaptiveCheckResult:
+        """
+        Checks if the operator is monotone with respect to each variable by adaptive refinement of a coarse grid. Each
+        cell [x1,x2]x[y1,y2] is checked along its four edges.
+
+        Args:
+            increasing_x: A boolean, indicating if the operator has to be increasing (True) or decreasing (False) with
+                          respect to the 1st variable.
+            increasing_y: A boolean, indicating if the operator has to be increasing (True) or decreasing (False) with
+                          respect to the 2nd variable.
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            initial_divisions: An integer, representing the number of divisions of each axis in the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample as the cell (x1, y1, x2, y2) if
+            there is one.
+        """
+        sign_x = 1 if increasing_x else -1
+        sign_y = 1 if increasing_y else -1
+
+        def cell_evaluator(lower: numpy.ndarray, size: numpy.ndarray):
+            x1, y1 = lower[:, 0], lower[:, 1]
+            x2, y2 = x1 + size, y1 + size
+            f11 = self.evaluate_operator_array(x1, y1)
+            f12 = self.evaluate_operator_array(x1, y2)
+            f21 = self.evaluate_operator_array(x2, y1)
+            f22 = self.evaluate_operator_array(x2, y2)
+
+            residual = numpy.max([self.comparator.excess_less_equal(sign_x * f11, sign_x * f21),
+                                  self.comparator.excess_less_equal(sign_x * f12, sign_x * f22),
+                                  self.comparator.excess_less_equal(sign_y * f11, sign_y * f12),
+                                  self.comparator.excess_less_equal(sign_y * f21, sign_y * f22)], axis=0)
+            corner_values = numpy.stack([f11, f12, f21, f22])
+            variation = corner_values.max(axis=0) - corner_values.min(axis=0)
+            return residual, variation, numpy.stack([x1, y1, x2, y2], axis=1), 4 * x1.size
+
+        return AdaptivePropertyChecker(dimension=2, cell_evaluator=cell_evaluator,
+                                       initial_divisions=initial_divisions, evaluation_budget=evaluation_budget,
+                                       max_depth=max_depth).check()
+    # endregion
+
     # region Discretization
-    def get_upper_discretized_operator(self, n: int) -> DiscreteBinaryOperator:
+    def get_upper_discretized_operator(self, n: int, check_properties_in_load: bool = True) -> DiscreteBinaryOperator:
         """
         Computes the upper discretization of a binary operator, defined as Ceil(n*F(x/n,y/n)), and represents it as a
         FuzzyDiscreteBinaryOperator object.
 
         Args:
             n: An integer, representing the dimension of the finite chain where the discrete operator is defined.
+            check_properties_in_load: A boolean, indicating if the properties of the discrete operator have to be
+                                      checked when it is loaded.
 
         Returns:
             A FuzzyDiscreteBinaryOperator object, representing the discrete operator.
         """
-        operator_matrix = numpy.zeros((n + 1, n + 1), dtype=int)
-        for x in range(0, n + 1):
-            for y in range(0, n + 1):
-                if x == 2 and y == 1:
-                    a = 2
-                operator_matrix[y, x] = ceil(round(n * self.evaluate_operator(x / n, y / n), 5))
-
-        return DiscreteBinaryOperator(n=n, operator_matrix=operator_matrix)
+        _, upper_matrix = self.get_discretized_matrices(n_values=[n])[n]
+        return self.generate_discrete_operator(n=n, operator_matrix=upper_matrix,
+                                               check_properties_in_load=check_properties_in_load)
 
-    def get_lower_discretized_operator(self, n: int) -> DiscreteBinaryOperator:
+    def get_lower_discretized_operator(self, n: int, check_properties_in_load: bool = True) -> DiscreteBinaryOperator:
         """
-        Computes the upper discretization of a binary operator, defined as Ceil(n*F(x/n,y/n)), and represents it as a
+        Computes the lower discretization of a binary operator, defined as Floor(n*F(x/n,y/n)), and represents it as a
         FuzzyDiscreteBinaryOperator object.
 
         Args:
             n: An integer, representing the dimension of the finite chain where the discrete operator is defined.
+            check_properties_in_load: A boolean, indicating if the properties of the discrete operator have to be
+                                      checked when it is loaded.
 
         Returns:
             A FuzzyDiscreteBinaryOperator object, representing the discrete operator.
         """
-        operator_matrix = numpy.zeros((n + 1, n + 1), dtype=int)
-        for x in range(0, n + 1):
-            for y in range(0, n + 1):
-                operator_matrix[y, x] = floor(round(n * self.evaluate_operator(x / n, y / n), 5))
+        lower_matrix, _ = self.get_discretized_matrices(n_values=[n])[n]
+        return self.generate_discrete_operator(n=n, operator_matrix=lower_matrix,
+                                               check_properties_in_load=check_properties_in_load)
+
+    def get_discretized_operators(self, n_values: List[int],
+                                  check_properties_in_load: bool = True) -> Dict[int, Tuple[DiscreteBinaryOperator,
+                                                                                            DiscreteBinaryOperator]]:
+        """
+        Computes the lower and the upper discretizations of the operator for several dimensions of the finite chain.
+
+        Args:
+            n_values: A list of integers, representing the dimensions of the finite chains.
+            check_properties_in_load: A boolean, indicating if the properties of the discrete operators have to be
+                                      checked when they are loaded. Disabling it avoids the cost of the checks.
+
+        Returns:
+            A dictionary, whose keys are the dimensions and whose values are tuples containing the lower and the upper
+            discretizations, in this order.
+        """
+        discretized_operators = {}
+        for n, (lower_matrix, upper_matrix) in self.get_discretized_matrices(n_values=n_values).items():
+            discretized_operators[n] = (
+                self.generate_discrete_operator(n=n, operator_matrix=lower_matrix,
+                                                check_properties_in_load=check_properties_in_load),
+                self.generate_discrete_operator(n=n, operator_matrix=upper_matrix,
+                                                check_properties_in_load=check_properties_in_load))
+        return discretized_operators
+
+    def get_discretized_matrices(self, n_values: List[int]) -> Dict[int, Tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Computes the matrix expressions of the lower and the upper discretizations of the operator for several
+        dimensions of the finite chain, defined as Floor(n*F(x/n,y/n)) and Ceil(n*F(x/n,y/n)) respectively.
+
+        The operator is evaluated once in each grid {0, 1/n, ..., 1}^2 as an array. Since the grid of n is contained
+        in the grid of m whenever n divides m, the grids are evaluated from the finest to the coarsest one, and the
+        values of a grid are sliced from a finer one whenever it is possible.
+
+        Args:
+            n_values: A list of integers, representing the dimensions of the finite chains.
+
+        Returns:
+            A dictionary, whose keys are the dimensions and whose values are tuples containing the matrix expressions
+            of the lower and the upper discretizations, in this order.
+        """
+        evaluated_grids = {}
+        for n in sorted(set(n_values), reverse=True):
+            finer_n = next((m for m in evaluated_grids if m % n == 0), None)
+            if finer_n is not None:
+                step = finer_n // n
+                evaluated_grids[n] = evaluated_grids[finer_n][::step, ::step]
+            else:
+                grid = numpy.arange(0, n + 1) / n
+                x, y = numpy.meshgrid(grid, grid)
+                evaluated_grids[n] = self.evaluate_operator_array(x, y)
+
+        discretized_matrices = {}
+        for n in n_values:
+            scaled_values = numpy.round(n * evaluated_grids[n], 5)
+            discretized_matrices[n] = (numpy.floor(scaled_values).astype(int), numpy.ceil(scaled_values).astype(int))
+        return discretized_matrices
+
+    def generate_discrete_operator(self, n: int, operator_matrix: numpy.ndarray,
+                                   check_properties_in_load: bool = True) -> DiscreteBinaryOperator:
+        """
+        Builds the discrete operator which corresponds to a discretization of the operator. The subclasses override
+        this method to return the discrete counterpart of their family of operators.
 
-        return DiscreteBinaryOperator(n=n, operator_matrix=operator_matrix)
+        Args:
+            n: An integer, representing the dimension of the finite chain where the discrete operator is defined.
+            operator_matrix: A numpy array, representing the matrix expression of the discrete operator.
+            check_properties_in_load: A boolean, indicating if the properties of the discrete operator have to be
+                                      checked when it is loaded.
+
+        Returns:
+            A FuzzyDiscreteBinaryOperator object, representing the discrete operator.
+        """
+        return DiscreteBinaryOperator(n=n, operator_matrix=operator_matrix,
+                                      check_properties_in_load=check_properties_in_load)
 
     # endregion
 
@@ -1,3 +1,4 @@
+import numpy
 from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
 import warnings
 
@@ -10,7 +11,9 @@ from typing import Callable, Tuple
 class FuzzyUnitAggregationBinaryOperator(FuzzyUnitBinaryOperator):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a binary aggregation function A: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -20,10 +23,16 @@ class FuzzyUnitAggregationBinaryOperator(FuzzyUnitBinaryOperator):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
 
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitAggregationBinaryOperator, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitAggregationBinaryOperator, self).__init__(operator_expression, check_properties_in_load,
+                                                                 operator_array_expression=operator_array_expression,
+                                                                 comparator=comparator)
 
         if check_properties_in_load and not self.is_fuzzy_aggregation():
             warnings.warn("With the input arguments, the generated operator is not a fuzzy aggregation function since "
@@ -41,7 +50,7 @@ class FuzzyUnitAggregationBinaryOperator(FuzzyUnitBinaryOperator):
         Checks if the operator verifies the boundary conditions of a fuzzy aggregation function; that is, if A(0,0)=0 and
         A(1,1)=1.
         """
-        if NumericComparator.compare_equal(self.evaluate_operator(0, 0),0) and NumericComparator.compare_equal(self.evaluate_operator(1, 1),1):
+        if self.comparator.equal(self.evaluate_operator(0, 0),0) and self.comparator.equal(self.evaluate_operator(1, 1),1):
             return True
         return False
 
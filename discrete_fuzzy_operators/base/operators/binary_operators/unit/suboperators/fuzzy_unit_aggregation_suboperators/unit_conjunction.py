@@ -1,3 +1,4 @@
+import numpy
 import warnings
 from typing import Callable
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_aggregation_operator import FuzzyUnitAggregationBinaryOperator
@@ -5,7 +6,9 @@ from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import
 class FuzzyUnitConjunction(FuzzyUnitAggregationBinaryOperator):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a fuzzy conjunction C: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -15,9 +18,15 @@ class FuzzyUnitConjunction(FuzzyUnitAggregationBinaryOperator):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitConjunction, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitConjunction, self).__init__(operator_expression, check_properties_in_load,
+                                                   operator_array_expression=operator_array_expression,
+                                                   comparator=comparator)
 
         if check_properties_in_load and not self.is_fuzzy_conjunction():
             warnings.warn("With the input arguments, the generated operator is not a fuzzy conjunction since "
@@ -34,6 +43,6 @@ class FuzzyUnitConjunction(FuzzyUnitAggregationBinaryOperator):
         """
         Checks if the operator verifies the boundary conditions of a fuzzy conjunction; that is, if C(1,0)=C(0,1)=0.
         """
-        if NumericComparator.compare_equal(self.evaluate_operator(1, 0),0) and NumericComparator.compare_equal(self.evaluate_operator(0, 1),0):
+        if self.comparator.equal(self.evaluate_operator(1, 0),0) and self.comparator.equal(self.evaluate_operator(0, 1),0):
             return True
         return False
\ No newline at end of file
@@ -12,7 +12,9 @@ class FuzzyUnitContArqTnorm(FuzzyUnitTnorm):
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
                  t: Callable[[float], float] = None,
                  t_inv: Callable[[float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a continuous, arquimedean fuzzy tnorm T: [0,1]x[0,1] -> [0,1] from its analytical
         expression or its additive generator and its inverse.
@@ -24,6 +26,10 @@ class FuzzyUnitContArqTnorm(FuzzyUnitTnorm):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional, and only used when the analytical expression is provided.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
 
         if (operator_expression is None) and (t is None or t_inv is None):
@@ -31,12 +37,22 @@ class FuzzyUnitContArqTnorm(FuzzyUnitTnorm):
                             "or its additive generator and the corresponding inverse.")
 
         self.check_properties_in_load = check_properties_in_load
+        self.t = t
+        self.t_inv = t_inv
+        self.generator_tables = None
+        self.generator_supports_arrays = None
+        self.tabulation_error_bound = None
+        self.tabulation_error_estimate = None
         if operator_expression is not None:
             super(FuzzyUnitContArqTnorm, self).__init__(operator_expression=operator_expression,
-                                                        check_properties_in_load=check_properties_in_load)
+                                                        check_properties_in_load=check_properties_in_load,
+                                                        operator_array_expression=operator_array_expression,
+                                                        comparator=comparator)
         if t is not None and t_inv is not None:
             super(FuzzyUnitContArqTnorm, self).__init__(operator_expression=lambda x, y: t_inv(min(t(0),t(x)+t(y))),
-                                                        check_properties_in_load=check_properties_in_load)
+                                                        check_properties_in_load=check_properties_in_load,
+                                                        operator_array_expression=self.__generator_array_expression,
+                                                        comparator=comparator)
 
         if check_properties_in_load and not self.is_tnorm():
             warnings.warn("With the input arguments, the generated operator is not a tnorm since "
@@ -63,8 +79,248 @@ class FuzzyUnitContArqTnorm(FuzzyUnitTnorm):
         """
 
         x = numpy.linspace(0, 1, scatter_grid_x)
+        return self.comparator.all_equal(self.evaluate_operator_array(x, numpy.full_like(x, 1)), x)
 
-        for x_idx, x_val in enumerate(x):
-            if not NumericComparator.compare_equal(self.evaluate_operator(x_val, 1), x_val):
-                return False
-        return True
+    # region Tabulation of the additive generator
+    def tabulate_generator(self, grid: numpy.ndarray = None, grid_size: int = 4097,
+                           validation_size: int = 129) -> float:
+        """
+        Tabulates the additive generator t in a monotone grid of [0,1], so that the evaluations over arrays can be
+        computed by linear interpolation instead of calling t and t_inv. The table of t_inv is made of the same pairs
+        (t(x_i), x_i) in reverse order, so it is exact in the nodes and its nodes adapt to the shape of t. When the grid
+        is uniform, the interpolation of t locates the nodes arithmetically instead of by binary search.
+
+        If t(0) is infinite, it is extrapolated linearly from the first two positive nodes, so that the values lower
+        than the first positive node are approximated by zero; grids which are finer near 0 reduce this error.
+
+        The interpolated evaluation is only used by evaluate_operator_array when t or t_inv cannot be evaluated over
+        arrays, since otherwise the exact evaluation is faster. It is always available through
+        evaluate_operator_array_tabulated, and the exact one through evaluate_operator_array_exact.
+
+        Since t is monotone, its interpolation in a cell [x_a, x_a+1] lies between t(x_a+1) and t(x_a), as t does.
+        Hence, for x and y in the cells a and b, both the exact and the tabulated sums t(x)+t(y) lie in
+        [t(x_a+1)+t(x_b+1), t(x_a)+t(x_b)], and both values of the tnorm lie between the last node whose value of t is
+        above that interval and the first one below it. The largest distance between these nodes over all the pairs
+        of cells is a guaranteed bound of the error, which is stored in tabulation_error_bound; it also holds when
+        t(0) is infinite and has been extrapolated. Besides, the largest error found in a uniform validation grid is
+        stored in tabulation_error_estimate.
+
+        Args:
+            grid: A numpy array of floats, representing the increasing nodes of the grid of t, which must start at 0
+                  and end at 1. If it is not provided, a uniform grid of grid_size nodes is used.
+            grid_size: An integer, representing the number of nodes of the uniform grid.
+            validation_size: An integer, representing the number of points of each axis of the validation grid.
+
+        Returns:
+            A float, representing the guaranteed bound of the absolute error of the tabulated evaluation.
+        """
+        if not self.has_additive_generator():
+            raise Exception("The additive generator and its inverse are required to tabulate the tnorm.")
+
+        if grid is None:
+            grid = numpy.linspace(0, 1, grid_size)
+        grid = numpy.asarray(grid, dtype=float)
+        if grid.ndim != 1 or grid.size < 3 or grid[0] != 0 or grid[-1] != 1 or (numpy.diff(grid) <= 0).any():
+            raise Exception("The grid must be an increasing array of at least three nodes from 0 to 1.")
+        uniform_grid = numpy.allclose(grid, numpy.linspace(0, 1, grid.size), rtol=0, atol=1e-12)
+
+        t_table = self.__evaluate_generator(self.t, grid)
+        if not numpy.isfinite(t_table[0]):
+            t_table[0] = t_table[1] + (t_table[1] - t_table[2]) * grid[1] / (grid[2] - grid[1])
+        if not numpy.isfinite(t_table).all() or (numpy.diff(t_table) >= 0).any():
+            raise Exception("The additive generator must be finite and strictly decreasing in the positive nodes of "
+                            "the grid.")
+
+        self.generator_tables = (grid, t_table, uniform_grid)
+        self.generator_supports_arrays = self.__supports_arrays(self.t, grid[1:]) and \
+            self.__supports_arrays(self.t_inv, t_table)
+        self.tabulation_error_bound = self.__compute_tabulation_error_bound(grid, t_table)
+
+        validation_points = numpy.linspace(0, 1, validation_size)
+        x, y = numpy.meshgrid(validation_points, validation_points)
+        self.tabulation_error_estimate = float(numpy.abs(self.evaluate_operator_array_tabulated(x, y) -
+                                                         self.evaluate_operator_array_exact(x, y)).max())
+        return self.tabulation_error_bound
+
+    def clear_generator_tabulation(self):
+        """
+        Discards the tables of the additive generator, so that the evaluations over arrays are exact again.
+        """
+        self.generator_tables = None
+        self.generator_supports_arrays = None
+        self.tabulation_error_bound = None
+        self.tabulation_error_estimate = None
+
+    def evaluate_operator_array(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in several points at once. If the additive generator has been tabulated and it cannot
+        be evaluated over arrays, the values are interpolated from the tables; otherwise, they are computed exactly.
+
+        Args:
+            x: A numpy array of floats, representing the first coordinates of the points.
+            y: A numpy array of floats, representing the second coordinates of the points.
+
+        Returns:
+            A numpy array of floats, representing the value of the function in the given points.
+        """
+        if self.generator_tables is None or self.generator_supports_arrays:
+            return self.evaluate_operator_array_exact(x, y)
+        return self.evaluate_operator_array_tabulated(x, y)
+
+    def evaluate_operator_array_tabulated(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in several points at once by linear interpolation of the tables of the additive
+        generator. The error is at most tabulation_error_bound.
+
+        Args:
+            x: A numpy array of floats, representing the first coordinates of the points.
+            y: A numpy array of floats, representing the second coordinates of the points.
+
+        Returns:
+            A numpy array of floats, representing the value of the function in the given points.
+        """
+        if self.generator_tables is None:
+            raise Exception("The additive generator must be tabulated before evaluating the tabulated tnorm.")
+
+        x, y = numpy.broadcast_arrays(numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float))
+        if not ((0 <= x).all() and (x <= 1).all() and (0 <= y).all() and (y <= 1).all()):
+            raise Exception("To evaluate a binary operator defined in the unit interval, the arguments must be between "
+                            "0 and 1.")
+
+        grid, t_table, uniform_grid = self.generator_tables
+        if uniform_grid:
+            generator_sum = self.__interpolate_uniform(x, t_table) + self.__interpolate_uniform(y, t_table)
+        else:
+            generator_sum = numpy.interp(x, grid, t_table) + numpy.interp(y, grid, t_table)
+        return numpy.interp(numpy.minimum(t_table[0], generator_sum), t_table[::-1], grid[::-1])
+
+    def evaluate_operator_array_exact(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in several points at once with the exact expression, even if the additive generator
+        has been tabulated.
+
+        Args:
+            x: A numpy array of floats, representing the first coordinates of the points.
+            y: A numpy array of floats, representing the second coordinates of the points.
+
+        Returns:
+            A numpy array of floats, representing the value of the function in the given points.
+        """
+        return super(FuzzyUnitContArqTnorm, self).evaluate_operator_array(x, y)
+
+    @staticmethod
+    def __compute_tabulation_error_bound(grid: numpy.ndarray, t_table: numpy.ndarray, block_size: int = 256) -> float:
+        """
+        Computes a guaranteed bound of the error of the tabulated evaluation, as described in tabulate_generator. The
+        pairs of cells are traversed in blocks of rows to bound the memory.
+        """
+        increasing_table = t_table[::-1]
+        size = t_table.size
+        cells = numpy.arange(0, size - 1)
+        bound = 0.0
+        for start in range(0, size - 1, block_size):
+            a = cells[start:start + block_size, None]
+            # The nodes enclosing the sums are the last one whose value of t is at least t_a + t_b and the first one
+            # whose value is at most t_a+1 + t_b+1, which are found in the increasing table of t_inv.
+            lower_nodes = numpy.maximum(
+                size - numpy.searchsorted(increasing_table, t_table[a] + t_table[cells], side="left") - 1, 0)
+            upper_nodes = numpy.minimum(
+                size - numpy.searchsorted(increasing_table, t_table[a + 1] + t_table[cells + 1], side="right"),
+                size - 1)
+            bound = max(bound, float((grid[upper_nodes] - grid[lower_nodes]).max()))
+        return bound
+
+    @staticmethod
+    def __supports_arrays(function: Callable[[float], float], values: numpy.ndarray) -> bool:
+        """
+        Checks if the additive generator or its inverse can be evaluated over an array with a single call.
+        """
+        try:
+            with numpy.errstate(divide="ignore", over="ignore"):
+                return numpy.asarray(function(values), dtype=float).shape == values.shape
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def __interpolate_uniform(values: numpy.ndarray, table: numpy.ndarray) -> numpy.ndarray:
+        """
+        Interpolates linearly a table of values given in a uniform grid of [0, 1].
+        """
+        position = values * (table.size - 1)
+        index = numpy.minimum(position.astype(int), table.size - 2)
+        weight = position - index
+        return table[index] + weight * (table[index + 1] - table[index])
+
+    def __generator_array_expression(self, x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Exact expression of the tnorm over arrays from its additive generator.
+        """
+        generator_sum = self.__evaluate_generator(self.t, x) + self.__evaluate_generator(self.t, y)
+        return self.__evaluate_generator(self.t_inv, numpy.minimum(self.t(0), generator_sum))
+    # endregion
+
+    # region Powers
+    def has_additive_generator(self) -> bool:
+        """
+        Checks if the additive generator of the tnorm and its inverse are available.
+        """
+        return self.t is not None and self.t_inv is not None
+
+    def evaluate_operator_power(self, x: float, n: int) -> float:
+        """
+        Evaluates the n-th power of the tnorm for the given number. If the additive generator is available, the
+        closed form x^n = t_inv(min(t(0), n*t(x))) is used.
+
+        Args:
+            x: A float, representing the number to be powered.
+            n: A int, representing the exponent of the power.
+
+        Returns:
+            A float, representing the value of the n-th power of x.
+        """
+        if not self.has_additive_generator():
+            return super(FuzzyUnitContArqTnorm, self).evaluate_operator_power(x, n)
+
+        if not n > 1:
+            raise Exception("Introduce an exponent bigger than 1.")
+        return self.t_inv(min(self.t(0), n*self.t(x)))
+
+    def evaluate_operator_power_array(self, x: numpy.ndarray, n) -> numpy.ndarray:
+        """
+        Evaluates the n-th powers of the tnorm for several numbers at once. If the additive generator is available,
+        the closed form x^n = t_inv(min(t(0), n*t(x))) is used, so that the cost does not depend on the exponents.
+
+        Args:
+            x: A numpy array of floats, representing the numbers to be powered.
+            n: An integer or a numpy array of integers broadcastable to x, representing the exponents of the powers.
+
+        Returns:
+            A numpy array of floats with the shape of x, representing the n-th powers.
+        """
+        if not self.has_additive_generator():
+            return super(FuzzyUnitContArqTnorm, self).evaluate_operator_power_array(x, n)
+
+        x = numpy.asarray(x, dtype=float)
+        exponents = numpy.broadcast_to(numpy.asarray(n, dtype=int), x.shape)
+        if (exponents < 1).any():
+            raise Exception("Introduce positive exponents.")
+
+        generator_values = self.__evaluate_generator(self.t, x)
+        return self.__evaluate_generator(self.t_inv, numpy.minimum(self.t(0), exponents*generator_values))
+
+    @staticmethod
+    def __evaluate_generator(function: Callable[[float], float], values: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the additive generator or its inverse over an array, calling the function once with the whole array
+        if it supports numpy arrays and point by point otherwise. As in evaluate_operator_array, only the TypeError and
+        ValueError raised by scalar-only functions lead to the evaluation point by point.
+        """
+        try:
+            with numpy.errstate(divide="ignore", over="ignore"):
+                result = numpy.asarray(function(values), dtype=float)
+            if result.shape == values.shape:
+                return result
+        except (TypeError, ValueError):
+            pass
+        return numpy.vectorize(function, otypes=[float])(values)
+    # endregion
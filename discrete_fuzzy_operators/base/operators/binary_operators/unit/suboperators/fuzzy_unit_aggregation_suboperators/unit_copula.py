@@ -1,6 +1,8 @@
 import warnings
 import numpy
 from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
+from discrete_fuzzy_operators.base.property_verification.adaptive_property_checker import AdaptiveCheckResult, \
+    AdaptivePropertyChecker
 from typing import Callable
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_aggregation_suboperators.unit_conjunction import \
     FuzzyUnitConjunction
@@ -9,7 +11,9 @@ from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.
 class FuzzyUnitCopula(FuzzyUnitConjunction):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a copula C: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -19,9 +23,15 @@ class FuzzyUnitCopula(FuzzyUnitConjunction):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitCopula, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitCopula, self).__init__(operator_expression, check_properties_in_load,
+                                              operator_array_expression=operator_array_expression,
+                                              comparator=comparator)
 
         if check_properties_in_load and not self.is_copula():
             warnings.warn("With the input arguments, the generated operator is not a copula since it does not fulfill "
@@ -41,26 +51,77 @@ class FuzzyUnitCopula(FuzzyUnitConjunction):
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
             scatter_grid_y: An integer, representing the number of points to consider in the Y grid.
         """
-        x1 = numpy.linspace(0, 1, scatter_grid_x)
-        y1 = numpy.linspace(0, 1, scatter_grid_y)
-        x2 = numpy.linspace(0, 1, scatter_grid_x)
-        y2 = numpy.linspace(0, 1, scatter_grid_y)
+        x = numpy.linspace(0, 1, scatter_grid_x)
+        y = numpy.linspace(0, 1, scatter_grid_y)
+        z = self.evaluate_operator_grid(x, y)
 
-        for x1_idx, x1_val in enumerate(x1):
-            if not NumericComparator.compare_equal(self.evaluate_operator(x1_val, 1), x1_val):
-                return False
-                print("Cond2")
-            for y1_idx, y1_val in enumerate(y1):
-                if not NumericComparator.compare_equal(self.evaluate_operator(x1_val, 0), self.evaluate_operator(0, y1_val)):
-                    print("Cond1")
-                    return False
-                if not NumericComparator.compare_equal(self.evaluate_operator(1, y1_val), y1_val):
-                    print("Cond3")
-                    return False
-                for x2_idx, x2_val in enumerate(x2):
-                    for y2_idx, y2_val in enumerate(y2):
-                        if NumericComparator.compare_less_equal(x1_val, x2_val) and NumericComparator.compare_less_equal(y1_val, y2_val):
-                            if not NumericComparator.compare_greater_equal(self.evaluate_operator(x2_val,y2_val)-self.evaluate_operator(x2_val,y1_val)-self.evaluate_operator(x1_val,y2_val)+self.evaluate_operator(x1_val,y1_val),0):
-                                return False
+        if not self.comparator.all_equal(self.evaluate_operator_array(x, numpy.ones_like(x)), x):
+            return False
+        if not self.comparator.all_equal(self.evaluate_operator_array(x[:, None], numpy.zeros((1, len(y)))),
+                                         self.evaluate_operator_array(numpy.zeros((len(x), 1)), y[None, :])):
+            return False
+        if not self.comparator.all_equal(self.evaluate_operator_array(numpy.ones_like(y), y), y):
+            return False
 
+        # For each x1, volumes[x2, y1, y2] = C(x2,y2) - C(x2,y1) - C(x1,y2) + C(x1,y1) for all x2 >= x1; only the
+        # entries with y1 <= y2 are checked.
+        y_pairs = numpy.triu(numpy.ones((len(y), len(y)), dtype=bool))
+        for x1_idx in range(0, len(x)):
+            upper_rows = z[x1_idx:, :]
+            lower_row = z[x1_idx, :]
+            volumes = (upper_rows[:, None, :] - upper_rows[:, :, None]) - (lower_row[None, None, :] -
+                                                                           lower_row[None, :, None])
+            if not self.comparator.all_greater_equal(volumes[:, y_pairs], 0):
+                return False
         return True
+
+    def verify_copula_adaptively(self, evaluation_budget: int = 80000, initial_divisions: int = 8,
+                                 max_depth: int = 12) -> AdaptiveCheckResult:
+        """
+        Checks if the operator is a copula by adaptive refinement of a coarse grid. First, the boundary conditions
+        C(x,0)=C(0,x)=0 and C(x,1)=C(1,x)=x are verified in [0,1]; then, the 2-increasing property is verified in the
+        cells [x1,x2]x[y1,y2] of the refinement.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator in each
+                               check.
+            initial_divisions: An integer, representing the number of divisions of each axis in the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample if there is one; that is, the
+            point (x,) for the boundary conditions or the cell (x1, y1, x2, y2) for the 2-increasing property.
+        """
+        def boundary_point_function(points: numpy.ndarray):
+            x = points[:, 0]
+            zeros, ones = numpy.zeros_like(x), numpy.ones_like(x)
+            residual = numpy.max([self.comparator.excess_equal(self.evaluate_operator_array(x, zeros), zeros),
+                                  self.comparator.excess_equal(self.evaluate_operator_array(zeros, x), zeros),
+                                  self.comparator.excess_equal(self.evaluate_operator_array(x, ones), x),
+                                  self.comparator.excess_equal(self.evaluate_operator_array(ones, x), x)],
+                                 axis=0)
+            return residual, x
+
+        def rectangle_cell_evaluator(lower: numpy.ndarray, size: numpy.ndarray):
+            x1, y1 = lower[:, 0], lower[:, 1]
+            x2, y2 = x1 + size, y1 + size
+            c11 = self.evaluate_operator_array(x1, y1)
+            c12 = self.evaluate_operator_array(x1, y2)
+            c21 = self.evaluate_operator_array(x2, y1)
+            c22 = self.evaluate_operator_array(x2, y2)
+
+            volume = c22 - c21 - c12 + c11
+            residual = self.comparator.excess_less_equal(-volume, numpy.zeros_like(volume))
+            corner_values = numpy.stack([c11, c12, c21, c22])
+            variation = corner_values.max(axis=0) - corner_values.min(axis=0)
+            return residual, variation, numpy.stack([x1, y1, x2, y2], axis=1), 4 * x1.size
+
+        return AdaptivePropertyChecker.check_all([
+            lambda: AdaptivePropertyChecker(dimension=1,
+                                            cell_evaluator=AdaptivePropertyChecker.point_cell_evaluator(
+                                                boundary_point_function, 1, evaluations_per_point=4),
+                                            initial_divisions=2 * initial_divisions,
+                                            evaluation_budget=evaluation_budget, max_depth=max_depth).check(),
+            lambda: AdaptivePropertyChecker(dimension=2, cell_evaluator=rectangle_cell_evaluator,
+                                            initial_divisions=initial_divisions,
+                                            evaluation_budget=evaluation_budget, max_depth=max_depth).check()])
@@ -9,7 +9,9 @@ from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.
 class FuzzyUnitTconorm(FuzzyUnitDisjunction):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a fuzzy tconorm S: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -19,9 +21,15 @@ class FuzzyUnitTconorm(FuzzyUnitDisjunction):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitTconorm, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitTconorm, self).__init__(operator_expression, check_properties_in_load,
+                                               operator_array_expression=operator_array_expression,
+                                               comparator=comparator)
 
         if check_properties_in_load and not self.is_tnorm():
             warnings.warn("With the input arguments, the generated operator is not a tconorm since "
@@ -48,7 +56,4 @@ class FuzzyUnitTconorm(FuzzyUnitDisjunction):
         """
 
         x = numpy.linspace(0, 1, scatter_grid_x)
-        for x_idx, x_val in enumerate(x):
-            if not NumericComparator.compare_equal(self.evaluate_operator(x_val, 0), x_val):
-                return False
-        return True
+        return self.comparator.all_equal(self.evaluate_operator_array(x, numpy.full_like(x, 0)), x)
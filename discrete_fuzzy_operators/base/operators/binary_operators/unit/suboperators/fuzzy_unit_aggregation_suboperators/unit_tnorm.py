@@ -5,12 +5,16 @@ from typing import Callable
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_aggregation_suboperators.unit_conjunction import \
     FuzzyUnitConjunction
 from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
+from discrete_fuzzy_operators.base.property_verification.adaptive_property_checker import AdaptiveCheckResult, \
+    AdaptivePropertyChecker
 
 
 class FuzzyUnitTnorm(FuzzyUnitConjunction):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a fuzzy tnorm T: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -20,9 +24,15 @@ class FuzzyUnitTnorm(FuzzyUnitConjunction):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitTnorm, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitTnorm, self).__init__(operator_expression, check_properties_in_load,
+                                             operator_array_expression=operator_array_expression,
+                                             comparator=comparator)
 
         if check_properties_in_load and not self.is_tnorm():
             warnings.warn("With the input arguments, the generated operator is not a tnorm since "
@@ -49,15 +59,61 @@ class FuzzyUnitTnorm(FuzzyUnitConjunction):
         """
 
         x = numpy.linspace(0, 1, scatter_grid_x)
+        return self.comparator.all_equal(self.evaluate_operator_array(x, numpy.full_like(x, 1)), x)
 
-        for x_idx, x_val in enumerate(x):
-            if not NumericComparator.compare_equal(self.evaluate_operator(x_val, 1), x_val):
-                return False
-        return True
+    def verify_tnorm_adaptively(self, evaluation_budget: int = None) -> AdaptiveCheckResult:
+        """
+        Checks if the operator is a tnorm by adaptive refinement; that is, the monotonicity, the commutativity, the
+        associativity and the boundary conditions are verified in this order, each one with its own evaluation budget.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator in each
+                               check. If it is not provided, each check uses its own default budget, which depends on
+                               the number of evaluations needed by a cell.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the first counterexample located, if any.
+        """
+        budget = {} if evaluation_budget is None else {"evaluation_budget": evaluation_budget}
+        return AdaptivePropertyChecker.check_all([
+            lambda: self.verify_monotonicity_adaptively(**budget),
+            lambda: self.verify_commutativity_adaptively(**budget),
+            lambda: self.verify_associativity_adaptively(**budget),
+            lambda: self.verify_boundary_conditions_adaptively(**budget)])
+
+    def verify_boundary_conditions_adaptively(self, evaluation_budget: int = 6000, initial_divisions: int = 16,
+                                              max_depth: int = 20) -> AdaptiveCheckResult:
+        """
+        Checks if the operator verifies the boundary conditions of a tnorm; that is, if T(x,1)=x for all x in [0,1];
+        by adaptive refinement of a coarse grid.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            initial_divisions: An integer, representing the number of divisions of the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample (x,) if there is one.
+        """
+        def point_function(points: numpy.ndarray):
+            x = points[:, 0]
+            values = self.evaluate_operator_array(x, numpy.ones_like(x))
+            return self.comparator.excess_equal(values, x), values
+
+        return AdaptivePropertyChecker(dimension=1,
+                                       cell_evaluator=AdaptivePropertyChecker.point_cell_evaluator(point_function, 1),
+                                       initial_divisions=initial_divisions, evaluation_budget=evaluation_budget,
+                                       max_depth=max_depth).check()
 
     def is_archimedean(self, scatter_grid_x: int = 50, scatter_grid_y: int = 50, max_it: int = 50) -> bool:
         """
-        Checks if the operator satisfies the Archimedean property
+        Checks if the operator satisfies the Archimedean property; that is, for all x, y in (0,1) there exists n such
+        that x^n < y; in a grid of a specified size, trying the exponents lower than max_it.
+
+        Since the powers of a tnorm are decreasing with respect to the exponent, the property holds in the grid if and
+        only if the (max_it-1)-th power of every x is lower than the smallest y, so a single vectorized power is
+        computed. If max_it is lower than 3, no exponent is tried: the property is considered not to hold in a non-empty
+        grid when max_it is 2, and to hold otherwise.
 
         Args:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
@@ -66,15 +122,9 @@ class FuzzyUnitTnorm(FuzzyUnitConjunction):
         """
         x = numpy.linspace(0, 1, scatter_grid_x)[1:scatter_grid_x-1]
         y = numpy.linspace(0, 1, scatter_grid_y)[1:scatter_grid_y-1]
+        if x.size == 0 or y.size == 0:
+            return True
+        if max_it <= 2:
+            return max_it != 2
 
-        for x_idx, x_val in enumerate(x):
-            for y_idx, y_val in enumerate(y):
-                n = 2
-                while n < max_it:
-                    if self.evaluate_operator_power(x_val, n) < y_val:
-                        break
-                    n += 1
-                if n == max_it:
-                    return False
-
-        return True
+        return bool((self.evaluate_operator_power_array(x, max_it - 1) < y.min()).all())
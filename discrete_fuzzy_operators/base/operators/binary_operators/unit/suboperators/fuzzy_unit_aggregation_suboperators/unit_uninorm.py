@@ -10,7 +10,9 @@ from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.
 class FuzzyUnitUninorm(FuzzyUnitAggregationBinaryOperator):
 
     def __init__(self, e: float, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a fuzzy uninorm U: [0,1]x[0,1] -> [0,1] from its analytical
         expression and neutral element
@@ -21,10 +23,16 @@ class FuzzyUnitUninorm(FuzzyUnitAggregationBinaryOperator):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
         self.e = e
-        super(FuzzyUnitUninorm, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitUninorm, self).__init__(operator_expression, check_properties_in_load,
+                                               operator_array_expression=operator_array_expression,
+                                               comparator=comparator)
 
         if check_properties_in_load and not self.is_fuzzy_uninorm():
             warnings.warn("With the input arguments, the generated operator is not a fuzzy uninorm since "
@@ -44,7 +52,4 @@ class FuzzyUnitUninorm(FuzzyUnitAggregationBinaryOperator):
         U(x,e)=x for all x in [0,1]; in a grid of a specified size.
         """
         x = numpy.linspace(0, 1, scatter_grid_x)
-        for x_idx, x_val in enumerate(x):
-            if NumericComparator.compare_equal(self.evaluate_operator(x_val, self.e), x):
-                return True
-            return False
+        return self.comparator.all_equal(self.evaluate_operator_array(x, numpy.full_like(x, self.e)), x)
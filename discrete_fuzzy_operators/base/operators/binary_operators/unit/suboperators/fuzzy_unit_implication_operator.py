@@ -1,6 +1,8 @@
-from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
+import numpy
 import warnings
 
+from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
+
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_implication_operator import \
     DiscreteImplicationOperator
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.fuzzy_unit_binary_operator import \
@@ -12,7 +14,9 @@ from typing import Callable, Tuple
 class FuzzyUnitImplicationOperator(FuzzyUnitBinaryOperator):
 
     def __init__(self, operator_expression: Callable[[float, float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object that represents a binary fuzzy implication I: [0,1]x[0,1] -> [0,1] from its analytical
         expression.
@@ -22,9 +26,15 @@ class FuzzyUnitImplicationOperator(FuzzyUnitBinaryOperator):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyUnitImplicationOperator, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyUnitImplicationOperator, self).__init__(operator_expression, check_properties_in_load,
+                                                           operator_array_expression=operator_array_expression,
+                                                           comparator=comparator)
 
         if check_properties_in_load and not self.is_fuzzy_implication():
             warnings.warn("With the input arguments, the generated operator is not a fuzzy implication since it is "
@@ -42,37 +52,28 @@ class FuzzyUnitImplicationOperator(FuzzyUnitBinaryOperator):
         Checks if the operator verifies the boundary conditions of a fuzzy implication; that is, if I(1,0)=0 and
         I(1,1)=I(0,0)=1.
         """
-        if NumericComparator.compare_equal(self.evaluate_operator(1, 0),0) and NumericComparator.compare_equal(self.evaluate_operator(0, 0),1) and NumericComparator.compare_equal(self.evaluate_operator(1, 1),1):
+        if self.comparator.equal(self.evaluate_operator(1, 0),0) and self.comparator.equal(self.evaluate_operator(0, 0),1) and self.comparator.equal(self.evaluate_operator(1, 1),1):
             return True
         return False
 
-    def get_upper_discretized_operator(self, n: int) -> DiscreteImplicationOperator:
-        """
-        Computes the upper discretization of an implication, defined as Ceil(n*I(x/n,y/n)), and represents it as a
-        DiscreteFuzzyImplicationOperator object.
-
-        Args:
-            n: An integer, representing the dimension of the finite chain where the discrete operator is defined.
-
-        Returns:
-            A DiscreteFuzzyImplicationOperator object, representing the discrete implication.
-        """
-        return DiscreteImplicationOperator(n=n, operator_matrix=super(FuzzyUnitImplicationOperator,
-                                                                      self).get_upper_discretized_operator(n).operator_matrix)
-
-    def get_lower_discretized_operator(self, n: int) -> DiscreteImplicationOperator:
+    def generate_discrete_operator(self, n: int, operator_matrix: numpy.ndarray,
+                                   check_properties_in_load: bool = True) -> DiscreteImplicationOperator:
         """
-        Computes the lower discretization of an implication, defined as Floor(n*I(x/n,y/n)), and represents it as a
-        DiscreteFuzzyImplicationOperator object.
+        Builds the discrete implication which corresponds to a discretization of the implication, so that the upper
+        discretization Ceil(n*I(x/n,y/n)) and the lower discretization Floor(n*I(x/n,y/n)) are represented as
+        DiscreteFuzzyImplicationOperator objects.
 
         Args:
             n: An integer, representing the dimension of the finite chain where the discrete operator is defined.
+            operator_matrix: A numpy array, representing the matrix expression of the discrete implication.
+            check_properties_in_load: A boolean, indicating if the properties of the discrete implication have to be
+                                      checked when it is loaded.
 
         Returns:
             A DiscreteFuzzyImplicationOperator object, representing the discrete implication.
         """
-        return DiscreteImplicationOperator(n=n, operator_matrix=super(FuzzyUnitImplicationOperator,
-                                                                      self).get_lower_discretized_operator(n).operator_matrix)
+        return DiscreteImplicationOperator(n=n, operator_matrix=operator_matrix,
+                                           check_properties_in_load=check_properties_in_load)
 
     # region Plot of the discretizations
     def plot_lower_discretization(self, n: int, figure_title: str = "Lower discretization of the implication",
@@ -34,6 +34,7 @@ class DiscreteUnaryOperator:
             self.operator_expression = operator_expression
 
         if operator_vector is not None:
+            operator_vector = numpy.asarray(operator_vector)
             if not len(operator_vector) == (self.n+1):
                 raise FuzzyOperatorSizeException()
 
@@ -55,19 +56,82 @@ class DiscreteUnaryOperator:
             warnings.warn("The operator is not decreasing, so the completed graph will not correspond to its "
                           "theoretical formulation")
 
-        completed_graph_points: List[Tuple[int, int]] = []
-        for x in range(self.evaluate_operator(0), self.n+1):
-            completed_graph_points.append((0, x))
+        return [(int(x), int(y)) for x, y in DiscreteUnaryOperator.compute_completed_graph_array(self.operator_vector)]
 
-        for x in range(0, self.evaluate_operator(self.n)+1):
-            completed_graph_points.append((self.n, x))
+    @staticmethod
+    def compute_completed_graph_array(operator_vectors: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the completed graph of one or several decreasing functions. The graph is made of runs of consecutive
+        values: {0}x[f(0), n], {n}x[0, f(n)] and {x}x[f(x+1), f(x)] for each x in [0, n-1], so it is built in linear
+        time by expanding the runs, and the points are given in the same order as in compute_completed_graph.
+
+        Args:
+            operator_vectors: A numpy array of integers of shape (n+1,), representing the vector of an operator, or of
+                              shape (K, n+1), representing a stack of K operators.
+
+        Returns:
+            A numpy array of integers. If a single operator is given, it has shape (P, 2) and each row is a point
+            (x, y). If a stack is given, it has shape (P, 3) and each row is (k, x, y), where k is the index of the
+            operator in the stack.
+        """
+        vectors = numpy.asarray(operator_vectors, dtype=int)
+        single = vectors.ndim == 1
+        vectors = numpy.atleast_2d(vectors)
+        operators, length = vectors.shape
+        n = length - 1
+
+        # Each row has the runs {0}x[f(0), n], {n}x[0, f(n)] and {x}x[f(x+1), f(x)] for x in [0, n-1].
+        run_x = numpy.concatenate(([0, n], numpy.arange(0, n)))
+        run_start = numpy.concatenate((vectors[:, :1], numpy.zeros((operators, 1), dtype=int), vectors[:, 1:]), axis=1)
+        run_length = numpy.concatenate((n - vectors[:, :1] + 1, vectors[:, -1:] + 1,
+                                        numpy.maximum(vectors[:, :-1] - vectors[:, 1:] + 1, 0)), axis=1).reshape(-1)
+
+        run = numpy.repeat(numpy.arange(0, run_length.size), run_length)
+        run_offset = numpy.cumsum(run_length) - run_length
+        y = run_start.reshape(-1)[run] + numpy.arange(0, run.size) - run_offset[run]
+        x = run_x[run % (n + 2)]
+
+        if single:
+            return numpy.stack((x, y), axis=1)
+        return numpy.stack((run // (n + 2), x, y), axis=1)
+
+    @staticmethod
+    def compute_pseudoinverse_vectors(operator_vectors: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the pseudo-inverse of one or several monotone functions, given by
+        f^(-1)(t) = max{i in [0, n] such that (f(i)-t)(f(n)-f(0)) <= 0}.
 
-        for x in range(0, self.n):
-            for y in range(0, self.n+1):
-                if self.evaluate_operator(x+1) <= y <= self.evaluate_operator(x):
-                    completed_graph_points.append((x, y))
+        For each value v, the largest index i such that f(i)=v is stored, and the pseudo-inverse is the running maximum
+        of these indices over the values greater than or equal to t (if f(n) < f(0)) or lower than or equal to t (if
+        f(n) > f(0)), so it is computed in linear time. If f(n) = f(0), the pseudo-inverse is constantly n.
 
-        return completed_graph_points
+        Args:
+            operator_vectors: A numpy array of integers of shape (n+1,), representing the vector of an operator, or of
+                              shape (K, n+1), representing a stack of K operators.
+
+        Returns:
+            A numpy array of integers with the shape of the input, representing the vectors of the pseudo-inverses.
+            The positions where the set of candidates is empty are set to -1.
+        """
+        vectors = numpy.asarray(operator_vectors, dtype=int)
+        single = vectors.ndim == 1
+        vectors = numpy.atleast_2d(vectors)
+        operators, length = vectors.shape
+        n = length - 1
+
+        last_index = numpy.full((operators, length), -1, dtype=int)
+        numpy.maximum.at(last_index, (numpy.arange(0, operators)[:, None], vectors),
+                         numpy.broadcast_to(numpy.arange(0, length), vectors.shape))
+
+        direction = vectors[:, -1] - vectors[:, 0]
+        pseudoinverses = numpy.full((operators, length), n, dtype=int)
+        decreasing, increasing = direction < 0, direction > 0
+        pseudoinverses[decreasing] = numpy.maximum.accumulate(last_index[decreasing, ::-1], axis=1)[:, ::-1]
+        pseudoinverses[increasing] = numpy.maximum.accumulate(last_index[increasing], axis=1)
+
+        if single:
+            return pseudoinverses[0]
+        return pseudoinverses
 
     def plot_completed_graph(self, figure_size: Tuple[int, int]):
         """
@@ -76,12 +140,12 @@ class DiscreteUnaryOperator:
         Args:
             figure_size: A tuple of two integers, representing the size of the figure. The order is WIDTH and HEIGHT.
         """
-        completed_graph = self.compute_completed_graph()
-
-        x = [point[0] for point in completed_graph]
-        y = [point[1] for point in completed_graph]
+        if not self.is_decreasing():
+            warnings.warn("The operator is not decreasing, so the completed graph will not correspond to its "
+                          "theoretical formulation")
+        completed_graph = DiscreteUnaryOperator.compute_completed_graph_array(self.operator_vector)
 
-        figure = plot_express.scatter(x=x, y=y)
+        figure = plot_express.scatter(x=completed_graph[:, 0], y=completed_graph[:, 1])
         figure.update_layout(autosize=True, width=figure_size[0], height=figure_size[1])
         figure.show()
 
@@ -90,27 +154,21 @@ class DiscreteUnaryOperator:
         Generates the vector expression from the analytic function.
 
         Returns:
-            A numpy array, representing the matrix expression of the operator.
+            A numpy array of integers, representing the vector expression of the operator.
         """
-        return [self.operator_expression(x, self.n) for x in range(0, self.n+1)]
+        return numpy.array([self.operator_expression(x, self.n) for x in range(0, self.n+1)], dtype=int)
 
     def is_decreasing(self) -> bool:
         """
         Checks if the operator is monotone decreasing.
         """
-        for x in range(0, self.n):
-            if not self.operator_vector[x+1] <= self.operator_vector[x]:
-                return False
-        return True
+        return bool((numpy.diff(self.operator_vector.astype(int)) <= 0).all())
 
     def is_increasing(self) -> bool:
         """
         Checks if the operator is monotone increasing.
         """
-        for x in range(0, self.n):
-            if not self.operator_vector[x+1] >= self.operator_vector[x]:
-                return False
-        return True
+        return bool((numpy.diff(self.operator_vector.astype(int)) >= 0).all())
 
     def is_smooth(self, step: int = 1) -> bool:
         """
@@ -122,10 +180,7 @@ class DiscreteUnaryOperator:
         Returns:
             A boolean, indicating if the operator verifies the k-smoothness condition.
         """
-        for x in range(0, self.n):
-            if not abs(self.evaluate_operator(x + 1) - self.evaluate_operator(x)) <= step:
-                return False
-        return True
+        return bool((numpy.abs(numpy.diff(self.operator_vector.astype(int))) <= step).all())
 
     def evaluate_operator(self, x: int) -> int:
         """
@@ -24,15 +24,11 @@ class YagerGeneratorOperator(DiscreteUnaryOperator):
     def get_pseudoinverse(self) -> DiscreteUnaryOperator:
         """
         Computes the pseudo-inverse of a decreasing function. By definition, it is given by
-        Returns:
+        f^(-1)(t) = max{i in [0, n] such that (f(i)-t)(f(n)-f(0)) <= 0}.
 
+        Returns:
+            A DiscreteUnaryOperator object, representing the pseudo-inverse.
         """
-        pseudoinverse_vector = []
-
-        for t in range(0, self.n+1):
-            candidates = []
-            for i in range(0, self.n+1):
-                if (self.evaluate_operator(i)-t)*(self.evaluate_operator(self.n)-self.evaluate_operator(0)) <= 0:
-                    candidates.append(i)
-            pseudoinverse_vector.append(max(candidates))
-        return DiscreteUnaryOperator(n=self.n, operator_vector=numpy.array(pseudoinverse_vector))
+        return DiscreteUnaryOperator(n=self.n,
+                                     operator_vector=DiscreteUnaryOperator.compute_pseudoinverse_vectors(
+                                         self.operator_vector))
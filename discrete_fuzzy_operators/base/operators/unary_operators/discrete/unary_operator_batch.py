@@ -0,0 +1,161 @@
+import numpy
+
+from discrete_fuzzy_operators.base.exceptions.operators.operator_range_invalid import FuzzyOperatorImageRangeException
+from discrete_fuzzy_operators.base.exceptions.operators.operator_size_exception import FuzzyOperatorSizeException
+from discrete_fuzzy_operators.base.operators.unary_operators.discrete.fuzzy_discrete_unary_operator import \
+    DiscreteUnaryOperator
+from typing import List
+
+
+class UnaryOperatorBatch:
+
+    def __init__(self, n: int, operator_vectors: numpy.ndarray):
+        """
+        Initializes the object that represents a stack of K unary operators defined over the finite chain Ln, so that
+        their properties are checked for all of them at once. Each property returns a boolean array of shape (K,).
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            operator_vectors: A numpy array of integers of shape (K, n+1), whose rows are the vector expressions of
+                              the operators.
+        """
+        operator_vectors = numpy.asarray(operator_vectors)
+        if operator_vectors.ndim != 2 or operator_vectors.shape[1] != n+1:
+            raise FuzzyOperatorSizeException()
+        if not ((operator_vectors >= 0).all() and (operator_vectors <= n).all()):
+            raise FuzzyOperatorImageRangeException()
+
+        self.n = n
+        self.operator_vectors = operator_vectors
+        self.__differences = numpy.diff(operator_vectors.astype(int), axis=1)
+
+    @staticmethod
+    def from_operators(operators: List[DiscreteUnaryOperator]) -> "UnaryOperatorBatch":
+        """
+        Builds the stack from a non-empty list of unary operators defined over the same finite chain.
+
+        Args:
+            operators: A list of DiscreteUnaryOperator objects.
+
+        Returns:
+            A UnaryOperatorBatch object, representing the stack of the operators.
+        """
+        if not operators or any(operator.n != operators[0].n for operator in operators):
+            raise Exception("The operators must be defined over the same finite chain.")
+        return UnaryOperatorBatch(n=operators[0].n,
+                                  operator_vectors=numpy.stack([operator.operator_vector for operator in operators]))
+
+    def __len__(self) -> int:
+        return self.operator_vectors.shape[0]
+
+    def get_operator(self, k: int) -> DiscreteUnaryOperator:
+        """
+        Gets one of the operators of the stack.
+
+        Args:
+            k: An integer, representing the index of the operator in the stack.
+
+        Returns:
+            A DiscreteUnaryOperator object.
+        """
+        return DiscreteUnaryOperator(n=self.n, operator_vector=self.operator_vectors[k])
+
+    def select(self, mask: numpy.ndarray) -> "UnaryOperatorBatch":
+        """
+        Selects the operators of the stack given by a boolean mask or an array of indices.
+
+        Args:
+            mask: A numpy array of booleans of shape (K,) or a numpy array of integers.
+
+        Returns:
+            A UnaryOperatorBatch object, representing the selected operators.
+        """
+        return UnaryOperatorBatch(n=self.n, operator_vectors=self.operator_vectors[mask])
+
+    # region Monotonicity and smoothness
+    def is_decreasing(self) -> numpy.ndarray:
+        """
+        Checks which operators are monotone decreasing.
+        """
+        return (self.__differences <= 0).all(axis=1)
+
+    def is_increasing(self) -> numpy.ndarray:
+        """
+        Checks which operators are monotone increasing.
+        """
+        return (self.__differences >= 0).all(axis=1)
+
+    def is_smooth(self, step: int = 1) -> numpy.ndarray:
+        """
+        Checks which operators are k-smooth.
+
+        Args:
+            step: An integer, representing the step of smoothness.
+        """
+        return (numpy.abs(self.__differences) <= step).all(axis=1)
+    # endregion
+
+    # region Properties of negations
+    def verifies_boundary_conditions(self) -> numpy.ndarray:
+        """
+        Checks which operators verify the boundary conditions of a discrete negation; that is, N(0)=n and N(n)=0.
+        """
+        return (self.operator_vectors[:, 0] == self.n) & (self.operator_vectors[:, -1] == 0)
+
+    def is_negation(self) -> numpy.ndarray:
+        """
+        Checks which operators are discrete negations; that is, monotone decreasing and satisfying the boundary
+        conditions.
+        """
+        return self.is_decreasing() & self.verifies_boundary_conditions()
+
+    def is_involutive(self) -> numpy.ndarray:
+        """
+        Checks which operators are involutive; that is, N(N(x))=x for all x in Ln.
+        """
+        rows = numpy.arange(0, len(self))[:, None]
+        return (self.operator_vectors[rows, self.operator_vectors.astype(int)] ==
+                numpy.arange(0, self.n+1)).all(axis=1)
+
+    def is_strong(self) -> numpy.ndarray:
+        """
+        Checks which operators are strong discrete negations; that is, involutive discrete negations.
+        """
+        return self.is_negation() & self.is_involutive()
+
+    def compute_fixed_points(self) -> numpy.ndarray:
+        """
+        Computes the fixed points of the operators; that is, the points x such that N(x)=x.
+
+        Returns:
+            A numpy array of booleans of shape (K, n+1), indicating which points are fixed points of each operator.
+        """
+        return self.operator_vectors == numpy.arange(0, self.n+1)
+
+    def has_fixed_point(self) -> numpy.ndarray:
+        """
+        Checks which operators have at least one fixed point.
+        """
+        return self.compute_fixed_points().any(axis=1)
+    # endregion
+
+    # region Completed graphs and pseudo-inverses
+    def compute_completed_graphs(self) -> numpy.ndarray:
+        """
+        Computes the completed graphs of all the operators of the stack.
+
+        Returns:
+            A numpy array of integers of shape (P, 3), whose rows are the points (k, x, y) of the completed graph of
+            the k-th operator.
+        """
+        return DiscreteUnaryOperator.compute_completed_graph_array(self.operator_vectors)
+
+    def compute_pseudoinverses(self) -> numpy.ndarray:
+        """
+        Computes the pseudo-inverses of all the operators of the stack.
+
+        Returns:
+            A numpy array of integers of shape (K, n+1), whose rows are the vectors of the pseudo-inverses.
+        """
+        return DiscreteUnaryOperator.compute_pseudoinverse_vectors(self.operator_vectors)
+    # endregion
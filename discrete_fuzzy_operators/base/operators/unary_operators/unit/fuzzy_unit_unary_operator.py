@@ -8,7 +8,9 @@ from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import
 
 class FuzzyUnitUnaryOperator:
     def __init__(self, operator_expression: Callable[[float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the base object representing the operator defined in the unit interval from its analytical
         expression. Since the class works with numbers between 0 and 1, in order to prevent rounding errors the
@@ -16,12 +18,19 @@ class FuzzyUnitUnaryOperator:
 
         Args:
             operator_expression: A function, representing the analytical expression.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       It must return the same values as the analytical expression. Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
         if operator_expression is None:
             raise Exception("In order to define a unary operator, its analytical expression must be provided.")
 
         self.operator_expression = operator_expression
+        self.operator_array_expression = operator_array_expression
+        self.comparator = comparator if comparator is not None else NumericComparator()
+        self.supports_arrays = None
 
     def evaluate_operator(self, x: float) -> float:
         """
@@ -38,6 +47,39 @@ class FuzzyUnitUnaryOperator:
                             "0 and 1.")
         return self.operator_expression(x)
 
+    def evaluate_operator_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the operator in several points at once. The range of the argument is checked once for the whole array.
+
+        If an array expression has been provided, it is used. Otherwise, if the analytical expression supports numpy
+        arrays, it is called once with the array; and if it does not, it is evaluated point by point.
+
+        Args:
+            x: A numpy array of floats, representing the given points.
+
+        Returns:
+            A numpy array of floats, representing the value of the function in the given points.
+        """
+        x = numpy.asarray(x, dtype=float)
+        if not ((0 <= x).all() and (x <= 1).all()):
+            raise Exception("To evaluate a unary operator defined in the unit interval, the arguments must be between "
+                            "0 and 1.")
+
+        if self.operator_array_expression is not None:
+            values = numpy.asarray(self.operator_array_expression(x), dtype=float)
+            return numpy.broadcast_to(values, x.shape).copy()
+
+        if self.supports_arrays is not False and x.size > 1:
+            try:
+                values = numpy.asarray(self.operator_expression(x), dtype=float)
+                self.supports_arrays = True
+                return numpy.broadcast_to(values, x.shape).copy()
+            except Exception:
+                # The expression relies on scalar operations (comparisons, min, max...).
+                self.supports_arrays = False
+
+        return numpy.vectorize(self.operator_expression, otypes=[float])(x)
+
     # region Plot of the operator
     def plot_operator(self, scatter_grid_x: int = 50, figure_size: Tuple[int, int] = (700, 700)):
         """
@@ -48,10 +90,7 @@ class FuzzyUnitUnaryOperator:
             figure_size: A tuple, representing the size of the figure as WIDTHxHEIGHT.
         """
         x = numpy.linspace(0, 1, scatter_grid_x)
-        y = numpy.zeros(len(x))
-
-        for x_idx, x_val in enumerate(x):
-            y[x_idx] = self.evaluate_operator(x_val)
+        y = self.evaluate_operator_array(x)
 
         figure = plot_express.line(x=x, y=y)
         figure.update_layout(autosize=True, width=figure_size[0], height=figure_size[1])
@@ -65,12 +104,8 @@ class FuzzyUnitUnaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
         """
 
-        x = numpy.linspace(0, 1, scatter_grid_x)
-
-        for i in range(0,scatter_grid_x-1):
-            if not NumericComparator.compare_less_equal(self.evaluate_operator(x[i+1]),self.evaluate_operator(x[i])):
-                return False
-        return True
+        y = self.evaluate_operator_array(numpy.linspace(0, 1, scatter_grid_x))
+        return self.comparator.all_less_equal(y[1:], y[:-1])
 
     def is_increasing(self, scatter_grid_x: int = 50) -> bool:
         """
@@ -80,9 +115,5 @@ class FuzzyUnitUnaryOperator:
             scatter_grid_x: An integer, representing the number of points to consider in the X grid.
         """
 
-        x = numpy.linspace(0, 1, scatter_grid_x)
-
-        for i in range(0,scatter_grid_x-1):
-            if not NumericComparator.compare_greater_equal(self.evaluate_operator(x[i+1]),self.evaluate_operator(x[i])):
-                return False
-        return True
\ No newline at end of file
+        y = self.evaluate_operator_array(numpy.linspace(0, 1, scatter_grid_x))
+        return self.comparator.all_greater_equal(y[1:], y[:-1])
\ No newline at end of file
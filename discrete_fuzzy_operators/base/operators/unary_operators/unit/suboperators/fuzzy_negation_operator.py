@@ -6,12 +6,16 @@ from typing import Callable
 from discrete_fuzzy_operators.base.operators.unary_operators.unit.fuzzy_unit_unary_operator import \
     FuzzyUnitUnaryOperator
 from discrete_fuzzy_operators.base.numeric_comparator.numeric_comparator import NumericComparator
+from discrete_fuzzy_operators.base.property_verification.adaptive_property_checker import AdaptiveCheckResult, \
+    AdaptivePropertyChecker
 
 
 class FuzzyNegation(FuzzyUnitUnaryOperator):
     def __init__(self,
                  operator_expression: Callable[[float], float] = None,
-                 check_properties_in_load: bool = True):
+                 check_properties_in_load: bool = True,
+                 operator_array_expression: Callable[[numpy.ndarray], numpy.ndarray] = None,
+                 comparator: NumericComparator = None):
         """
         Initializes the object representing the fuzzy negation from its analytical expression.
 
@@ -20,9 +24,15 @@ class FuzzyNegation(FuzzyUnitUnaryOperator):
             check_properties_in_load: A boolean, indicating if the operator has to be loaded without checking the
             properties that define that class of operators. By default, is set to True, indicating that the properties
             have to be checked.
+            operator_array_expression: A function, representing the analytical expression evaluated over numpy arrays.
+                                       Optional.
+            comparator: A NumericComparator object, representing the tolerances used to check the properties of the
+                        operator. If it is not provided, the default tolerances are used.
         """
         self.check_properties_in_load = check_properties_in_load
-        super(FuzzyNegation, self).__init__(operator_expression, check_properties_in_load)
+        super(FuzzyNegation, self).__init__(operator_expression, check_properties_in_load,
+                                            operator_array_expression=operator_array_expression,
+                                            comparator=comparator)
 
         if check_properties_in_load and not self.is_negation():
             warnings.warn("With the input arguments, the generated operator is not a fuzzy negation since it is "
@@ -41,7 +51,7 @@ class FuzzyNegation(FuzzyUnitUnaryOperator):
         Checks if the operator verifies the boundary conditions of a fuzzy negation; that is, if N(0)=1 and
         N(1)=0.
         """
-        if NumericComparator.compare_equal(self.evaluate_operator(0),1) and NumericComparator.compare_equal(self.evaluate_operator(1),0):
+        if self.comparator.equal(self.evaluate_operator(0),1) and self.comparator.equal(self.evaluate_operator(1),0):
             return True
         return False
 
@@ -56,8 +66,29 @@ class FuzzyNegation(FuzzyUnitUnaryOperator):
         """
 
         x = numpy.linspace(0, 1, scatter_grid_x)
+        return self.comparator.all_equal(self.evaluate_operator_array(self.evaluate_operator_array(x)), x)
 
-        for x_idx, x_val in enumerate(x):
-            if not NumericComparator.compare_equal(self.evaluate_operator(self.evaluate_operator(x_val)), x_val):
-                return False
-        return True
+    def verify_strong_adaptively(self, evaluation_budget: int = 12000, initial_divisions: int = 16,
+                                 max_depth: int = 20) -> AdaptiveCheckResult:
+        """
+        Checks if the fuzzy negation is strong; that is, N(N(x))=x for all x in [0,1], by adaptive refinement of a
+        coarse grid, which concentrates the evaluations around suspected violations and discontinuities.
+
+        Args:
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            initial_divisions: An integer, representing the number of divisions of the initial grid.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+
+        Returns:
+            An AdaptiveCheckResult object, which contains the located counterexample (x,) if there is one.
+        """
+        def point_function(points: numpy.ndarray):
+            x = points[:, 0]
+            values = self.evaluate_operator_array(x)
+            return self.comparator.excess_equal(self.evaluate_operator_array(values), x), values
+
+        return AdaptivePropertyChecker(dimension=1,
+                                       cell_evaluator=AdaptivePropertyChecker.point_cell_evaluator(
+                                           point_function, 1, evaluations_per_point=2),
+                                       initial_divisions=initial_divisions, evaluation_budget=evaluation_budget,
+                                       max_depth=max_depth).check()
@@ -0,0 +1,208 @@
+import heapq
+import itertools
+import math
+import numpy
+from typing import Callable, List, Tuple
+
+
+class AdaptiveCheckResult:
+
+    def __init__(self, holds: bool, counterexample: Tuple[float, ...] = None, refinement_depth: int = 0,
+                 evaluations: int = 0, residual: float = None):
+        """
+        Initializes the object that stores the result of an adaptive verification of a property.
+
+        Args:
+            holds: A boolean, indicating if no violation of the property has been found.
+            counterexample: A tuple of floats, representing the point (or the cell) where the property fails. None if
+                            the property holds.
+            refinement_depth: An integer, representing the refinement depth of the cell where the counterexample has
+                              been located or, if the property holds, the deepest refinement that has been explored.
+            evaluations: An integer, representing the number of evaluations of the operator carried out.
+            residual: A float, representing the largest residual found. Positive residuals are violations of the
+                      property beyond the tolerance of the comparison.
+        """
+        self.holds = holds
+        self.counterexample = counterexample
+        self.refinement_depth = refinement_depth
+        self.evaluations = evaluations
+        self.residual = residual
+
+    def __bool__(self) -> bool:
+        return self.holds
+
+    def __repr__(self) -> str:
+        if self.holds:
+            return f"AdaptiveCheckResult(holds=True, refinement_depth={self.refinement_depth}, " \
+                   f"evaluations={self.evaluations})"
+        return f"AdaptiveCheckResult(holds=False, counterexample={self.counterexample}, " \
+               f"refinement_depth={self.refinement_depth}, evaluations={self.evaluations})"
+
+
+class AdaptivePropertyChecker:
+
+    def __init__(self, dimension: int,
+                 cell_evaluator: Callable[[numpy.ndarray, numpy.ndarray],
+                                          Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, int]],
+                 initial_divisions: int = 8, evaluation_budget: int = 200000, max_depth: int = 12,
+                 batch_size: int = 128):
+        """
+        Initializes the object that verifies a property in the unit hypercube [0,1]^dimension by adaptive refinement.
+
+        The hypercube is divided in a uniform coarse grid of cells. Each cell is evaluated by the cell evaluator, which
+        returns a residual (positive if the property is violated in the cell), a local variation of the operator and a
+        witness of the cell, together with the number of evaluations of the operator that it has carried out. The cells
+        with the largest residual plus variation are split in 2^dimension halves, so that the evaluations concentrate
+        around suspected violations and discontinuities.
+
+        The budget is charged with the evaluations of the operator reported by the cell evaluator. The first cell is
+        evaluated alone to measure the cost of a cell, and the following blocks are truncated so that the budget is
+        not exceeded; only the first cell is evaluated if the budget does not cover it.
+
+        Args:
+            dimension: An integer, representing the dimension of the domain of the property.
+            cell_evaluator: A function that, given the lower corners of the cells as an array of shape (m, dimension)
+                            and their sizes as an array of shape (m,), returns three arrays and an integer: the
+                            residuals of shape (m,), the variations of shape (m,), the witnesses of shape (m, k) and
+                            the number of evaluations of the operator carried out.
+            initial_divisions: An integer, representing the number of divisions of each axis in the initial grid.
+            evaluation_budget: An integer, representing the maximum number of evaluations of the operator.
+            max_depth: An integer, representing the maximum number of times that a cell can be split.
+            batch_size: An integer, representing the number of cells that are split at the same time.
+        """
+        if dimension < 1:
+            raise Exception("The dimension of the domain of the property must be positive.")
+        if initial_divisions < 1 or evaluation_budget < 1 or batch_size < 1:
+            raise Exception("The initial divisions, the evaluation budget and the batch size must be positive.")
+
+        self.dimension = dimension
+        self.cell_evaluator = cell_evaluator
+        self.initial_divisions = initial_divisions
+        self.evaluation_budget = evaluation_budget
+        self.max_depth = max_depth
+        self.batch_size = batch_size
+
+    def check(self) -> AdaptiveCheckResult:
+        """
+        Verifies the property, refining the cells until a violation is found, the evaluation budget is exhausted or
+        every suspicious cell has reached the maximum depth.
+
+        Returns:
+            An AdaptiveCheckResult object, representing the result of the verification.
+        """
+        axis = numpy.arange(0, self.initial_divisions) / self.initial_divisions
+        lower = numpy.stack(numpy.meshgrid(*([axis] * self.dimension), indexing="ij"), axis=-1).reshape(-1,
+                                                                                                         self.dimension)
+        size = numpy.full(lower.shape[0], 1 / self.initial_divisions)
+        depth = numpy.zeros(lower.shape[0], dtype=int)
+
+        offsets = numpy.array(list(itertools.product((0, 1), repeat=self.dimension)), dtype=float)
+        tie_breaker = itertools.count()
+        queue = []
+        evaluations = 0
+        cell_cost = None
+        deepest = 0
+        largest_residual = -numpy.inf
+
+        while True:
+            count = 1 if cell_cost is None else (self.evaluation_budget - evaluations) // cell_cost
+            if count <= 0:
+                break
+
+            residual, variation, witness, operator_evaluations = self.cell_evaluator(lower[:count], size[:count])
+            count = residual.shape[0]
+            evaluations += operator_evaluations
+            cell_cost = max(cell_cost or 1, math.ceil(operator_evaluations / count))
+            deepest = max(deepest, int(depth[:count].max()))
+            largest_residual = max(largest_residual, float(residual.max()))
+
+            if (residual > 0).any():
+                worst = int(numpy.argmax(residual))
+                return AdaptiveCheckResult(holds=False,
+                                           counterexample=tuple(float(value) for value in witness[worst]),
+                                           refinement_depth=int(depth[worst]), evaluations=evaluations,
+                                           residual=float(residual[worst]))
+
+            scores = residual + variation
+            for cell in numpy.flatnonzero(depth[:count] < self.max_depth):
+                heapq.heappush(queue, (-scores[cell], next(tie_breaker), lower[cell], size[cell], depth[cell]))
+
+            # The cells of the current block which have not been evaluated yet are evaluated before splitting.
+            lower, size, depth = lower[count:], size[count:], depth[count:]
+            if lower.shape[0] > 0:
+                continue
+            if not queue:
+                break
+
+            batch = [heapq.heappop(queue) for _ in range(min(self.batch_size, len(queue)))]
+            parent_lower = numpy.array([cell[2] for cell in batch])
+            half_size = numpy.array([cell[3] for cell in batch]) / 2
+            parent_depth = numpy.array([cell[4] for cell in batch])
+
+            lower = (parent_lower[:, None, :] + offsets[None, :, :] * half_size[:, None, None]).reshape(-1,
+                                                                                                        self.dimension)
+            size = numpy.repeat(half_size, offsets.shape[0])
+            depth = numpy.repeat(parent_depth + 1, offsets.shape[0])
+
+        return AdaptiveCheckResult(holds=True, refinement_depth=deepest, evaluations=evaluations,
+                                   residual=largest_residual)
+
+    @staticmethod
+    def check_all(checks: List[Callable[[], AdaptiveCheckResult]]) -> AdaptiveCheckResult:
+        """
+        Runs several adaptive verifications in order, stopping at the first one which finds a violation.
+
+        Args:
+            checks: A list of functions without arguments, each one returning an AdaptiveCheckResult object.
+
+        Returns:
+            The result of the first verification which fails or, if all of them hold, a result which accumulates the
+            evaluations and the deepest refinement of all of them.
+        """
+        evaluations = 0
+        deepest = 0
+        largest_residual = -numpy.inf
+        for check in checks:
+            result = check()
+            evaluations += result.evaluations
+            if not result.holds:
+                result.evaluations = evaluations
+                return result
+            deepest = max(deepest, result.refinement_depth)
+            largest_residual = max(largest_residual, result.residual)
+        return AdaptiveCheckResult(holds=True, refinement_depth=deepest, evaluations=evaluations,
+                                   residual=largest_residual)
+
+    @staticmethod
+    def point_cell_evaluator(point_function: Callable[[numpy.ndarray], Tuple[numpy.ndarray, numpy.ndarray]],
+                             dimension: int, evaluations_per_point: int = 1) -> \
+            Callable[[numpy.ndarray, numpy.ndarray], Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, int]]:
+        """
+        Builds a cell evaluator from a property which is defined pointwise. The property is evaluated in the corners
+        and the centre of each cell; the residual of the cell is the largest one, its witness is the point where it is
+        attained and its variation is the range of the values of the operator.
+
+        Args:
+            point_function: A function that, given points as an array of shape (m, dimension), returns the residuals
+                            of the property and the values of the operator in the points, both of shape (m,).
+            dimension: An integer, representing the dimension of the domain of the property.
+            evaluations_per_point: An integer, representing the number of evaluations of the operator needed by the
+                                   point function to check the property in a point.
+
+        Returns:
+            A function, representing the cell evaluator.
+        """
+        offsets = numpy.array(list(itertools.product((0, 1), repeat=dimension)) + [(0.5,) * dimension], dtype=float)
+
+        def cell_evaluator(lower: numpy.ndarray, size: numpy.ndarray):
+            points = lower[:, None, :] + offsets[None, :, :] * size[:, None, None]
+            residual, values = point_function(points.reshape(-1, dimension))
+            residual = residual.reshape(points.shape[:2])
+            values = values.reshape(points.shape[:2])
+
+            worst = numpy.argmax(residual, axis=1)
+            cells = numpy.arange(0, points.shape[0])
+            return residual[cells, worst], values.max(axis=1) - values.min(axis=1), points[cells, worst], \
+                residual.size * evaluations_per_point
+
+        return cell_evaluator
@@ -0,0 +1,331 @@
+import math
+import numpy
+import os
+import struct
+
+from enum import Enum
+from typing import Generator, List
+
+
+class FamilyBoundaryKind(Enum):
+    """
+    The boundary conditions shared by all the operators of a family, which determine the cells that are not stored.
+        - NONE: All the cells of the matrix are stored.
+        - TNORM: F(0,x)=F(x,0)=0 and F(n,x)=F(x,n)=x, as in t-norms and copulas. Only the inner cells are stored.
+        - TCONORM: F(0,x)=F(x,0)=x and F(n,x)=F(x,n)=n, as in t-conorms. Only the inner cells are stored.
+    """
+    NONE = 0
+    TNORM = 1
+    TCONORM = 2
+
+
+class DiscreteOperatorFamilyFile:
+    MAGIC = b"DFOFAMLY"
+    VERSION = 1
+    HEADER_FORMAT = "<8sHIBBBxIIQ"
+    HEADER_SIZE = 64
+
+    def __init__(self, n: int, symmetric: bool, boundary: FamilyBoundaryKind):
+        """
+        Initializes the object that describes the layout of a family file, which stores a family of binary operators
+        over the finite chain Ln.
+
+        Only the free cells of each operator are stored: the inner cells if the boundary conditions are known and only
+        the upper triangle (with the diagonal) if the operators are symmetric. Each cell is bit-packed with
+        ceil(log2(n+1)) bits, and each operator is a record of a fixed number of bytes, so that the records can be
+        accessed by index. The file starts with a header of 64 bytes containing the magic string, the version, n, the
+        symmetry, the boundary conditions, the bits per cell, the cells and bytes per record and the number of
+        records.
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            symmetric: A boolean, indicating if the operators of the family are symmetric.
+            boundary: A FamilyBoundaryKind, representing the boundary conditions of the operators of the family.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive.")
+
+        self.n = n
+        self.symmetric = symmetric
+        self.boundary = boundary
+        self.bits = max(1, math.ceil(math.log2(n + 1)))
+        self.dtype = numpy.min_scalar_type(n)
+
+        first, last = (1, n - 1) if boundary != FamilyBoundaryKind.NONE else (0, n)
+        size = max(last - first + 1, 0)
+        if symmetric:
+            rows, columns = numpy.triu_indices(size)
+        else:
+            rows, columns = numpy.indices((size, size)).reshape(2, -1)
+        self.rows = rows + first
+        self.columns = columns + first
+        self.cells = self.rows.size
+        self.record_bytes = max(1, math.ceil(self.cells * self.bits / 8))
+
+    # region Header
+    def pack_header(self, count: int) -> bytes:
+        """
+        Builds the header of the file for the given number of records.
+        """
+        header = struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION, self.n, int(self.symmetric),
+                             self.boundary.value, self.bits, self.cells, self.record_bytes, count)
+        return header.ljust(self.HEADER_SIZE, b"\0")
+
+    @staticmethod
+    def read_header(path: str) -> ("DiscreteOperatorFamilyFile", int):
+        """
+        Reads the header of a family file.
+
+        Args:
+            path: A string, representing the path of the file.
+
+        Returns:
+            A tuple with the DiscreteOperatorFamilyFile object describing the layout and the number of records that
+            are completely written in the file.
+        """
+        with open(path, "rb") as file:
+            header = file.read(DiscreteOperatorFamilyFile.HEADER_SIZE)
+        if len(header) < DiscreteOperatorFamilyFile.HEADER_SIZE:
+            raise Exception("The file is too short to be a family file.")
+
+        magic, version, n, symmetric, boundary, bits, cells, record_bytes, count = \
+            struct.unpack_from(DiscreteOperatorFamilyFile.HEADER_FORMAT, header)
+        if magic != DiscreteOperatorFamilyFile.MAGIC:
+            raise Exception("The file is not a family file.")
+        if version != DiscreteOperatorFamilyFile.VERSION:
+            raise Exception(f"The version {version} of the family file is not supported.")
+
+        layout = DiscreteOperatorFamilyFile(n=n, symmetric=bool(symmetric), boundary=FamilyBoundaryKind(boundary))
+        if (bits, cells, record_bytes) != (layout.bits, layout.cells, layout.record_bytes):
+            raise Exception("The header of the family file is inconsistent.")
+
+        # Only the records which are completely written are considered, even if the header was not updated.
+        written = (os.path.getsize(path) - DiscreteOperatorFamilyFile.HEADER_SIZE) // record_bytes
+        return layout, min(count, written)
+    # endregion
+
+    # region Encoding
+    def encode(self, matrices: numpy.ndarray) -> numpy.ndarray:
+        """
+        Encodes a stack of operators into bit-packed records.
+
+        Args:
+            matrices: A numpy array of shape (K, n+1, n+1), representing the matrices of the operators.
+
+        Returns:
+            A numpy array of unsigned bytes of shape (K, record_bytes).
+        """
+        matrices = numpy.asarray(matrices)
+        if matrices.ndim != 3 or matrices.shape[1:] != (self.n + 1, self.n + 1):
+            raise Exception("The operators must be given as an array of shape (K, n+1, n+1).")
+
+        values = matrices[:, self.rows, self.columns].astype(numpy.uint32)
+        shifts = numpy.arange(self.bits - 1, -1, -1, dtype=numpy.uint32)
+        bits = ((values[:, :, None] >> shifts) & 1).astype(numpy.uint8).reshape(matrices.shape[0], -1)
+        records = numpy.packbits(bits, axis=1)
+        if records.shape[1] < self.record_bytes:
+            records = numpy.pad(records, ((0, 0), (0, self.record_bytes - records.shape[1])))
+        return records
+
+    def decode(self, records: numpy.ndarray) -> numpy.ndarray:
+        """
+        Decodes a stack of bit-packed records into the matrices of the operators.
+
+        Args:
+            records: A numpy array of unsigned bytes of shape (K, record_bytes).
+
+        Returns:
+            A numpy array of shape (K, n+1, n+1), representing the matrices of the operators, with the smallest
+            unsigned integer type which contains Ln.
+        """
+        records = numpy.asarray(records, dtype=numpy.uint8).reshape(-1, self.record_bytes)
+        bits = numpy.unpackbits(records, axis=1, count=self.cells * self.bits).reshape(records.shape[0], self.cells,
+                                                                                       self.bits)
+        weights = (1 << numpy.arange(self.bits - 1, -1, -1)).astype(numpy.uint32)
+        values = (bits * weights).sum(axis=2)
+
+        matrices = numpy.zeros((records.shape[0], self.n + 1, self.n + 1), dtype=self.dtype)
+        chain = numpy.arange(0, self.n + 1)
+        if self.boundary == FamilyBoundaryKind.TNORM:
+            matrices[:, self.n, :] = chain
+            matrices[:, :, self.n] = chain
+        elif self.boundary == FamilyBoundaryKind.TCONORM:
+            matrices[:, 0, :] = chain
+            matrices[:, :, 0] = chain
+            matrices[:, self.n, :] = self.n
+            matrices[:, :, self.n] = self.n
+
+        matrices[:, self.rows, self.columns] = values
+        if self.symmetric:
+            matrices[:, self.columns, self.rows] = values
+        return matrices
+    # endregion
+
+
+class DiscreteOperatorFamilyWriter:
+
+    def __init__(self, path: str, n: int = None, symmetric: bool = False,
+                 boundary: FamilyBoundaryKind = FamilyBoundaryKind.NONE, append: bool = False):
+        """
+        Initializes the object that writes a family file. The operators are appended in chunks and the number of
+        records in the header is updated after each chunk, so the file is always readable.
+
+        Args:
+            path: A string, representing the path of the file.
+            n: An integer, representing the size of the finite chain. It is not needed when appending to an existing
+               file.
+            symmetric: A boolean, indicating if the operators of the family are symmetric.
+            boundary: A FamilyBoundaryKind, representing the boundary conditions of the operators of the family.
+            append: A boolean, indicating if the operators are appended to an existing file, whose incomplete
+                    trailing record (if any) is discarded.
+        """
+        self.path = path
+        if append and os.path.exists(path):
+            self.layout, self.count = DiscreteOperatorFamilyFile.read_header(path)
+            self.file = open(path, "r+b")
+            self.file.truncate(DiscreteOperatorFamilyFile.HEADER_SIZE + self.count * self.layout.record_bytes)
+        else:
+            if n is None:
+                raise Exception("The dimension of the finite chain is needed to create a family file.")
+            self.layout = DiscreteOperatorFamilyFile(n=n, symmetric=symmetric, boundary=boundary)
+            self.count = 0
+            self.file = open(path, "w+b")
+            self.file.write(self.layout.pack_header(self.count))
+
+    def __enter__(self) -> "DiscreteOperatorFamilyWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, matrices: numpy.ndarray):
+        """
+        Appends a stack of operators at the end of the file.
+
+        Args:
+            matrices: A numpy array of shape (K, n+1, n+1), representing the matrices of the operators.
+        """
+        records = self.layout.encode(matrices)
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(records.tobytes())
+        self.count += records.shape[0]
+
+        self.file.seek(0)
+        self.file.write(self.layout.pack_header(self.count))
+        self.file.flush()
+
+    def append_family(self, path: str, chunk_size: int = 65536):
+        """
+        Appends all the operators of another family file with the same layout, copying its records without decoding
+        them.
+
+        Args:
+            path: A string, representing the path of the family file to be appended.
+            chunk_size: An integer, representing the number of records copied at once.
+        """
+        layout, count = DiscreteOperatorFamilyFile.read_header(path)
+        if (layout.n, layout.symmetric, layout.boundary) != (self.layout.n, self.layout.symmetric,
+                                                             self.layout.boundary):
+            raise Exception("The layouts of the family files do not match.")
+
+        self.file.seek(0, os.SEEK_END)
+        with open(path, "rb") as source:
+            source.seek(DiscreteOperatorFamilyFile.HEADER_SIZE)
+            for start in range(0, count, chunk_size):
+                self.file.write(source.read(min(chunk_size, count - start) * layout.record_bytes))
+        self.count += count
+
+        self.file.seek(0)
+        self.file.write(self.layout.pack_header(self.count))
+        self.file.flush()
+
+    def close(self):
+        """
+        Synchronises the file with the disk and closes it.
+        """
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+
+class DiscreteOperatorFamilyReader:
+
+    def __init__(self, path: str):
+        """
+        Initializes the object that reads a family file. The records are memory-mapped, so the operators are decoded
+        only when they are accessed, and families larger than the memory can be scanned.
+
+        Args:
+            path: A string, representing the path of the file.
+        """
+        self.path = path
+        self.layout, self.count = DiscreteOperatorFamilyFile.read_header(path)
+        self.n = self.layout.n
+        self.records = numpy.memmap(path, dtype=numpy.uint8, mode="r", offset=DiscreteOperatorFamilyFile.HEADER_SIZE,
+                                    shape=(self.count, self.layout.record_bytes)) if self.count > 0 else \
+            numpy.zeros((0, self.layout.record_bytes), dtype=numpy.uint8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index) -> numpy.ndarray:
+        """
+        Decodes the operators of the given index, slice or array of indices.
+
+        Returns:
+            A numpy array of shape (n+1, n+1) if an integer is given, or of shape (K, n+1, n+1) otherwise.
+        """
+        if isinstance(index, (int, numpy.integer)):
+            if not -self.count <= index < self.count:
+                raise IndexError("The index is out of the range of the family.")
+            return self.layout.decode(self.records[index][None, :])[0]
+        return self.layout.decode(self.records[index])
+
+    def iterate_chunks(self, chunk_size: int = 65536, start: int = 0, stop: int = None) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Decodes the operators in chunks, in the order of the file.
+
+        Args:
+            chunk_size: An integer, representing the maximum number of operators of each chunk.
+            start: An integer, representing the index of the first operator.
+            stop: An integer, representing the index after the last operator. By default, the end of the family.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1).
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        for chunk_start in range(start, stop, chunk_size):
+            yield self.layout.decode(self.records[chunk_start:min(chunk_start + chunk_size, stop)])
+
+
+def save_operator_family(path: str, matrices: List[numpy.ndarray], n: int, symmetric: bool,
+                         boundary: FamilyBoundaryKind, chunk_size: int = 65536):
+    """
+    Saves a list of operators as a family file.
+
+    Args:
+        path: A string, representing the path of the file.
+        matrices: A list of numpy arrays, representing the matrices of the operators.
+        n: An integer, representing the size of the finite chain.
+        symmetric: A boolean, indicating if the operators of the family are symmetric.
+        boundary: A FamilyBoundaryKind, representing the boundary conditions of the operators of the family.
+        chunk_size: An integer, representing the number of operators encoded at once.
+    """
+    with DiscreteOperatorFamilyWriter(path, n=n, symmetric=symmetric, boundary=boundary) as writer:
+        for start in range(0, len(matrices), chunk_size):
+            writer.append(numpy.stack(matrices[start:start + chunk_size]))
+
+
+def load_operator_family(path: str) -> numpy.ndarray:
+    """
+    Loads all the operators of a family file.
+
+    Args:
+        path: A string, representing the path of the file.
+
+    Returns:
+        A numpy array of shape (K, n+1, n+1), representing the matrices of the operators.
+    """
+    return DiscreteOperatorFamilyReader(path)[:]
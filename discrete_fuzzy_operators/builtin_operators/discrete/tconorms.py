@@ -108,5 +108,24 @@ class TconormExamples(Enum):
 
     @staticmethod
     def __lukasiewicz_ordinal_sum(x: int, y: int, n: int, idempotent_elements: List[int]):
-        pass
+        """
+        Implementation of the discrete t-conorm given by the ordinal sum of Lukasiewicz t-conorms. If e < e' are
+        consecutive idempotent elements and x, y are in [e, e'], then S(x,y)=min(e', x+y-e); otherwise, S(x,y)=max(x,y).
+
+        Args:
+            x: An integer, representing the first coordinate of the evaluation point.
+            y: An integer, representing the second coordinate of the evaluation point.
+            n: n integer, representing the dimension of the domain where the t-norm is defined.
+            idempotent_elements: A list of integers, representing the idempotent elements of the t-conorm. The
+                                 elements 0 and n are always idempotent, so they may be omitted.
+
+        Returns:
+            An integer, representing the value of the t-conorm in the point (x,y).
+        """
+        a, b = min(x, y), max(x, y)
+        if any(a < element < b for element in idempotent_elements):
+            return b
+        lower = max([element for element in idempotent_elements if element <= a] + [0])
+        upper = min([element for element in idempotent_elements if element >= b] + [n])
+        return min(upper, a + b - lower)
 
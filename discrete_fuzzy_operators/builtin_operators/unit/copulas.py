@@ -24,12 +24,15 @@ class CopulaExamples(Enum):
         """
 
         if copula == CopulaExamples.FGM:
-            return FuzzyUnitCopula(lambda x, y: CopulaExamples.__fgm_copula(x=x, y=y, **kwargs))
+            return FuzzyUnitCopula(lambda x, y: CopulaExamples.__fgm_copula(x=x, y=y, **kwargs),
+                                   operator_array_expression=lambda x, y: CopulaExamples.__fgm_copula(x=x, y=y,
+                                                                                                      **kwargs))
 
     @staticmethod
     def __fgm_copula(x: float, y: float, k: float) -> float:
         """
-        Implementation of the Farlie-Gumbel-Morgenstern (FGM) copula
+        Implementation of the Farlie-Gumbel-Morgenstern (FGM) copula. Since it is a polynomial expression, it also
+        works with numpy arrays.
 
         Args:
             x: A float, representing the first argument of the copula.
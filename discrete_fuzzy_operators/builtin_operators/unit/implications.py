@@ -1,3 +1,4 @@
+import numpy
 from enum import Enum
 
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_implication_operator import \
@@ -33,27 +34,49 @@ class UnitImplicationExamples(Enum):
             A FuzzyUnitImplicationOperator object.
         """
         if implication == UnitImplicationExamples.LUKASIEWICZ:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__lukasiewicz_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__lukasiewicz_implication,
+                operator_array_expression=UnitImplicationExamples.__lukasiewicz_implication_array)
         elif implication == UnitImplicationExamples.GODEL:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__godel_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__godel_implication,
+                operator_array_expression=UnitImplicationExamples.__godel_implication_array)
         elif implication == UnitImplicationExamples.REICHENBACH:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__reichenbach_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__reichenbach_implication,
+                operator_array_expression=UnitImplicationExamples.__reichenbach_implication_array)
         elif implication == UnitImplicationExamples.KLEENE_DIENES:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__kleene_dienes_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__kleene_dienes_implication,
+                operator_array_expression=UnitImplicationExamples.__kleene_dienes_implication_array)
         elif implication == UnitImplicationExamples.GOGUEN:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__goguen_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__goguen_implication,
+                operator_array_expression=UnitImplicationExamples.__goguen_implication_array)
         elif implication == UnitImplicationExamples.RESCHER:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__rescher_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__rescher_implication,
+                operator_array_expression=UnitImplicationExamples.__rescher_implication_array)
         elif implication == UnitImplicationExamples.YAGER:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__yager_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__yager_implication,
+                operator_array_expression=UnitImplicationExamples.__yager_implication_array)
         elif implication == UnitImplicationExamples.WEBER:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__weber_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__weber_implication,
+                operator_array_expression=UnitImplicationExamples.__weber_implication_array)
         elif implication == UnitImplicationExamples.FODOR:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__fodor_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__fodor_implication,
+                operator_array_expression=UnitImplicationExamples.__fodor_implication_array)
         elif implication == UnitImplicationExamples.LEAST:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__least_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__least_implication,
+                operator_array_expression=UnitImplicationExamples.__least_implication_array)
         elif implication == UnitImplicationExamples.GREATEST:
-            return FuzzyUnitImplicationOperator(UnitImplicationExamples.__greatest_implication)
+            return FuzzyUnitImplicationOperator(
+                UnitImplicationExamples.__greatest_implication,
+                operator_array_expression=UnitImplicationExamples.__greatest_implication_array)
 
     @staticmethod
     def __lukasiewicz_implication(x: float, y: float) -> float:
@@ -232,3 +255,158 @@ class UnitImplicationExamples(Enum):
             return 1
         else:
             return 0
+
+    @staticmethod
+    def __lukasiewicz_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Lukasiewicz implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.minimum(1.0, 1.0 - x + y)
+
+    @staticmethod
+    def __godel_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Godel implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where(NumericComparator().less_equal(x, y), 1, y)
+
+    @staticmethod
+    def __reichenbach_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Reichenbach implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return 1 - x + x * y
+
+    @staticmethod
+    def __kleene_dienes_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Kleene-Dienes implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.maximum(1.0 - x, y)
+
+    @staticmethod
+    def __goguen_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Goguen implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        less_equal = x <= y
+        return numpy.where(less_equal, 1, y / numpy.where(less_equal, 1, x))
+
+    @staticmethod
+    def __rescher_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Rescher implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where(x <= y, 1, 0)
+
+    @staticmethod
+    def __yager_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Yager implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where((x == 0) & (y == 0), 1, y ** x)
+
+    @staticmethod
+    def __weber_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Weber implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where(x < 1, 1, y)
+
+    @staticmethod
+    def __fodor_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the Fodor implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where(x <= y, 1, numpy.maximum(1.0 - x, y))
+
+    @staticmethod
+    def __least_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the least implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where((x == 0) | (y == 1), 1, 0)
+
+    @staticmethod
+    def __greatest_implication_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the greatest implication.
+
+        Args:
+            x: A numpy array, representing the first arguments of the implication.
+            y: A numpy array, representing the second arguments of the implication.
+
+        Returns:
+            A numpy array, representing the values of the implication in the points (x,y).
+        """
+        return numpy.where((x < 1) | (y > 0), 1, 0)
@@ -1,3 +1,4 @@
+import numpy
 from enum import Enum
 from discrete_fuzzy_operators.base.operators.unary_operators.unit.suboperators.fuzzy_negation_operator import \
     FuzzyNegation
@@ -26,20 +27,26 @@ class NegationExamples(Enum):
             A FuzzyNegation object.
         """
         if negation == NegationExamples.CLASSIC:
-            return FuzzyNegation(operator_expression=NegationExamples.__classical_negation)
+            return FuzzyNegation(operator_expression=NegationExamples.__classical_negation,
+                                 operator_array_expression=NegationExamples.__classical_negation)
         elif negation == NegationExamples.LEAST:
-            return FuzzyNegation(operator_expression=NegationExamples.__least_negation)
+            return FuzzyNegation(operator_expression=NegationExamples.__least_negation,
+                                 operator_array_expression=NegationExamples.__least_negation_array)
         elif negation == NegationExamples.GREATEST:
-            return FuzzyNegation(operator_expression=NegationExamples.__greatest_negation)
+            return FuzzyNegation(operator_expression=NegationExamples.__greatest_negation,
+                                 operator_array_expression=NegationExamples.__greatest_negation_array)
         elif negation == NegationExamples.SUGENO:
-            return FuzzyNegation(operator_expression=lambda x: NegationExamples.__sugeno(x=x, **kwargs))
+            return FuzzyNegation(operator_expression=lambda x: NegationExamples.__sugeno(x=x, **kwargs),
+                                 operator_array_expression=lambda x: NegationExamples.__sugeno(x=x, **kwargs))
         elif negation == NegationExamples.YAGER:
-            return FuzzyNegation(operator_expression=lambda x: NegationExamples.__yager(x=x, **kwargs))
+            return FuzzyNegation(operator_expression=lambda x: NegationExamples.__yager(x=x, **kwargs),
+                                 operator_array_expression=lambda x: NegationExamples.__yager(x=x, **kwargs))
 
     @staticmethod
     def __classical_negation(x: float) -> float:
         """
-        Implementation of the classical fuzzy negation.
+        Implementation of the classical fuzzy negation. Since it is an arithmetic expression, it also works with numpy
+        arrays.
 
         Args:
             x: A float, representing the coordinate of the evaluation point.
@@ -116,3 +123,29 @@ class NegationExamples(Enum):
             raise Exception("To define a fuzzy negation in the yager's class, the parameter should be greater than 0.")
 
         return (1 - x ** k) ** (1 / k)
+
+    @staticmethod
+    def __least_negation_array(x: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the least fuzzy negation.
+
+        Args:
+            x: A numpy array, representing the coordinates of the evaluation points.
+
+        Returns:
+            A numpy array, representing the values of the negation in the points.
+        """
+        return numpy.where(x == 0, 1, 0)
+
+    @staticmethod
+    def __greatest_negation_array(x: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the greatest fuzzy negation.
+
+        Args:
+            x: A numpy array, representing the coordinates of the evaluation points.
+
+        Returns:
+            A numpy array, representing the values of the negation in the points.
+        """
+        return numpy.where(x == 1, 0, 1)
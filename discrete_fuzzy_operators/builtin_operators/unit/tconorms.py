@@ -1,3 +1,4 @@
+import numpy
 from enum import Enum
 
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_aggregation_suboperators.unit_tconorm import \
@@ -28,16 +29,20 @@ class UnitTconormExamples(Enum):
             FuzzyUnitTconorm object.
         """
         if tconorm == UnitTconormExamples.MAXIMUM:
-            return FuzzyUnitTconorm(UnitTconormExamples.__maximum_tconorm)
+            return FuzzyUnitTconorm(UnitTconormExamples.__maximum_tconorm,
+                                    operator_array_expression=UnitTconormExamples.__maximum_tconorm_array)
         elif tconorm == UnitTconormExamples.PROBABILISTICSUM:
-            return FuzzyUnitTconorm(UnitTconormExamples.__probabilisticsum_tconorm)
+            return FuzzyUnitTconorm(UnitTconormExamples.__probabilisticsum_tconorm,
+                                    operator_array_expression=UnitTconormExamples.__probabilisticsum_tconorm_array)
         elif tconorm == UnitTconormExamples.LUKASIEWICZ:
-            return FuzzyUnitTconorm(UnitTconormExamples.__lukasiewicz_tconorm)
+            return FuzzyUnitTconorm(UnitTconormExamples.__lukasiewicz_tconorm,
+                                    operator_array_expression=UnitTconormExamples.__lukasiewicz_tconorm_array)
         elif tconorm == UnitTconormExamples.DRASTICSUM:
-            return FuzzyUnitTconorm(UnitTconormExamples.__drasticsum_tconorm)
+            return FuzzyUnitTconorm(UnitTconormExamples.__drasticsum_tconorm,
+                                    operator_array_expression=UnitTconormExamples.__drasticsum_tconorm_array)
         elif tconorm == UnitTconormExamples.NILPOTENTMAXIMUM:
-            return FuzzyUnitTconorm(UnitTconormExamples.__nilpotentmaximum_tconorm)
-
+            return FuzzyUnitTconorm(UnitTconormExamples.__nilpotentmaximum_tconorm,
+                                    operator_array_expression=UnitTconormExamples.__nilpotentmaximum_tconorm_array)
 
     @staticmethod
     def __maximum_tconorm(x: float, y: float) -> float:
@@ -113,4 +118,74 @@ class UnitTconormExamples(Enum):
         if x+y >= 1:
             return 1
         else:
-            return max(x, y)
\ No newline at end of file
+            return max(x, y)
+
+    @staticmethod
+    def __maximum_tconorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the maximum tconorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tconorm.
+            y: A numpy array, representing the second arguments of the tconorm.
+
+        Returns:
+            A numpy array, representing the values of the tconorm in the points (x,y).
+        """
+        return numpy.maximum(x, y)
+
+    @staticmethod
+    def __probabilisticsum_tconorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the probabilistic sum tconorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tconorm.
+            y: A numpy array, representing the second arguments of the tconorm.
+
+        Returns:
+            A numpy array, representing the values of the tconorm in the points (x,y).
+        """
+        return x+y-x*y
+
+    @staticmethod
+    def __lukasiewicz_tconorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the lukasiewicz tconorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tconorm.
+            y: A numpy array, representing the second arguments of the tconorm.
+
+        Returns:
+            A numpy array, representing the values of the tconorm in the points (x,y).
+        """
+        return numpy.minimum(x+y, 1)
+
+    @staticmethod
+    def __drasticsum_tconorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the drastic sum tconorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tconorm.
+            y: A numpy array, representing the second arguments of the tconorm.
+
+        Returns:
+            A numpy array, representing the values of the tconorm in the points (x,y).
+        """
+        return numpy.where((x > 0) & (y > 0), 1, numpy.maximum(x, y))
+
+    @staticmethod
+    def __nilpotentmaximum_tconorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the nilpotent maximum tconorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tconorm.
+            y: A numpy array, representing the second arguments of the tconorm.
+
+        Returns:
+            A numpy array, representing the values of the tconorm in the points (x,y).
+        """
+        return numpy.where(x+y >= 1, 1, numpy.maximum(x, y))
@@ -1,3 +1,4 @@
+import numpy
 from enum import Enum
 
 from discrete_fuzzy_operators.base.operators.binary_operators.unit.suboperators.fuzzy_unit_aggregation_suboperators.unit_tnorm import \
@@ -28,15 +29,20 @@ class UnitTnormExamples(Enum):
             FuzzyUnitTnorm object.
         """
         if tnorm == UnitTnormExamples.MINIMUM:
-            return FuzzyUnitTnorm(UnitTnormExamples.__minimum_tnorm)
+            return FuzzyUnitTnorm(UnitTnormExamples.__minimum_tnorm,
+                                  operator_array_expression=UnitTnormExamples.__minimum_tnorm_array)
         elif tnorm == UnitTnormExamples.PRODUCT:
-            return FuzzyUnitTnorm(UnitTnormExamples.__product_tnorm)
+            return FuzzyUnitTnorm(UnitTnormExamples.__product_tnorm,
+                                  operator_array_expression=UnitTnormExamples.__product_tnorm_array)
         elif tnorm == UnitTnormExamples.LUKASIEWICZ:
-            return FuzzyUnitTnorm(UnitTnormExamples.__lukasiewicz_tnorm)
+            return FuzzyUnitTnorm(UnitTnormExamples.__lukasiewicz_tnorm,
+                                  operator_array_expression=UnitTnormExamples.__lukasiewicz_tnorm_array)
         elif tnorm == UnitTnormExamples.DRASTICPRODUCT:
-            return FuzzyUnitTnorm(UnitTnormExamples.__drasticproduct_tnorm)
+            return FuzzyUnitTnorm(UnitTnormExamples.__drasticproduct_tnorm,
+                                  operator_array_expression=UnitTnormExamples.__drasticproduct_tnorm_array)
         elif tnorm == UnitTnormExamples.NILPOTENTMINIMUM:
-            return FuzzyUnitTnorm(UnitTnormExamples.__nilpotentminimum_tnorm)
+            return FuzzyUnitTnorm(UnitTnormExamples.__nilpotentminimum_tnorm,
+                                  operator_array_expression=UnitTnormExamples.__nilpotentminimum_tnorm_array)
 
 
     @staticmethod
@@ -114,3 +120,73 @@ class UnitTnormExamples(Enum):
             return 0
         else:
             return min(x, y)
+
+    @staticmethod
+    def __minimum_tnorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the minimum tnorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tnorm.
+            y: A numpy array, representing the second arguments of the tnorm.
+
+        Returns:
+            A numpy array, representing the values of the tnorm in the points (x,y).
+        """
+        return numpy.minimum(x, y)
+
+    @staticmethod
+    def __product_tnorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the product tnorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tnorm.
+            y: A numpy array, representing the second arguments of the tnorm.
+
+        Returns:
+            A numpy array, representing the values of the tnorm in the points (x,y).
+        """
+        return x*y
+
+    @staticmethod
+    def __lukasiewicz_tnorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the lukasiewicz tnorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tnorm.
+            y: A numpy array, representing the second arguments of the tnorm.
+
+        Returns:
+            A numpy array, representing the values of the tnorm in the points (x,y).
+        """
+        return numpy.maximum(x+y-1, 0)
+
+    @staticmethod
+    def __drasticproduct_tnorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the drastic product tnorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tnorm.
+            y: A numpy array, representing the second arguments of the tnorm.
+
+        Returns:
+            A numpy array, representing the values of the tnorm in the points (x,y).
+        """
+        return numpy.where((x < 1) & (y < 1), 0, numpy.minimum(x, y))
+
+    @staticmethod
+    def __nilpotentminimum_tnorm_array(x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Array implementation of the nilpotent minimum tnorm.
+
+        Args:
+            x: A numpy array, representing the first arguments of the tnorm.
+            y: A numpy array, representing the second arguments of the tnorm.
+
+        Returns:
+            A numpy array, representing the values of the tnorm in the points (x,y).
+        """
+        return numpy.where(x+y <= 1, 0, numpy.minimum(x, y))
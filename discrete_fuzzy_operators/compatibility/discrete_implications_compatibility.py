@@ -0,0 +1,270 @@
+import numpy
+
+from concurrent.futures import ProcessPoolExecutor
+from discrete_fuzzy_operators.base.operators.binary_operators.discrete.fuzzy_discrete_binary_operator import \
+    DiscreteBinaryOperator
+from discrete_fuzzy_operators.base.operators.unary_operators.discrete.fuzzy_discrete_unary_operator import \
+    DiscreteUnaryOperator
+from typing import Callable, List, Union
+
+
+class DiscreteImplicationsCompatibility:
+
+    def __init__(self, n: int,
+                 implications: Union[List[DiscreteBinaryOperator], numpy.ndarray],
+                 t_norms: Union[List[DiscreteBinaryOperator], numpy.ndarray] = None,
+                 negations: Union[List[DiscreteUnaryOperator], numpy.ndarray] = None,
+                 workers: int = 1,
+                 chunk_size: int = 4096):
+        """
+        Initializes the object that checks, for whole families of operators at once, the compatibility properties of
+        discrete implications with respect to discrete t-norms and discrete negations (modus ponens, modus tollens and
+        contrapositive symmetry). Every family is stored as a stack of matrices (or vectors), so that each property is
+        evaluated for all the pairs with batched gathers instead of nested loops.
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            implications: A list of discrete binary operators or a numpy array of shape (A, n+1, n+1), representing the
+                          family of implications.
+            t_norms: A list of discrete binary operators or a numpy array of shape (T, n+1, n+1), representing the
+                     family of t-norms.
+            negations: A list of discrete unary operators or a numpy array of shape (N, n+1), representing the family
+                       of negations.
+            workers: An integer, representing the number of processes among which the implications are sharded. By
+                     default, the computation is carried out in the current process.
+            chunk_size: An integer, representing the maximum number of combinations of operators (pairs or triples)
+                        evaluated together in each batched gather. The intermediate arrays contain at most chunk_size
+                        matrices of shape (n+1, n+1), so it bounds the memory used by the computation.
+        """
+        self.n = n
+        self.implications = DiscreteImplicationsCompatibility.stack_binary_operators(n, implications)
+        self.t_norms = None if t_norms is None else DiscreteImplicationsCompatibility.stack_binary_operators(n, t_norms)
+        self.negations = None if negations is None else DiscreteImplicationsCompatibility.stack_unary_operators(n, negations)
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    # region Stacking of the families
+    @staticmethod
+    def stack_binary_operators(n: int, operators: Union[List[DiscreteBinaryOperator], numpy.ndarray]) -> numpy.ndarray:
+        """
+        Converts a family of discrete binary operators into a stack of matrices.
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            operators: A list of discrete binary operators or a numpy array of shape (K, n+1, n+1).
+
+        Returns:
+            A numpy array of shape (K, n+1, n+1), containing the matrix expression of each operator.
+        """
+        if isinstance(operators, numpy.ndarray):
+            stack = operators
+        else:
+            stack = numpy.array([operator.operator_matrix for operator in operators])
+
+        if not (stack.ndim == 3 and stack.shape[1] == stack.shape[2] == n + 1):
+            raise Exception("The family of binary operators must be a stack of matrices of shape (K, n+1, n+1).")
+        return stack.astype(numpy.intp, copy=False)
+
+    @staticmethod
+    def stack_unary_operators(n: int, operators: Union[List[DiscreteUnaryOperator], numpy.ndarray]) -> numpy.ndarray:
+        """
+        Converts a family of discrete unary operators into a stack of vectors.
+
+        Args:
+            n: An integer, representing the size of the finite chain.
+            operators: A list of discrete unary operators or a numpy array of shape (K, n+1).
+
+        Returns:
+            A numpy array of shape (K, n+1), containing the vector expression of each operator.
+        """
+        if isinstance(operators, numpy.ndarray):
+            stack = operators
+        else:
+            stack = numpy.array([operator.operator_vector for operator in operators])
+
+        if not (stack.ndim == 2 and stack.shape[1] == n + 1):
+            raise Exception("The family of unary operators must be a stack of vectors of shape (K, n+1).")
+        return stack.astype(numpy.intp, copy=False)
+    # endregion
+
+    # region Compatibility tables
+    def modus_ponens_table(self) -> numpy.ndarray:
+        """
+        Computes, for each implication I and each t-norm T of the families, if I satisfies the modus ponens with
+        respect to T; that is, if T(x,I(x,y)) <= y for all x,y in L.
+
+        Returns:
+            A boolean numpy array of shape (A, T), whose entry (a, t) indicates if the a-th implication satisfies the
+            modus ponens with respect to the t-th t-norm.
+        """
+        if self.t_norms is None:
+            raise Exception("To compute the modus ponens table, the family of t-norms must be provided.")
+        return self.__sharded_table(modus_ponens_table, self.t_norms)
+
+    def modus_tollens_table(self) -> numpy.ndarray:
+        """
+        Computes, for each implication I, each t-norm T and each negation N of the families, if I satisfies the modus
+        tollens with respect to T and N; that is, if T(N(y),I(x,y)) <= N(x) for all x,y in L.
+
+        Returns:
+            A boolean numpy array of shape (A, T, N), whose entry (a, t, k) indicates if the a-th implication satisfies
+            the modus tollens with respect to the t-th t-norm and the k-th negation.
+        """
+        if self.t_norms is None or self.negations is None:
+            raise Exception("To compute the modus tollens table, the families of t-norms and negations must be "
+                            "provided.")
+        return self.__sharded_table(modus_tollens_table, self.t_norms, self.negations)
+
+    def contrapositive_symmetry_table(self) -> numpy.ndarray:
+        """
+        Computes, for each implication I and each negation N of the families, if I satisfies the contrapositive
+        symmetry with respect to N; that is, if I(x,y)=I(N(y),N(x)) for all x,y in L.
+
+        Returns:
+            A boolean numpy array of shape (A, N), whose entry (a, k) indicates if the a-th implication satisfies the
+            contrapositive symmetry with respect to the k-th negation.
+        """
+        if self.negations is None:
+            raise Exception("To compute the contrapositive symmetry table, the family of negations must be provided.")
+        return self.__sharded_table(contrapositive_symmetry_table, self.negations)
+
+    def __sharded_table(self, table_function: Callable, *families: numpy.ndarray) -> numpy.ndarray:
+        """
+        Splits the family of implications in shards, computes the table of each shard (in a pool of processes if more
+        than one worker is requested) and concatenates the results following the order of the implications.
+
+        Args:
+            table_function: A callable method, computing the table of a stack of implications.
+            *families: The stacks of the remaining operators involved in the property.
+
+        Returns:
+            A boolean numpy array, whose first axis corresponds to the family of implications.
+        """
+        if self.workers <= 1 or self.implications.shape[0] <= 1:
+            return table_function(self.implications, *families, chunk_size=self.chunk_size)
+
+        shards = numpy.array_split(self.implications, min(self.workers, self.implications.shape[0]))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(table_function, shard, *families, chunk_size=self.chunk_size)
+                       for shard in shards]
+            return numpy.concatenate([future.result() for future in futures], axis=0)
+    # endregion
+
+
+def modus_ponens_table(implications: numpy.ndarray, t_norms: numpy.ndarray, chunk_size: int = 4096) -> numpy.ndarray:
+    """
+    Computes the modus ponens table of a stack of implications with respect to a stack of t-norms. The matrices follow
+    the convention of the library, where the entry [y, x] contains the value of the operator in the point (x,y).
+
+    Args:
+        implications: A numpy array of shape (A, n+1, n+1), representing the implications.
+        t_norms: A numpy array of shape (T, n+1, n+1), representing the t-norms.
+        chunk_size: An integer, representing the maximum number of pairs (implication, t-norm) evaluated together.
+
+    Returns:
+        A boolean numpy array of shape (A, T).
+    """
+    size = implications.shape[1]
+    x = numpy.arange(size)
+    implications_block, t_norms_block = __compute_block_sizes(chunk_size, implications.shape[0], t_norms.shape[0])
+
+    table = numpy.zeros((implications.shape[0], t_norms.shape[0]), dtype=bool)
+    for a_start in range(0, implications.shape[0], implications_block):
+        chunk = implications[a_start:a_start + implications_block, None, :, :]
+        for t_start in range(0, t_norms.shape[0], t_norms_block):
+            t_chunk = t_norms[t_start:t_start + t_norms_block]
+            t_index = numpy.arange(t_chunk.shape[0])[None, :, None, None]
+            # T(x, I(x,y)) is stored in T[I(x,y), x].
+            composition = t_chunk[t_index, chunk, x[None, None, None, :]]
+            table[a_start:a_start + implications_block, t_start:t_start + t_norms_block] = \
+                (composition <= x[None, None, :, None]).all(axis=(2, 3))
+    return table
+
+
+def modus_tollens_table(implications: numpy.ndarray, t_norms: numpy.ndarray, negations: numpy.ndarray,
+                        chunk_size: int = 4096) -> numpy.ndarray:
+    """
+    Computes the modus tollens table of a stack of implications with respect to a stack of t-norms and a stack of
+    negations.
+
+    Args:
+        implications: A numpy array of shape (A, n+1, n+1), representing the implications.
+        t_norms: A numpy array of shape (T, n+1, n+1), representing the t-norms.
+        negations: A numpy array of shape (N, n+1), representing the negations.
+        chunk_size: An integer, representing the maximum number of triples (implication, t-norm, negation) evaluated
+                    together.
+
+    Returns:
+        A boolean numpy array of shape (A, T, N).
+    """
+    implications_block, t_norms_block, negations_block = __compute_block_sizes(
+        chunk_size, implications.shape[0], t_norms.shape[0], negations.shape[0])
+
+    table = numpy.zeros((implications.shape[0], t_norms.shape[0], negations.shape[0]), dtype=bool)
+    for a_start in range(0, implications.shape[0], implications_block):
+        chunk = implications[a_start:a_start + implications_block, None, None, :, :]
+        for t_start in range(0, t_norms.shape[0], t_norms_block):
+            t_chunk = t_norms[t_start:t_start + t_norms_block]
+            t_index = numpy.arange(t_chunk.shape[0])[None, :, None, None, None]
+            for k_start in range(0, negations.shape[0], negations_block):
+                negations_chunk = negations[k_start:k_start + negations_block]
+                # T(N(y), I(x,y)) is stored in T[I(x,y), N(y)].
+                composition = t_chunk[t_index, chunk, negations_chunk[None, None, :, :, None]]
+                table[a_start:a_start + implications_block, t_start:t_start + t_norms_block,
+                      k_start:k_start + negations_block] = \
+                    (composition <= negations_chunk[None, None, :, None, :]).all(axis=(3, 4))
+    return table
+
+
+def contrapositive_symmetry_table(implications: numpy.ndarray, negations: numpy.ndarray,
+                                  chunk_size: int = 4096) -> numpy.ndarray:
+    """
+    Computes the contrapositive symmetry table of a stack of implications with respect to a stack of negations.
+
+    Args:
+        implications: A numpy array of shape (A, n+1, n+1), representing the implications.
+        negations: A numpy array of shape (N, n+1), representing the negations.
+        chunk_size: An integer, representing the maximum number of pairs (implication, negation) evaluated together.
+
+    Returns:
+        A boolean numpy array of shape (A, N).
+    """
+    implications_block, negations_block = __compute_block_sizes(chunk_size, implications.shape[0], negations.shape[0])
+
+    table = numpy.zeros((implications.shape[0], negations.shape[0]), dtype=bool)
+    for a_start in range(0, implications.shape[0], implications_block):
+        chunk = implications[a_start:a_start + implications_block]
+        a_index = numpy.arange(chunk.shape[0])[:, None, None, None]
+        for k_start in range(0, negations.shape[0], negations_block):
+            negations_chunk = negations[k_start:k_start + negations_block]
+            # I(N(y), N(x)) is stored in I[N(x), N(y)].
+            contrapositive = chunk[a_index, negations_chunk[None, :, None, :], negations_chunk[None, :, :, None]]
+            table[a_start:a_start + implications_block, k_start:k_start + negations_block] = \
+                (contrapositive == chunk[:, None, :, :]).all(axis=(2, 3))
+    return table
+
+
+def __compute_block_sizes(chunk_size: int, *family_sizes: int) -> List[int]:
+    """
+    Splits the number of combinations evaluated together among the families involved in a property. The last family
+    takes as many operators as possible, and the remaining ones are filled from right to left, so that the product of
+    the block sizes never exceeds chunk_size (unless it is lower than 1) and the intermediate arrays are bounded by
+    chunk_size matrices.
+
+    Args:
+        chunk_size: An integer, representing the maximum number of combinations of operators evaluated together.
+        *family_sizes: The number of operators of each family.
+
+    Returns:
+        A list of integers, representing the size of the blocks of each family.
+    """
+    if chunk_size < 1:
+        raise Exception("The size of the chunks must be positive.")
+
+    block_sizes = []
+    remaining = chunk_size
+    for family_size in reversed(family_sizes):
+        block_size = max(1, min(family_size, remaining))
+        block_sizes.append(block_size)
+        remaining = max(1, remaining // block_size)
+    return block_sizes[::-1]
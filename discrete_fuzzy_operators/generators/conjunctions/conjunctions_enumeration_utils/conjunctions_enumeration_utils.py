@@ -0,0 +1,138 @@
+import numpy
+from numba import jit
+
+
+def enumerate_conjunctions(matrix: numpy.ndarray, lower_bounds: numpy.ndarray, upper_bounds: numpy.ndarray,
+                           state: numpy.ndarray, output: numpy.ndarray, limit: int) -> int:
+    """
+    Enumerates the discrete conjunctions in the lexicographic order of their inner cells, read in row-major order,
+    modifying a single matrix in place. The value of each cell is restricted to the given bounds, which fix the cell
+    (n, n) to n and may enforce additional constraints.
+
+    Since the bounds are increasing, any partial matrix between the bounds can be completed. Hence, the successor of a
+    conjunction is obtained by incrementing the last cell whose value is smaller than its upper bound, and filling the
+    next cells with their smallest admissible values, max(C(x-1,y), C(x,y-1)) or their lower bound.
+
+    The enumeration stops when the given number of conjunctions has been written, and it can be resumed calling
+    again the function with the same matrix and state.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the current conjunction.
+        lower_bounds: A numpy array of shape (n+1, n+1), representing the increasing lower bounds of the cells.
+        upper_bounds: A numpy array of shape (n+1, n+1), representing the increasing upper bounds of the cells.
+        state: A numpy array of shape (1,), containing 0 if the current conjunction has not been written yet, 1 if it
+               has already been written, or -1 if the enumeration has finished.
+        output: A numpy array of shape (K, n+1, n+1), where the conjunctions are written.
+        limit: An integer, representing the maximum number of conjunctions to be written, with limit <= K.
+
+    Returns:
+        An integer, representing the number of conjunctions written in the output buffer.
+    """
+    size = matrix.shape[0]
+    n = size - 1
+    generated = 0
+
+    while generated < limit and state[0] >= 0:
+        if state[0] == 1:
+            # The position p corresponds to the cell (p // n + 1, p % n + 1).
+            position = n * n - 1
+            while position >= 0 and matrix[position // n + 1, position % n + 1] == \
+                    upper_bounds[position // n + 1, position % n + 1]:
+                position -= 1
+            if position < 0:
+                state[0] = -1
+                break
+
+            matrix[position // n + 1, position % n + 1] += 1
+            for next_position in range(position + 1, n * n):
+                x = next_position // n + 1
+                y = next_position % n + 1
+                matrix[x, y] = max(matrix[x - 1, y], matrix[x, y - 1], lower_bounds[x, y])
+
+        for i in range(0, size):
+            for j in range(0, size):
+                output[generated, i, j] = matrix[i, j]
+        generated += 1
+        state[0] = 1
+
+    return generated
+
+
+enumerate_conjunctions_compiled = jit(nopython=True)(enumerate_conjunctions)
+
+
+def generate_upper_triangle_cells(n: int) -> numpy.ndarray:
+    """
+    Computes the inner cells (x, y) of the upper triangle of the matrix of a commutative conjunction, with
+    1 <= x <= y <= n, in row-major order.
+
+    Args:
+        n: An integer, representing the dimension of the finite chain.
+
+    Returns:
+        A numpy array of shape (m, 2), whose rows are the cells.
+    """
+    return numpy.array([(x, y) for x in range(1, n + 1) for y in range(x, n + 1)],
+                       dtype=numpy.int64).reshape(-1, 2)
+
+
+def enumerate_commutative_conjunctions(matrix: numpy.ndarray, cells: numpy.ndarray, lower_bounds: numpy.ndarray,
+                                       upper_bounds: numpy.ndarray, state: numpy.ndarray, output: numpy.ndarray,
+                                       limit: int) -> int:
+    """
+    Enumerates the commutative discrete conjunctions in the lexicographic order of the cells of their upper triangle,
+    modifying a single symmetric matrix in place. Each value assigned to a cell (x, y) is mirrored to (y, x), so the
+    lower bound max(C(x-1,y), C(x,y-1)) of a cell also takes into account the cells of the lower triangle.
+
+    As in enumerate_conjunctions, the successor of a commutative conjunction is obtained by incrementing the last cell
+    whose value is smaller than its upper bound and filling the next cells with their smallest admissible values.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the current commutative conjunction.
+        cells: A numpy array of shape (m, 2), representing the cells of the upper triangle, in the order given by
+               generate_upper_triangle_cells.
+        lower_bounds: A numpy array of shape (n+1, n+1), representing the symmetric and increasing lower bounds of
+                      the cells.
+        upper_bounds: A numpy array of shape (n+1, n+1), representing the symmetric and increasing upper bounds of
+                      the cells.
+        state: A numpy array of shape (1,), containing 0 if the current conjunction has not been written yet, 1 if it
+               has already been written, or -1 if the enumeration has finished.
+        output: A numpy array of shape (K, n+1, n+1), where the commutative conjunctions are written.
+        limit: An integer, representing the maximum number of conjunctions to be written, with limit <= K.
+
+    Returns:
+        An integer, representing the number of commutative conjunctions written in the output buffer.
+    """
+    size = matrix.shape[0]
+    generated = 0
+
+    while generated < limit and state[0] >= 0:
+        if state[0] == 1:
+            position = cells.shape[0] - 1
+            while position >= 0 and matrix[cells[position, 0], cells[position, 1]] == \
+                    upper_bounds[cells[position, 0], cells[position, 1]]:
+                position -= 1
+            if position < 0:
+                state[0] = -1
+                break
+
+            x = cells[position, 0]
+            y = cells[position, 1]
+            matrix[x, y] += 1
+            matrix[y, x] = matrix[x, y]
+            for next_position in range(position + 1, cells.shape[0]):
+                x = cells[next_position, 0]
+                y = cells[next_position, 1]
+                matrix[x, y] = max(matrix[x - 1, y], matrix[x, y - 1], lower_bounds[x, y])
+                matrix[y, x] = matrix[x, y]
+
+        for i in range(0, size):
+            for j in range(0, size):
+                output[generated, i, j] = matrix[i, j]
+        generated += 1
+        state[0] = 1
+
+    return generated
+
+
+enumerate_commutative_conjunctions_compiled = jit(nopython=True)(enumerate_commutative_conjunctions)
@@ -0,0 +1,104 @@
+import numpy
+
+from math import comb
+from typing import List
+
+
+def bareiss_determinant(matrix: List[List[int]]) -> int:
+    """
+    Computes the determinant of a square matrix of integers with the fraction-free Bareiss algorithm, so that all the
+    intermediate values are exact integers.
+
+    Args:
+        matrix: A list of lists of integers, representing the square matrix. It is not modified.
+
+    Returns:
+        An integer, representing the determinant of the matrix.
+    """
+    size = len(matrix)
+    if size == 0:
+        return 1
+
+    matrix = [list(row) for row in matrix]
+    sign = 1
+    previous_pivot = 1
+    for k in range(0, size - 1):
+        if matrix[k][k] == 0:
+            swap = next((i for i in range(k + 1, size) if matrix[i][k] != 0), None)
+            if swap is None:
+                return 0
+            matrix[k], matrix[swap] = matrix[swap], matrix[k]
+            sign = -sign
+        for i in range(k + 1, size):
+            for j in range(k + 1, size):
+                matrix[i][j] = (matrix[i][j] * matrix[k][k] - matrix[i][k] * matrix[k][j]) // previous_pivot
+        previous_pivot = matrix[k][k]
+    return sign * matrix[size - 1][size - 1]
+
+
+def count_monotone_column_families(starts: List[int], lower_bounds: List[int], n: int, upper_bound: int) -> int:
+    """
+    Counts the families of columns c_1, ..., c_n such that the column c_j takes values in the rows starts[j-1]+1, ...,
+    n, is increasing and bounded by lower_bounds[j-1] and upper_bound, and c_j <= c_{j+1} in the common rows.
+
+    Each column is a lattice path from (starts[j-1], lower_bounds[j-1]) to (n, upper_bound), whose horizontal steps
+    are placed at the heights given by the values of the column. Shifting the j-th path by (-j, j), the condition
+    c_j <= c_{j+1} is equivalent to the paths being non-intersecting, and the families are counted with the
+    Lindström-Gessel-Viennot lemma.
+
+    Args:
+        starts: A list of integers, representing the number of rows already fixed in each column.
+        lower_bounds: A list of integers, representing the lower bound of the values of each column.
+        n: An integer, representing the number of rows and columns.
+        upper_bound: An integer, representing the upper bound of the values of the columns.
+
+    Returns:
+        An integer, representing the number of families of columns.
+    """
+    path_matrix = []
+    for i in range(1, n + 1):
+        row = []
+        for j in range(1, n + 1):
+            horizontal_steps = (n - j) - (starts[i - 1] - i)
+            vertical_steps = (upper_bound + j) - (lower_bounds[i - 1] + i)
+            if horizontal_steps < 0 or vertical_steps < 0:
+                row.append(0)
+            else:
+                row.append(comb(horizontal_steps + vertical_steps, horizontal_steps))
+        path_matrix.append(row)
+    return bareiss_determinant(path_matrix)
+
+
+def count_conjunction_completions(matrix: numpy.ndarray, n: int, x: int, y: int) -> int:
+    """
+    Counts the discrete conjunctions over the finite chain Ln whose matrix coincides with the given one in the cells
+    up to (x, y) in the row-major order of the inner cells; that is, in the rows 1, ..., x-1 and in the cells (x, 1),
+    ..., (x, y).
+
+    The remaining cells of each column form an increasing column bounded below by the last fixed cell of the column
+    and, in the row x, by the cell (x, y). The conjunctions are the increasing matrices whose maximum, C(n,n), is
+    equal to n, so they are counted as the difference between the families bounded by n and by n-1.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the partially filled matrix of the conjunction, with
+                zeros in the first row and column.
+        n: An integer, representing the dimension of the finite chain.
+        x: An integer, representing the row of the last fixed cell, in [1, n].
+        y: An integer, representing the column of the last fixed cell, in [0, n]. If y=0, only the rows before x are
+           fixed.
+
+    Returns:
+        An integer, representing the number of conjunctions.
+    """
+    starts = []
+    lower_bounds = []
+    for j in range(1, n + 1):
+        if j <= y:
+            starts.append(x)
+            lower_bounds.append(int(matrix[x, j]))
+        else:
+            starts.append(x - 1)
+            lower_bounds.append(max(int(matrix[x - 1, j]), int(matrix[x, y])))
+
+    return count_monotone_column_families(starts, lower_bounds, n, n) - \
+        count_monotone_column_families(starts, lower_bounds, n, n - 1)
@@ -1,6 +1,140 @@
 import numpy
 
+from discrete_fuzzy_operators.base.generators.discrete_operator_constraint import DiscreteOperatorConstraint
 from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
-from typing import Generator, List
+from discrete_fuzzy_operators.counters.conjunctions.discrete_commutative_conjunctions_counter import \
+    DiscreteCommutativeConjunctionsCounter
+from discrete_fuzzy_operators.generators.conjunctions.conjunctions_enumeration_utils.conjunctions_enumeration_utils \
+    import enumerate_commutative_conjunctions, enumerate_commutative_conjunctions_compiled, \
+    generate_upper_triangle_cells
+from typing import Generator, Iterable
 
 
+class DiscreteCommutativeConjunctionsRecursiveGenerator(DiscreteOperatorGenerator):
+
+    def __init__(self, n: int, use_numba: bool = True, constraints: Iterable[DiscreteOperatorConstraint] = None):
+        """
+        Initializes the object that generates all possible commutative discrete conjunctions over the finite chain Ln.
+
+        Only the cells of the upper triangle are enumerated, in the lexicographic order of the cells (x, y) with
+        x <= y read in row-major order, and each value is mirrored to the lower triangle, so the commutative
+        conjunctions are generated directly instead of filtering all the discrete conjunctions.
+
+        The commutative conjunctions are enumerated by modifying a single matrix in place and copying it into batch
+        buffers. The enumeration is resumable: each call to next_batch continues from the point where the previous
+        one stopped.
+
+        If some constraints are given, they are enforced as bounds of the cells while the matrix is filled. Since the
+        matrix is symmetric, the bounds of the cells (x, y) and (y, x) are combined.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+            use_numba: A boolean, indicating if the enumeration kernel is compiled with numba.
+            constraints: An iterable of DiscreteOperatorConstraint values, representing the properties that the
+                         generated commutative conjunctions must satisfy. Optional.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive to define a discrete conjunction.")
+
+        super(DiscreteCommutativeConjunctionsRecursiveGenerator, self).__init__(n, constraints)
+        self.n = n
+        self.dtype = numpy.min_scalar_type(n)
+        self.cells = generate_upper_triangle_cells(n)
+
+        lower_bounds = numpy.zeros((n + 1, n + 1), dtype=numpy.int64)
+        lower_bounds[n, n] = n
+        upper_bounds = numpy.full((n + 1, n + 1), n, dtype=numpy.int64)
+        upper_bounds[0, :] = 0
+        upper_bounds[:, 0] = 0
+        lower_bounds, upper_bounds = DiscreteOperatorConstraint.compute_cell_bounds(
+            constraints=self.constraints, n=n, lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+        self.lower_bounds = numpy.maximum(lower_bounds, lower_bounds.T)
+        self.upper_bounds = numpy.minimum(upper_bounds, upper_bounds.T)
+        self.enumeration_kernel = enumerate_commutative_conjunctions_compiled if use_numba else \
+            enumerate_commutative_conjunctions
+        self.matrix = None
+        self.__state = None
+        self.reset()
+
+    def reset(self):
+        """
+        Restarts the enumeration from the first commutative conjunction, which is given by the lower bounds of the
+        cells; without constraints, its inner cells are all zero except C(n,n)=n.
+        """
+        self.matrix = self.lower_bounds.copy()
+        self.__state = numpy.array([0 if (self.lower_bounds <= self.upper_bounds).all() else -1], dtype=numpy.int64)
+
+    def is_exhausted(self) -> bool:
+        """
+        Checks if all the commutative conjunctions have already been generated.
+        """
+        return self.__state[0] < 0
+
+    def count_operators(self) -> int:
+        """
+        Counts the number of commutative discrete conjunctions defined over the finite chain Ln.
+
+        Returns:
+            An integer, representing the cardinality of the set of commutative discrete conjunctions.
+        """
+        if self.constraints:
+            return sum(batch.shape[0] for batch in
+                       DiscreteCommutativeConjunctionsRecursiveGenerator(n=self.n, constraints=self.constraints)
+                       .generate_batches())
+        return DiscreteCommutativeConjunctionsCounter(self.n).count_operators()
+
+    def next_batch(self, batch_size: int = 65536, output: numpy.ndarray = None) -> numpy.ndarray:
+        """
+        Generates the next commutative conjunctions of the enumeration.
+
+        Args:
+            batch_size: An integer, representing the maximum number of commutative conjunctions to be generated. It is
+                        ignored if an output buffer is given.
+            output: A numpy array of shape (K, n+1, n+1), where the commutative conjunctions are written. Optional;
+                    if it is not given, a new buffer is allocated.
+
+        Returns:
+            A numpy array of shape (K', n+1, n+1), with K' <= K, which is a view of the output buffer containing the
+            generated commutative conjunctions. It is empty if the enumeration has finished.
+        """
+        if output is None:
+            if batch_size < 1:
+                raise Exception("The size of the blocks must be positive.")
+            output = numpy.empty((batch_size, self.n + 1, self.n + 1), dtype=self.dtype)
+        elif output.ndim != 3 or output.shape[1:] != (self.n + 1, self.n + 1):
+            raise Exception("The output buffer must have shape (K, n+1, n+1).")
+
+        if self.is_exhausted():
+            return output[:0]
+
+        generated = self.enumeration_kernel(self.matrix, self.cells, self.lower_bounds, self.upper_bounds,
+                                            self.__state, output, output.shape[0])
+        return output[:generated]
+
+    def generate_batches(self, batch_size: int = 65536) -> Generator[numpy.ndarray, None, None]:
+        """
+        Generates the remaining commutative conjunctions of the enumeration in blocks.
+
+        Args:
+            batch_size: An integer, representing the maximum number of commutative conjunctions of each block.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1), whose elements are the symmetric matrices of the
+            commutative conjunctions.
+        """
+        while not self.is_exhausted():
+            batch = self.next_batch(batch_size)
+            if batch.shape[0] > 0:
+                yield batch
+
+    def generate_operators(self) -> Generator:
+        """
+        Generates all possible commutative discrete conjunctions defined over the finite chain Ln.
+
+        Returns:
+            A Generator of read-only numpy arrays, representing the symmetric matrices of the commutative conjunctions.
+        """
+        self.reset()
+        for batch in self.generate_batches():
+            batch.flags.writeable = False
+            yield from batch
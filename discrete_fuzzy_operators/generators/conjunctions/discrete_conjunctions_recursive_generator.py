@@ -1,148 +1,284 @@
 import numpy
 
+from discrete_fuzzy_operators.base.generators.discrete_operator_constraint import DiscreteOperatorConstraint
 from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
-from typing import Generator, List
+from discrete_fuzzy_operators.generators.conjunctions.conjunctions_enumeration_utils.conjunctions_enumeration_utils \
+    import enumerate_conjunctions, enumerate_conjunctions_compiled
+from discrete_fuzzy_operators.generators.conjunctions.conjunctions_ranking_utils.conjunctions_ranking_utils import \
+    count_conjunction_completions
+from discrete_fuzzy_operators.generators.samplers.discrete_operators_uniform_sampler import \
+    DiscreteOperatorsUniformSampler
+from typing import Generator, Iterable, Tuple
 
 
 class DiscreteConjunctionsRecursiveGenerator(DiscreteOperatorGenerator):
 
-    def __init__(self, n: int):
+    def __init__(self, n: int, use_numba: bool = True, constraints: Iterable[DiscreteOperatorConstraint] = None):
         """
         Initializes the object that generates all possible discrete conjunctions over the finite chain Ln.
 
+        The conjunctions are sorted in the lexicographic order of their inner cells (x, y), with x, y in [1, n], read in
+        row-major order. The number of conjunctions which share the cells up to a given one is computed exactly, so the
+        index of a conjunction in this order can be computed without enumerating the previous ones, and vice versa.
+        Hence, any range of indices can be generated directly, and disjoint ranges can be assigned to different
+        processes.
+
+        The conjunctions are enumerated by modifying a single matrix in place and copying it into batch buffers. The
+        enumeration is resumable: each call to next_batch continues from the point where the previous one stopped.
+
+        If some constraints are given, they are translated into bounds of the cells, which are enforced while the
+        matrix is filled, so only the conjunctions which satisfy them are explored. In this case, the conjunctions are
+        generated in the same order, but they can only be enumerated from the first one, and they are counted by
+        enumerating them.
+
         Args:
             n: An integer, representing the dimension of the finite chain.
+            use_numba: A boolean, indicating if the enumeration kernel is compiled with numba.
+            constraints: An iterable of DiscreteOperatorConstraint values, representing the properties that the
+                         generated conjunctions must satisfy. Optional.
         """
-        super(DiscreteConjunctionsRecursiveGenerator, self).__init__(n)
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive to define a discrete conjunction.")
+
+        super(DiscreteConjunctionsRecursiveGenerator, self).__init__(n, constraints)
         self.n = n
+        self.cells = [(x, y) for x in range(1, n + 1) for y in range(1, n + 1)]
 
-    def generate_operators(self) -> Generator:
+        # The first row and column are zero and C(n,n)=n; the rest of the cells take values in Ln.
+        lower_bounds = numpy.zeros((n + 1, n + 1), dtype=numpy.int64)
+        lower_bounds[n, n] = n
+        upper_bounds = numpy.full((n + 1, n + 1), n, dtype=numpy.int64)
+        upper_bounds[0, :] = 0
+        upper_bounds[:, 0] = 0
+        self.lower_bounds, self.upper_bounds = DiscreteOperatorConstraint.compute_cell_bounds(
+            constraints=self.constraints, n=n, lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+
+        self.number_of_conjunctions = None
+        if not self.constraints:
+            self.number_of_conjunctions = count_conjunction_completions(
+                matrix=numpy.zeros((n + 1, n + 1), dtype=int), n=n, x=1, y=0)
+        self.dtype = numpy.min_scalar_type(n)
+        self.enumeration_kernel = enumerate_conjunctions_compiled if use_numba else enumerate_conjunctions
+        self.matrix = None
+        self.index = None
+        self.__state = None
+        self.reset()
+
+    def count_operators(self) -> int:
         """
-        Generates recursively all possible discrete conjunctions defined over the finite chain Ln.
+        Counts the number of discrete conjunctions defined over the finite chain Ln.
 
         Returns:
-            A Generator of numpy arrays, representing the object that recursively generates all possible conjunctions.
+            An integer, representing the cardinality of the set of discrete conjunctions.
         """
-        return self.__recursive_conjunction_generator(n=self.n)
+        if self.number_of_conjunctions is None:
+            matrix, state = self.__initial_state()
+            output = numpy.empty((65536, self.n + 1, self.n + 1), dtype=self.dtype)
+            count = 0
+            while state[0] >= 0:
+                count += self.enumeration_kernel(matrix, self.lower_bounds, self.upper_bounds, state, output,
+                                                 output.shape[0])
+            self.number_of_conjunctions = count
+        return self.number_of_conjunctions
 
-    @staticmethod
-    def __recursive_conjunction_generator(n: int, k: int = 1, previous_conjunction_matrix: numpy.ndarray = None) -> Generator[numpy.ndarray, None, None]:
+    def reset(self, start: int = 0):
+        """
+        Restarts the enumeration from the conjunction of a given index.
+
+        Args:
+            start: An integer, representing the index of the next conjunction to be generated.
+        """
+        if self.constraints and start != 0:
+            raise Exception("The conjunctions which satisfy some constraints can only be generated from the first one.")
+        if self.number_of_conjunctions is not None and not 0 <= start <= self.number_of_conjunctions:
+            raise Exception("The index must be contained in the set of indices of the conjunctions.")
+
+        self.index = start
+        if self.constraints:
+            self.matrix, self.__state = self.__initial_state()
+        elif start < self.number_of_conjunctions:
+            self.matrix = self.unrank_operator(start).astype(numpy.int64)
+            self.__state = numpy.array([0], dtype=numpy.int64)
+        else:
+            self.matrix = None
+            self.__state = numpy.array([-1], dtype=numpy.int64)
+
+    def is_exhausted(self) -> bool:
+        """
+        Checks if all the conjunctions have already been generated.
+        """
+        return self.__state[0] < 0 or \
+            (self.number_of_conjunctions is not None and self.index >= self.number_of_conjunctions)
+
+    def __initial_state(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Computes the first conjunction which satisfies the bounds of the cells, which is given by the lower bounds,
+        and the initial state of the enumeration.
+        """
+        matrix = self.lower_bounds.copy()
+        state = numpy.array([0 if (self.lower_bounds <= self.upper_bounds).all() else -1], dtype=numpy.int64)
+        return matrix, state
+
+    def next_batch(self, batch_size: int = 65536, output: numpy.ndarray = None, stop: int = None) -> numpy.ndarray:
         """
-        Generates all possible matrices which are increasing in each direction and whose elements are taken from the finite
-        chain Ln, and also satisfy that the first row and column are zeros and the last element in the diagonal is equal
-        to n; that is, generates all possible matrix representations of a discrete conjunction.
+        Generates the next conjunctions of the enumeration.
 
         Args:
-            n: An integer, representing the size of the finite chain where the conjunctions are defined.
-            k: An integer, representing the recursive step.
-            previous_conjunction_matrix: A numpy array, representing the temporal matrix which is candidate
-                                        to be a conjunction.
+            batch_size: An integer, representing the maximum number of conjunctions to be generated. It is ignored if
+                        an output buffer is given.
+            output: A numpy array of shape (K, n+1, n+1), where the conjunctions are written. Optional; if it is not
+                    given, a new buffer is allocated.
+            stop: An integer, representing the index after the last conjunction to be generated. Optional.
 
         Returns:
-            A Generator of numpy arrays, representing the object that recursively generates all possible conjunctions.
+            A numpy array of shape (K', n+1, n+1), with K' <= K, which is a view of the output buffer containing the
+            generated conjunctions. It is empty if the enumeration has finished.
         """
-        if previous_conjunction_matrix is None:
-            previous_conjunction_matrix = numpy.zeros(shape=(n + 1, n + 1), dtype=int)
-            previous_conjunction_matrix[n, n] = n
+        if output is None:
+            if batch_size < 1:
+                raise Exception("The size of the blocks must be positive.")
+            output = numpy.empty((batch_size, self.n + 1, self.n + 1), dtype=self.dtype)
+        elif output.ndim != 3 or output.shape[1:] != (self.n + 1, self.n + 1):
+            raise Exception("The output buffer must have shape (K, n+1, n+1).")
 
-        if n == 1:
-            yield previous_conjunction_matrix
-        else:
-            if k == 1:
-                for w in range(0, n + 1):
-                    conjunction_matrix = previous_conjunction_matrix.copy()
-                    conjunction_matrix[k, k] = w
-
-                    yield from DiscreteConjunctionsRecursiveGenerator.__recursive_conjunction_generator(n=n, k=k + 1, previous_conjunction_matrix=conjunction_matrix)
-
-            elif k == 2:
-                restrictions_column = [previous_conjunction_matrix[1, 1]]
-                restrictions_row = [previous_conjunction_matrix[1, 1]]
-
-                for increasing_vector_row in DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=0, n=n,
-                                                                                                                            restrictions=restrictions_row):
-                    for increasing_vector_column in DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=0, n=n,
-                                                                                                                                   restrictions=restrictions_column):
-                        next_step_conjunction_template = previous_conjunction_matrix.copy()
-
-                        next_step_conjunction_template[k - 1:k, k] = increasing_vector_column
-                        next_step_conjunction_template[k, k - 1:k] = increasing_vector_row
-
-                        if k < n:
-                            lower_bound = max(max(increasing_vector_row), max(increasing_vector_column))
-                            for w in range(lower_bound, n + 1):
-                                next_step_conjunction = next_step_conjunction_template.copy()
-                                next_step_conjunction[k, k] = w
-
-                                yield from DiscreteConjunctionsRecursiveGenerator.__recursive_conjunction_generator(n=n, k=k + 1, previous_conjunction_matrix=next_step_conjunction)
-                        else:
-                            yield next_step_conjunction_template
-
-            else:
-                restrictions_column = previous_conjunction_matrix[1:k, k - 1]
-                restrictions_row = previous_conjunction_matrix[k - 1, 1:k]
-
-                for increasing_vector_row in DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=0, n=n,
-                                                                                                                            restrictions=restrictions_row):
-                    for increasing_vector_column in DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=0, n=n,
-                                                                                                                                   restrictions=restrictions_column):
-                        next_step_conjunction_template = previous_conjunction_matrix.copy()
-
-                        next_step_conjunction_template[1:k, k] = increasing_vector_column
-                        next_step_conjunction_template[k, 1:k] = increasing_vector_row
-
-                        if k < n:
-                            lower_bound = max(max(increasing_vector_row), max(increasing_vector_column))
-                            for w in range(lower_bound, n + 1):
-                                next_step_conjunction = next_step_conjunction_template.copy()
-                                next_step_conjunction[k, k] = w
-
-                                yield from DiscreteConjunctionsRecursiveGenerator.__recursive_conjunction_generator(n=n, k=k + 1,
-                                                                                                                    previous_conjunction_matrix=next_step_conjunction)
-                        else:
-                            yield next_step_conjunction_template
+        limit = output.shape[0] if stop is None else max(0, min(output.shape[0], stop - self.index))
+        if limit == 0 or self.is_exhausted():
+            return output[:0]
 
-    @staticmethod
-    def __recursive_increasing_vector_generator(position: int, n: int, restrictions: List[int], vector: List[int] = None) -> Generator[List[int], None, None]:
+        generated = self.enumeration_kernel(self.matrix, self.lower_bounds, self.upper_bounds, self.__state, output,
+                                            limit)
+        self.index += generated
+        return output[:generated]
+
+    def generate_batches(self, batch_size: int = 65536, start: int = 0, stop: int = None) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Generates the discrete conjunctions whose indices are in [start, stop), in lexicographic order and in blocks.
+
+        Args:
+            batch_size: An integer, representing the maximum number of conjunctions of each block.
+            start: An integer, representing the index of the first conjunction to be generated.
+            stop: An integer, representing the index after the last conjunction to be generated. If it is not
+                  provided, the conjunctions are generated until the last one.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1), whose elements are the matrices of the conjunctions.
+        """
+        if self.number_of_conjunctions is not None:
+            if stop is None:
+                stop = self.number_of_conjunctions
+            if not 0 <= start <= stop <= self.number_of_conjunctions:
+                raise Exception("The range of indices must be contained in the set of indices of the conjunctions.")
+
+        self.reset(start)
+        while not self.is_exhausted() and (stop is None or self.index < stop):
+            batch = self.next_batch(batch_size=batch_size, stop=stop)
+            if batch.shape[0] > 0:
+                yield batch
+
+    def generate_operators(self, start: int = 0, stop: int = None) -> Generator:
+        """
+        Generates the discrete conjunctions defined over the finite chain Ln whose indices are in [start, stop), in
+        lexicographic order.
+
+        Args:
+            start: An integer, representing the index of the first conjunction to be generated.
+            stop: An integer, representing the index after the last conjunction to be generated. If it is not
+                  provided, the conjunctions are generated until the last one.
+
+        Returns:
+            A Generator of read-only numpy arrays, representing the matrices of the conjunctions.
+        """
+        for batch in self.generate_batches(start=start, stop=stop):
+            batch.flags.writeable = False
+            yield from batch
+
+    def sample_operators(self, size: int, seed: int = None) -> numpy.ndarray:
+        """
+        Samples discrete conjunctions uniformly at random, by coupling from the past.
+
+        Args:
+            size: An integer, representing the number of conjunctions to be sampled.
+            seed: An integer, representing the seed of the random generator. Optional.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the matrices of the sampled conjunctions.
+        """
+        if self.constraints:
+            raise Exception("The conjunctions which satisfy some constraints cannot be sampled.")
+        return DiscreteOperatorsUniformSampler(n=self.n, seed=seed).sample_conjunctions(size)
+
+    # region Ranking and unranking
+    def rank_operator(self, conjunction_matrix: numpy.ndarray) -> int:
+        """
+        Computes the index of a discrete conjunction in the lexicographic order.
+
+        Args:
+            conjunction_matrix: A numpy array of shape (n+1, n+1), representing the matrix of the conjunction.
+
+        Returns:
+            An integer, representing the index of the conjunction.
         """
-        From a given list of restrictions, constructs all possible vectors of length n such that are increasing and each
-        component is less than or equal to the restriction at the same index.
+        self.__check_ranking_is_available()
+        conjunction_matrix = numpy.asarray(conjunction_matrix)
+        if not self.__is_conjunction_matrix(conjunction_matrix):
+            raise Exception("The matrix does not represent a discrete conjunction over the finite chain.")
 
-        The increasing vectors are generated using the recurrence established by M. Munar et al.
+        partial_matrix = conjunction_matrix.astype(int)
+        index = 0
+        for x, y in self.cells:
+            value = int(conjunction_matrix[x, y])
+            for v in range(self.__cell_lower_bound(partial_matrix, x, y), value):
+                partial_matrix[x, y] = v
+                index += count_conjunction_completions(matrix=partial_matrix, n=self.n, x=x, y=y)
+            partial_matrix[x, y] = value
+        return index
+
+    def unrank_operator(self, index: int) -> numpy.ndarray:
+        """
+        Computes the discrete conjunction of a given index in the lexicographic order.
 
         Args:
-            position: An integer, representing the type of expression to be used in the generation of the vectors.
-            n: An integer, representing the maximum size of the vector to be generated.
-            restrictions: A list of integers, representing the upper restrictions to consider while positioning the elements
-                          of the generated vector.
-            vector: A list of integers, representing the temporal vector to be yield at the end of the process. Is a vector
-                    whose elements are taken from the finite chain Ln, it is increasing and satisfies the restrictions given
-                    by "restrictions".
+            index: An integer, representing the index of the conjunction.
 
         Returns:
-            A generator object, which generates lists of increasing integers.
-        """
-        if vector is None:
-            vector = [0] * (len(restrictions))
-
-        if position == 0:
-            for x in range(restrictions[0], n + 1):
-                temp_vec = vector.copy()
-                temp_vec[0] = x
-
-                if len(vector) == 1:
-                    yield temp_vec
-                else:
-                    yield from DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=position + 1, n=n,
-                                                                                                              restrictions=restrictions, vector=temp_vec)
-        elif 1 <= position < len(restrictions) - 1:
-            for x in range(max(restrictions[position], vector[position - 1]), n + 1):
-                temp_vec = vector.copy()
-                temp_vec[position] = x
-
-                yield from DiscreteConjunctionsRecursiveGenerator.__recursive_increasing_vector_generator(position=position + 1, n=n,
-                                                                                                          restrictions=restrictions, vector=temp_vec)
-        elif position == len(restrictions) - 1:
-            for x in range(max(restrictions[position], vector[position - 1]), n + 1):
-                vector[len(restrictions) - 1] = x
-                yield vector
+            A numpy array of shape (n+1, n+1), representing the matrix of the conjunction.
+        """
+        self.__check_ranking_is_available()
+        if not 0 <= index < self.number_of_conjunctions:
+            raise Exception("The index must be contained in the set of indices of the conjunctions.")
+
+        conjunction_matrix = numpy.zeros((self.n + 1, self.n + 1), dtype=int)
+        remainder = index
+        for x, y in self.cells:
+            for v in range(self.__cell_lower_bound(conjunction_matrix, x, y), self.n + 1):
+                conjunction_matrix[x, y] = v
+                completions = count_conjunction_completions(matrix=conjunction_matrix, n=self.n, x=x, y=y)
+                if remainder < completions:
+                    break
+                remainder -= completions
+        return conjunction_matrix
+
+    def __check_ranking_is_available(self):
+        """
+        Checks that the generator has no constraints, since the ranking counts all the discrete conjunctions.
+        """
+        if self.constraints:
+            raise Exception("The ranking is only available for the generator of all the discrete conjunctions.")
+
+    @staticmethod
+    def __cell_lower_bound(conjunction_matrix: numpy.ndarray, x: int, y: int) -> int:
+        """
+        Computes the smallest value of the cell (x, y) which keeps the matrix increasing, given the previous cells.
+        """
+        return max(int(conjunction_matrix[x - 1, y]), int(conjunction_matrix[x, y - 1]))
+
+    def __is_conjunction_matrix(self, conjunction_matrix: numpy.ndarray) -> bool:
+        """
+        Checks if the array is the matrix of a discrete conjunction over the finite chain.
+        """
+        return conjunction_matrix.shape == (self.n + 1, self.n + 1) and (conjunction_matrix[0, :] == 0).all() and \
+            (conjunction_matrix[:, 0] == 0).all() and conjunction_matrix[self.n, self.n] == self.n and \
+            (conjunction_matrix <= self.n).all() and (numpy.diff(conjunction_matrix.astype(int), axis=0) >= 0).all() \
+            and (numpy.diff(conjunction_matrix.astype(int), axis=1) >= 0).all()
+    # endregion
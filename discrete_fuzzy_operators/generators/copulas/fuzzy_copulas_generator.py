@@ -4,6 +4,8 @@ import os
 
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_aggregation_suboperators.copula import \
     Copula
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import FamilyBoundaryKind, \
+    save_operator_family
 from typing import List, Tuple
 
 
@@ -49,10 +51,15 @@ def generate_copulas(n: int, save_results: bool, saving_path: str) -> Tuple[
         if not os.path.exists(experiment_path):
             os.mkdir(experiment_path)
 
-        numpy.save(os.path.join(experiment_path, "copulas.npy"), copulas)
-        numpy.save(os.path.join(experiment_path, "copulas_divisible.npy"), copulas_divisible)
-        numpy.save(os.path.join(experiment_path, "copulas_commutatuve.npy"), copulas_commutatuve)
-        numpy.save(os.path.join(experiment_path, "copulas_associative.npy"), copulas_associative)
-        numpy.save(os.path.join(experiment_path, "copulas_archimedean_divisible.npy"), copulas_archimedean_divisible)
+        save_operator_family(os.path.join(experiment_path, "copulas.family"), copulas,
+                             n=n, symmetric=False, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "copulas_divisible.family"), copulas_divisible,
+                             n=n, symmetric=False, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "copulas_commutatuve.family"), copulas_commutatuve,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "copulas_associative.family"), copulas_associative,
+                             n=n, symmetric=False, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "copulas_archimedean_divisible.family"), copulas_archimedean_divisible,
+                             n=n, symmetric=False, boundary=FamilyBoundaryKind.TNORM)
 
     return copulas, copulas_divisible, copulas_commutatuve, copulas_associative, copulas_archimedean_divisible
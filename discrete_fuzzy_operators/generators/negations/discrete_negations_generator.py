@@ -0,0 +1,232 @@
+import numpy
+import random
+
+from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
+from discrete_fuzzy_operators.counters.negations.discrete_negations_counter import DiscreteNegationsCounter
+from math import comb
+from typing import Generator
+
+
+class DiscreteNegationsGenerator(DiscreteOperatorGenerator):
+
+    def __init__(self, n: int):
+        """
+        Initializes the object that generates all possible discrete negations over the finite chain Ln.
+
+        A discrete negation is determined by its inner values N(1) >= ... >= N(n-1), taken from Ln, since N(0)=n and
+        N(n)=0. The negations are sorted in the lexicographic order of their vectors, and the index of a negation is
+        the number of negations that precede it, which is given by the sum of the binomial coefficients
+        C(n-i-1+N(i), n-i) for i in [1, n-1]. Hence, any range of indices can be generated directly, without
+        enumerating the previous negations.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive to define a discrete negation.")
+
+        super(DiscreteNegationsGenerator, self).__init__(n)
+        self.n = n
+        self.dtype = numpy.min_scalar_type(n)
+        self.number_of_negations = DiscreteNegationsCounter(n).count_operators()
+
+        # Row i-1 contains the binomial coefficients C(n-i-1+v, n-i) for v in [0, n], which are increasing in v.
+        self.__rank_table = [[comb(n - i - 1 + v, n - i) for v in range(0, n + 1)] for i in range(1, n)]
+        self.__array_table = None
+        if self.number_of_negations <= numpy.iinfo(numpy.int64).max:
+            self.__array_table = numpy.array(self.__rank_table, dtype=numpy.int64).reshape(n - 1, n + 1)
+
+    def count_operators(self) -> int:
+        """
+        Counts the number of discrete negations defined over the finite chain Ln.
+
+        Returns:
+            An integer, representing the cardinality of the set of discrete negations.
+        """
+        return self.number_of_negations
+
+    def generate_operators(self) -> Generator:
+        """
+        Generates all possible discrete negations defined over the finite chain Ln, in lexicographic order.
+
+        Returns:
+            A Generator of numpy arrays, representing the vectors of the discrete negations.
+        """
+        for batch in self.generate_batches():
+            yield from batch
+
+    def generate_batches(self, batch_size: int = 65536, start: int = 0, stop: int = None) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Generates the discrete negations whose indices are in [start, stop), in lexicographic order and in blocks.
+        Disjoint ranges of indices can be assigned to different processes.
+
+        Args:
+            batch_size: An integer, representing the maximum number of negations of each block.
+            start: An integer, representing the index of the first negation to be generated.
+            stop: An integer, representing the index after the last negation to be generated. If it is not provided,
+                  the negations are generated until the last one.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1), whose rows are the vectors of the discrete negations.
+        """
+        if stop is None:
+            stop = self.number_of_negations
+        if not 0 <= start <= stop <= self.number_of_negations:
+            raise Exception("The range of indices must be contained in the set of indices of the negations.")
+        if batch_size < 1:
+            raise Exception("The size of the blocks must be positive.")
+
+        if self.__array_table is None:
+            yield from self.__generate_batches_by_successors(batch_size, start, stop)
+            return
+
+        for batch_start in range(start, stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            yield self.unrank_operators(numpy.arange(batch_start, batch_stop, dtype=numpy.int64))
+
+    def __generate_batches_by_successors(self, batch_size: int, start: int, stop: int) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Generates the discrete negations whose indices are in [start, stop) when the indices do not fit in 64-bit
+        integers. The first negation is unranked with the integers of Python, and each of the following ones is the
+        successor of the previous one in the lexicographic order: the last inner value which is lower than its
+        predecessor is incremented, and the later values are set to 0.
+        """
+        if start == stop:
+            return
+        operator_vector = [int(value) for value in self.unrank_operator(start)]
+        batch = []
+        for index in range(start, stop):
+            if index > start:
+                position = max(i for i in range(1, self.n) if operator_vector[i] < operator_vector[i - 1])
+                operator_vector[position] += 1
+                operator_vector[position + 1:self.n] = [0] * (self.n - position - 1)
+            batch.append(list(operator_vector))
+            if len(batch) == batch_size:
+                yield numpy.array(batch, dtype=self.dtype)
+                batch = []
+        if batch:
+            yield numpy.array(batch, dtype=self.dtype)
+
+    # region Ranking and unranking
+    def rank_operator(self, operator_vector: numpy.ndarray) -> int:
+        """
+        Computes the index of a discrete negation in the lexicographic order.
+
+        Args:
+            operator_vector: A numpy array of integers, representing the vector of the discrete negation.
+
+        Returns:
+            An integer, representing the index of the negation.
+        """
+        operator_vector = numpy.asarray(operator_vector)
+        if not self.__is_negation_vector(operator_vector):
+            raise Exception("The vector does not represent a discrete negation over the finite chain.")
+
+        return sum(self.__rank_table[i - 1][int(operator_vector[i])] for i in range(1, self.n))
+
+    def unrank_operator(self, index: int) -> numpy.ndarray:
+        """
+        Computes the discrete negation of a given index in the lexicographic order.
+
+        Args:
+            index: An integer, representing the index of the negation.
+
+        Returns:
+            A numpy array of integers, representing the vector of the discrete negation.
+        """
+        if not 0 <= index < self.number_of_negations:
+            raise Exception("The index must be contained in the set of indices of the negations.")
+
+        operator_vector = numpy.zeros(self.n + 1, dtype=self.dtype)
+        operator_vector[0] = self.n
+        remainder = index
+        for i in range(1, self.n):
+            value = max(v for v in range(0, int(operator_vector[i - 1]) + 1)
+                        if self.__rank_table[i - 1][v] <= remainder)
+            operator_vector[i] = value
+            remainder -= self.__rank_table[i - 1][value]
+        return operator_vector
+
+    def rank_operators(self, operator_vectors: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the indices of a stack of discrete negations in the lexicographic order.
+
+        Args:
+            operator_vectors: A numpy array of integers of shape (K, n+1), whose rows are the vectors of the discrete
+                              negations.
+
+        Returns:
+            A numpy array of integers of shape (K,), representing the indices of the negations.
+        """
+        operator_vectors = numpy.asarray(operator_vectors)
+        if operator_vectors.ndim != 2 or not self.__is_negation_vector(operator_vectors):
+            raise Exception("The rows of the array do not represent discrete negations over the finite chain.")
+
+        table = self.__array_rank_table()
+        indices = numpy.zeros(operator_vectors.shape[0], dtype=numpy.int64)
+        for i in range(1, self.n):
+            indices += table[i - 1][operator_vectors[:, i].astype(int)]
+        return indices
+
+    def unrank_operators(self, indices: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the discrete negations of several indices in the lexicographic order at once.
+
+        Args:
+            indices: A numpy array of integers of shape (K,), representing the indices of the negations.
+
+        Returns:
+            A numpy array of shape (K, n+1), whose rows are the vectors of the discrete negations.
+        """
+        table = self.__array_rank_table()
+        remainder = numpy.array(indices, dtype=numpy.int64).reshape(-1)
+        if ((remainder < 0) | (remainder >= self.number_of_negations)).any():
+            raise Exception("The indices must be contained in the set of indices of the negations.")
+
+        operator_vectors = numpy.zeros((remainder.size, self.n + 1), dtype=self.dtype)
+        operator_vectors[:, 0] = self.n
+        for i in range(1, self.n):
+            values = numpy.searchsorted(table[i - 1], remainder, side="right") - 1
+            operator_vectors[:, i] = values
+            remainder -= table[i - 1][values]
+        return operator_vectors
+
+    def sample_operators(self, size: int, seed: int = None) -> numpy.ndarray:
+        """
+        Samples discrete negations uniformly at random, by unranking uniformly distributed indices. If the number of
+        negations does not fit in 64-bit integers, the indices are drawn and unranked with the integers of Python.
+
+        Args:
+            size: An integer, representing the number of negations to be sampled.
+            seed: An integer, representing the seed of the random generator. Optional.
+
+        Returns:
+            A numpy array of shape (size, n+1), whose rows are the vectors of the sampled discrete negations.
+        """
+        if self.__array_table is None:
+            generator = random.Random(seed)
+            operator_vectors = [self.unrank_operator(generator.randrange(self.number_of_negations))
+                                for _ in range(0, size)]
+            return numpy.array(operator_vectors, dtype=self.dtype).reshape(size, self.n + 1)
+
+        indices = numpy.random.default_rng(seed).integers(0, self.number_of_negations, size=size, dtype=numpy.int64)
+        return self.unrank_operators(indices)
+
+    def __array_rank_table(self) -> numpy.ndarray:
+        """
+        Returns the table of binomial coefficients of the ranking as a numpy array of 64-bit integers.
+        """
+        if self.__array_table is None:
+            raise Exception("The number of negations is too large to be indexed with 64-bit integers; use the "
+                            "methods rank_operator and unrank_operator instead.")
+        return self.__array_table
+
+    def __is_negation_vector(self, operator_vectors: numpy.ndarray) -> bool:
+        """
+        Checks if the last axis of the array contains vectors of discrete negations over the finite chain.
+        """
+        return operator_vectors.shape[-1] == self.n + 1 and (operator_vectors[..., 0] == self.n).all() and \
+            (operator_vectors[..., -1] == 0).all() and (numpy.diff(operator_vectors.astype(int), axis=-1) <= 0).all()
+    # endregion
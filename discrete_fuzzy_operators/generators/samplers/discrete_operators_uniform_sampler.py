@@ -0,0 +1,129 @@
+import numpy
+
+from discrete_fuzzy_operators.generators.samplers.monotone_matrix_sampler_utils.monotone_matrix_sampler_utils import \
+    sample_monotone_matrices
+
+
+class DiscreteOperatorsUniformSampler:
+
+    def __init__(self, n: int, seed: int = None, first_epoch_length: int = None, max_epochs: int = 32):
+        """
+        Initializes the object that samples exactly uniformly discrete conjunctions, implications and aggregation
+        functions over the finite chain Ln.
+
+        All these families are sets of matrices which are increasing in each direction, with some fixed cells, and
+        they are sampled by coupling from the past with a monotone Markov chain on the matrices. Unlike the rejection
+        from random matrices or the enumeration of the family, the cost does not depend on the cardinality of the
+        family, so it can be used for values of n where the family cannot be enumerated.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+            seed: An integer, representing the seed of the random generator. Optional.
+            first_epoch_length: An integer, representing the number of sweeps of the last epoch of the coupling from
+                                the past. By default, it is (n+1)^2.
+            max_epochs: An integer, representing the maximum number of epochs, each one as long as all the later
+                        ones, before giving up.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive.")
+
+        self.n = n
+        self.random_generator = numpy.random.default_rng(seed)
+        self.first_epoch_length = (n + 1) ** 2 if first_epoch_length is None else first_epoch_length
+        self.max_epochs = max_epochs
+
+    def sample_conjunctions(self, size: int) -> numpy.ndarray:
+        """
+        Samples discrete conjunctions uniformly at random; that is, increasing matrices with zeros in the first row and
+        column and C(n,n)=n.
+
+        Args:
+            size: An integer, representing the number of conjunctions to be sampled.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the matrices of the sampled conjunctions.
+        """
+        return self.__sample(fixed_cells=self.__conjunction_fixed_cells(), symmetric=False, size=size)
+
+    def sample_commutative_conjunctions(self, size: int) -> numpy.ndarray:
+        """
+        Samples commutative discrete conjunctions uniformly at random.
+
+        Args:
+            size: An integer, representing the number of commutative conjunctions to be sampled.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the symmetric matrices of the sampled
+            conjunctions.
+        """
+        return self.__sample(fixed_cells=self.__conjunction_fixed_cells(), symmetric=True, size=size)
+
+    def sample_implications(self, size: int) -> numpy.ndarray:
+        """
+        Samples discrete implications uniformly at random, from the bijection I(x,y) = n-C(x,n-y) between the discrete
+        conjunctions C and the discrete implications I.
+
+        Args:
+            size: An integer, representing the number of implications to be sampled.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the matrices of the sampled implications.
+        """
+        conjunctions = self.sample_conjunctions(size)
+        # The entry (y, x) of the matrix of an operator is its value at (x, y).
+        return self.n - conjunctions[:, ::-1, :]
+
+    def sample_aggregation_functions(self, size: int) -> numpy.ndarray:
+        """
+        Samples discrete aggregation functions uniformly at random; that is, increasing matrices with A(0,0)=0 and
+        A(n,n)=n.
+
+        Args:
+            size: An integer, representing the number of aggregation functions to be sampled.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the matrices of the sampled aggregation
+            functions.
+        """
+        fixed_cells = numpy.zeros((self.n + 1, self.n + 1), dtype=bool)
+        fixed_cells[0, 0] = True
+        fixed_cells[self.n, self.n] = True
+        return self.__sample(fixed_cells=fixed_cells, symmetric=False, size=size)
+
+    def __conjunction_fixed_cells(self) -> numpy.ndarray:
+        """
+        Returns the cells which are fixed in the matrix of a discrete conjunction; that is, the first row and column
+        and the cell (n, n).
+        """
+        fixed_cells = numpy.zeros((self.n + 1, self.n + 1), dtype=bool)
+        fixed_cells[0, :] = True
+        fixed_cells[:, 0] = True
+        fixed_cells[self.n, self.n] = True
+        return fixed_cells
+
+    def __sample(self, fixed_cells: numpy.ndarray, symmetric: bool, size: int) -> numpy.ndarray:
+        """
+        Samples uniformly the increasing matrices whose fixed cells are equal to 0, except the cell (n, n), which is
+        equal to n.
+
+        Args:
+            fixed_cells: A numpy array of booleans of shape (n+1, n+1), representing the fixed cells.
+            symmetric: A boolean, indicating if the matrices are symmetric.
+            size: An integer, representing the number of matrices to be sampled.
+
+        Returns:
+            A numpy array of shape (size, n+1, n+1), whose elements are the sampled matrices.
+        """
+        if size < 0:
+            raise Exception("The number of samples must be non-negative.")
+
+        bottom = numpy.zeros((self.n + 1, self.n + 1), dtype=numpy.int64)
+        bottom[self.n, self.n] = self.n
+        top = numpy.where(fixed_cells, bottom, self.n)
+
+        seeds = self.random_generator.integers(0, 2 ** 32, size=(size, self.max_epochs), dtype=numpy.int64)
+        output = numpy.empty((size, self.n + 1, self.n + 1), dtype=numpy.int64)
+        sampled = sample_monotone_matrices(bottom, top, ~fixed_cells, symmetric, seeds, self.first_epoch_length, output)
+        if sampled < size:
+            raise Exception("The coupling from the past has not coalesced within the maximum number of epochs.")
+        return output
@@ -0,0 +1,102 @@
+import numpy
+from numba import jit
+
+
+@jit(nopython=True)
+def monotone_matrix_sweep(matrix: numpy.ndarray, free_cells: numpy.ndarray, symmetric: bool, color: int,
+                          upwards: numpy.ndarray):
+    """
+    Updates in place the free cells (x, y) of a matrix increasing in each direction such that x+y has the given
+    parity. Each cell is moved one unit up or down, according to the given directions, if the matrix remains
+    increasing; otherwise, it keeps its value. Since two cells of the same parity are never adjacent, the cells are
+    updated independently.
+
+    The update preserves the uniform distribution over the increasing matrices, and it is monotone: if a matrix is
+    smaller than another one and both are updated with the same directions, the order is kept.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the increasing matrix with values in Ln.
+        free_cells: A numpy array of booleans of shape (n+1, n+1), representing the cells which can be updated.
+        symmetric: A boolean, indicating if the matrix is symmetric. In this case, only the free cells (x, y) with
+                   x <= y are updated, and their values are copied to (y, x).
+        color: An integer, representing the parity of the updated cells.
+        upwards: A numpy array of booleans of shape (n+1, n+1), representing the direction of the move of each cell.
+    """
+    size = matrix.shape[0]
+    n = size - 1
+    for x in range(0, size):
+        for y in range(0, size):
+            if (x + y) % 2 != color or not free_cells[x, y] or (symmetric and x > y):
+                continue
+            if upwards[x, y]:
+                value = matrix[x, y] + 1
+                if value > n or (x < n and matrix[x + 1, y] < value) or (y < n and matrix[x, y + 1] < value):
+                    continue
+            else:
+                value = matrix[x, y] - 1
+                if value < 0 or (x > 0 and matrix[x - 1, y] > value) or (y > 0 and matrix[x, y - 1] > value):
+                    continue
+            matrix[x, y] = value
+            if symmetric:
+                matrix[y, x] = value
+
+
+@jit(nopython=True)
+def run_monotone_matrix_epoch(matrix: numpy.ndarray, free_cells: numpy.ndarray, symmetric: bool, seed: int,
+                              length: int):
+    """
+    Applies a given number of sweeps to a matrix, with the directions drawn from a random generator initialised with
+    the given seed, so that the same epoch can be replayed from different initial matrices.
+    """
+    numpy.random.seed(seed)
+    size = matrix.shape[0]
+    upwards = numpy.zeros((size, size), dtype=numpy.bool_)
+    for step in range(0, length):
+        for x in range(0, size):
+            for y in range(0, size):
+                upwards[x, y] = numpy.random.random() < 0.5
+        monotone_matrix_sweep(matrix, free_cells, symmetric, step % 2, upwards)
+
+
+@jit(nopython=True)
+def sample_monotone_matrices(bottom: numpy.ndarray, top: numpy.ndarray, free_cells: numpy.ndarray, symmetric: bool,
+                             seeds: numpy.ndarray, first_epoch_length: int, output: numpy.ndarray) -> int:
+    """
+    Samples exactly uniformly increasing matrices with coupling from the past. For each sample, the chains starting
+    from the smallest and the greatest matrices are run from further and further in the past, reusing the random
+    directions of each epoch, until both of them coalesce at time zero. By monotonicity, all the chains coalesce, so
+    the common matrix is distributed as the stationary distribution; that is, uniformly.
+
+    The epoch 0 covers the last first_epoch_length sweeps before time zero, and the epoch j >= 1 covers the
+    first_epoch_length * 2^(j-1) sweeps before the epoch j-1.
+
+    Args:
+        bottom: A numpy array of shape (n+1, n+1), representing the smallest matrix of the family.
+        top: A numpy array of shape (n+1, n+1), representing the greatest matrix of the family.
+        free_cells: A numpy array of booleans of shape (n+1, n+1), representing the cells which are not fixed.
+        symmetric: A boolean, indicating if the matrices of the family are symmetric.
+        seeds: A numpy array of integers of shape (K, E), representing the seeds of the epochs of each sample.
+        first_epoch_length: An integer, representing the number of sweeps of the epoch 0.
+        output: A numpy array of shape (K, n+1, n+1), where the sampled matrices are written.
+
+    Returns:
+        An integer, representing the number of samples which have coalesced within the E epochs. The remaining
+        entries of the output are not valid.
+    """
+    number_of_epochs = seeds.shape[1]
+    for k in range(0, output.shape[0]):
+        coalesced = False
+        for epochs in range(1, number_of_epochs + 1):
+            lower_chain = bottom.copy()
+            upper_chain = top.copy()
+            for epoch in range(epochs - 1, -1, -1):
+                length = first_epoch_length if epoch == 0 else first_epoch_length * 2 ** (epoch - 1)
+                run_monotone_matrix_epoch(lower_chain, free_cells, symmetric, seeds[k, epoch], length)
+                run_monotone_matrix_epoch(upper_chain, free_cells, symmetric, seeds[k, epoch], length)
+            if (lower_chain == upper_chain).all():
+                output[k, :, :] = lower_chain
+                coalesced = True
+                break
+        if not coalesced:
+            return k
+    return output.shape[0]
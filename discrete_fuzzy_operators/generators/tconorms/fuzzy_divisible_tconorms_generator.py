@@ -0,0 +1,76 @@
+import numpy
+
+from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
+from discrete_fuzzy_operators.generators.tnorms.fuzzy_divisible_tnorms_generator import \
+    DiscreteDivisibleTnormsGenerator
+from typing import Generator
+
+
+class DiscreteDivisibleTconormsGenerator(DiscreteOperatorGenerator):
+
+    def __init__(self, n: int, archimedean: bool = False):
+        """
+        Initializes the object that generates all possible divisible t-conorms over the finite chain Ln.
+
+        The t-conorms are built as the duals S(x,y)=n-T(n-x,n-y) of the divisible t-norms, so they are the ordinal
+        sums of Lukasiewicz t-conorms. The t-conorm of index i is the dual of the t-norm of index i, and its
+        idempotent elements are n-j for the idempotent elements j of the t-norm.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+            archimedean: A boolean, indicating if only the archimedean divisible t-conorms must be generated.
+        """
+        super(DiscreteDivisibleTconormsGenerator, self).__init__(n)
+        self.n = n
+        self.archimedean = archimedean
+        self.tnorms_generator = DiscreteDivisibleTnormsGenerator(n=n, archimedean=archimedean)
+
+    def count_operators(self) -> int:
+        """
+        Counts the number of divisible t-conorms defined over the finite chain Ln.
+
+        Returns:
+            An integer, representing the cardinality of the set of divisible t-conorms.
+        """
+        return self.tnorms_generator.count_operators()
+
+    def generate_operators(self) -> Generator:
+        """
+        Generates all possible divisible t-conorms defined over the finite chain Ln.
+
+        Returns:
+            A Generator of numpy arrays, representing the matrices of the divisible t-conorms.
+        """
+        for batch in self.generate_batches():
+            yield from batch
+
+    def generate_batches(self, batch_size: int = 4096, start: int = 0, stop: int = None) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Generates the divisible t-conorms whose indices are in [start, stop), in blocks.
+
+        Args:
+            batch_size: An integer, representing the maximum number of t-conorms of each block.
+            start: An integer, representing the index of the first t-conorm to be generated.
+            stop: An integer, representing the index after the last t-conorm to be generated. If it is not provided,
+                  the t-conorms are generated until the last one.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1), whose elements are the matrices of the t-conorms.
+        """
+        for tnorms in self.tnorms_generator.generate_batches(batch_size=batch_size, start=start, stop=stop):
+            yield self.n - tnorms[:, ::-1, ::-1]
+
+    def get_operator(self, idempotent_elements: [int]) -> numpy.ndarray:
+        """
+        Builds the divisible t-conorm with the given idempotent elements.
+
+        Args:
+            idempotent_elements: A list of integers, representing the idempotent elements of the t-conorm. The
+                                 elements 0 and n are always idempotent, so they may be omitted.
+
+        Returns:
+            A numpy array of shape (n+1, n+1), representing the matrix of the t-conorm.
+        """
+        tnorm = self.tnorms_generator.get_operator([self.n - element for element in idempotent_elements])
+        return self.n - tnorm[::-1, ::-1]
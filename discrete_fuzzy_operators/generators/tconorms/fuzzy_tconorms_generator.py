@@ -4,7 +4,12 @@ from typing import List, Tuple
 import numpy
 
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_aggregation_operator import DiscreteAggregationBinaryOperator
-from discrete_fuzzy_operators.generators.tnorms.fuzzy_tnorms_iterative_generator import generate_candidate_tnorms
+from discrete_fuzzy_operators.generators.tnorms.fuzzy_tnorms_backtracking_generator import \
+    DiscreteTnormsBacktrackingGenerator
+from discrete_fuzzy_operators.generators.tnorms.divisible_tnorms_generator_utils.divisible_tnorms_generator_utils \
+    import is_lukasiewicz_ordinal_sum
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import FamilyBoundaryKind, \
+    save_operator_family
 
 
 def generate_tconorms(n: int, save_results: bool, saving_path: str) -> Tuple[List, List, List, List]:
@@ -30,34 +35,36 @@ def generate_tconorms(n: int, save_results: bool, saving_path: str) -> Tuple[Lis
     t_conorms_archimedean = []
     t_conorms_archimedean_divisible = []
 
-    for candidate_tnorm in generate_candidate_tnorms(n):
-
-        t_conorm_matrix = convert_tnorm_tconorm(t_norm_matrix=candidate_tnorm, n=n)
-        t_norm_operator = DiscreteAggregationBinaryOperator(operator_matrix=candidate_tnorm)
-
-        # All matrices generated by generate_candidate_tnorms are increasing, commutative and verifies the boundary
-        # conditions. Indeed, only the associativity of the operator must be checked.
-        if t_norm_operator.is_associative():
-            t_conorms.append(t_conorm_matrix)
-
-            if t_norm_operator.is_divisible():
-                t_conorms_divisible.append(t_conorm_matrix)
+    # The backtracking generator only yields t-norms, since the associativity is checked while the matrices are filled.
+    for tnorm_matrix in DiscreteTnormsBacktrackingGenerator(n).generate_operators():
+        tnorm = tnorm_matrix.astype(int)
+        t_conorm_matrix = convert_tnorm_tconorm(t_norm_matrix=tnorm, n=n)
+        t_norm_operator = DiscreteAggregationBinaryOperator(n=n, operator_matrix=tnorm, check_properties_in_load=False)
+        t_conorms.append(t_conorm_matrix)
 
-                if t_norm_operator.is_archimedean():
-                    t_conorms_archimedean_divisible.append(t_conorm_matrix)
+        # The dual t-conorm is divisible if and only if the t-norm is divisible.
+        if is_lukasiewicz_ordinal_sum(tnorm):
+            t_conorms_divisible.append(t_conorm_matrix)
 
             if t_norm_operator.is_archimedean():
-                t_conorms_archimedean.append(t_conorm_matrix)
+                t_conorms_archimedean_divisible.append(t_conorm_matrix)
+
+        if t_norm_operator.is_archimedean():
+            t_conorms_archimedean.append(t_conorm_matrix)
 
     if save_results:
         experiment_path = os.path.join(saving_path, f"N={n}")
         if not os.path.exists(experiment_path):
             os.mkdir(experiment_path)
 
-        numpy.save(os.path.join(experiment_path, "tconorms.npy"), t_conorms)
-        numpy.save(os.path.join(experiment_path, "t_conorms_divisible.npy"), t_conorms_divisible)
-        numpy.save(os.path.join(experiment_path, "t_conorms_archimedean.npy"), t_conorms_archimedean)
-        numpy.save(os.path.join(experiment_path, "t_conorms_archimedean_divisible.npy"), t_conorms_archimedean_divisible)
+        save_operator_family(os.path.join(experiment_path, "tconorms.family"), t_conorms,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_divisible.family"), t_conorms_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_archimedean.family"), t_conorms_archimedean,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_archimedean_divisible.family"), t_conorms_archimedean_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
 
     return t_conorms, t_conorms_divisible, t_conorms_archimedean, t_conorms_archimedean_divisible
 
@@ -89,7 +96,7 @@ def generate_tconorms_from_tnorms(t_norms: List[numpy.ndarray], n: int,
     for tnorm in t_norms:
 
         t_conorm_matrix = convert_tnorm_tconorm(t_norm_matrix=tnorm, n=n)
-        t_norm_operator = DiscreteAggregationBinaryOperator(operator_matrix=tnorm)
+        t_norm_operator = DiscreteAggregationBinaryOperator(n=n, operator_matrix=tnorm)
 
         # All matrices generated by generate_candidate_tnorms are increasing, commutative and verifies the boundary
         # conditions. Indeed, only the associativity of the operator must be checked.
@@ -110,10 +117,14 @@ def generate_tconorms_from_tnorms(t_norms: List[numpy.ndarray], n: int,
         if not os.path.exists(experiment_path):
             os.mkdir(experiment_path)
 
-        numpy.save(os.path.join(experiment_path, "tconorms.npy"), t_conorms)
-        numpy.save(os.path.join(experiment_path, "t_conorms_divisible.npy"), t_conorms_divisible)
-        numpy.save(os.path.join(experiment_path, "t_conorms_archimedean.npy"), t_conorms_archimedean)
-        numpy.save(os.path.join(experiment_path, "t_conorms_archimedean_divisible.npy"), t_conorms_archimedean_divisible)
+        save_operator_family(os.path.join(experiment_path, "tconorms.family"), t_conorms,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_divisible.family"), t_conorms_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_archimedean.family"), t_conorms_archimedean,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
+        save_operator_family(os.path.join(experiment_path, "t_conorms_archimedean_divisible.family"), t_conorms_archimedean_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TCONORM)
 
     return t_conorms, t_conorms_divisible, t_conorms_archimedean, t_conorms_archimedean_divisible
 
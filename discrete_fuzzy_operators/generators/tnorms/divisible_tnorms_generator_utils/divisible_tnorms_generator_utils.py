@@ -0,0 +1,74 @@
+import numpy
+
+
+def compute_idempotent_masks(n: int, start: int, stop: int) -> numpy.ndarray:
+    """
+    Computes the sets of idempotent elements of the divisible t-norms whose indices are in [start, stop). The bit j-1
+    of the index of a t-norm indicates if j is an idempotent element, for j in [1, n-1]; the elements 0 and n are
+    always idempotent.
+
+    Args:
+        n: An integer, representing the size of the finite chain.
+        start: An integer, representing the index of the first t-norm.
+        stop: An integer, representing the index after the last t-norm.
+
+    Returns:
+        A numpy array of booleans of shape (K, n+1), indicating which elements are idempotent in each t-norm.
+    """
+    masks = numpy.ones((stop - start, n + 1), dtype=bool)
+    if n - 1 < 63:
+        indices = numpy.arange(start, stop, dtype=numpy.int64)
+        masks[:, 1:n] = (indices[:, None] >> numpy.arange(0, n - 1, dtype=numpy.int64)) & 1
+    else:
+        # The indices do not fit in a 64-bit integer, so their bits are extracted with the integers of Python.
+        masks[:, 1:n] = [[(index >> j) & 1 for j in range(0, n - 1)] for index in range(start, stop)]
+    return masks
+
+
+def build_lukasiewicz_ordinal_sums(idempotent_masks: numpy.ndarray, dtype: type = numpy.int64) -> numpy.ndarray:
+    """
+    Builds the matrices of the ordinal sums of Lukasiewicz t-norms determined by a stack of sets of idempotent
+    elements. If e < e' are consecutive idempotent elements and x, y are in [e, e'], then T(x,y)=max(e, x+y-e');
+    otherwise, T(x,y)=min(x,y).
+
+    Let a=min(x,y) and b=max(x,y). The points x and y are in the same summand if there is no idempotent element in
+    the open interval (a, b), which is checked with the cumulative count of idempotent elements; in that case, the
+    bounds of the summand are the greatest idempotent element below a and the smallest one above b.
+
+    Args:
+        idempotent_masks: A numpy array of booleans of shape (K, n+1), indicating which elements are idempotent. The
+                          elements 0 and n must be idempotent.
+        dtype: The type of the elements of the matrices.
+
+    Returns:
+        A numpy array of shape (K, n+1, n+1), whose elements are the matrices of the t-norms.
+    """
+    n = idempotent_masks.shape[1] - 1
+    elements = numpy.arange(0, n + 1)
+    previous_idempotent = numpy.maximum.accumulate(numpy.where(idempotent_masks, elements, 0), axis=1)
+    next_idempotent = numpy.minimum.accumulate(numpy.where(idempotent_masks, elements, n)[:, ::-1], axis=1)[:, ::-1]
+    idempotent_count = numpy.cumsum(idempotent_masks, axis=1)
+
+    y, x = numpy.indices((n + 1, n + 1))
+    a = numpy.minimum(x, y)
+    b = numpy.maximum(x, y)
+    # Number of idempotent elements in the open interval (a, b); it is zero when a=b.
+    inner_count = idempotent_count[:, numpy.maximum(b - 1, a)] - idempotent_count[:, a]
+    lukasiewicz = numpy.maximum(previous_idempotent[:, a], a + b - next_idempotent[:, b])
+    return numpy.where(inner_count == 0, lukasiewicz, a).astype(dtype)
+
+
+def is_lukasiewicz_ordinal_sum(matrix: numpy.ndarray) -> bool:
+    """
+    Checks if the matrix of a t-norm is the ordinal sum of Lukasiewicz t-norms given by its idempotent elements. Over
+    a finite chain, a t-norm is divisible if and only if it is such an ordinal sum, so this is equivalent to the
+    divisibility of the t-norm, with a cost of O(n^2) operations.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the matrix of a t-norm.
+
+    Returns:
+        A boolean, indicating if the t-norm is an ordinal sum of Lukasiewicz t-norms.
+    """
+    idempotent_mask = numpy.diagonal(matrix) == numpy.arange(0, matrix.shape[0])
+    return bool((build_lukasiewicz_ordinal_sums(idempotent_mask[None, :])[0] == matrix).all())
@@ -0,0 +1,101 @@
+import numpy
+
+from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
+from discrete_fuzzy_operators.generators.tnorms.divisible_tnorms_generator_utils.divisible_tnorms_generator_utils \
+    import build_lukasiewicz_ordinal_sums, compute_idempotent_masks
+from typing import Generator
+
+
+class DiscreteDivisibleTnormsGenerator(DiscreteOperatorGenerator):
+
+    def __init__(self, n: int, archimedean: bool = False):
+        """
+        Initializes the object that generates all possible divisible t-norms over the finite chain Ln.
+
+        Over a finite chain, the divisible t-norms are the ordinal sums of Lukasiewicz t-norms, which are determined by
+        their sets of idempotent elements. Hence, there are 2^(n-1) divisible t-norms, one for each subset of
+        {1, ..., n-1}, and they are built directly instead of filtering the whole family of t-norms. The t-norm of
+        index i has as idempotent elements the values j such that the bit j-1 of i is set.
+
+        The only archimedean divisible t-norm is the Lukasiewicz t-norm, since any idempotent element x in L\\{0,n}
+        satisfies x^m = x for all m.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+            archimedean: A boolean, indicating if only the archimedean divisible t-norms must be generated.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive to define a t-norm.")
+
+        super(DiscreteDivisibleTnormsGenerator, self).__init__(n)
+        self.n = n
+        self.archimedean = archimedean
+        self.dtype = numpy.min_scalar_type(n)
+        self.number_of_tnorms = 1 if archimedean else 2 ** (n - 1)
+
+    def count_operators(self) -> int:
+        """
+        Counts the number of divisible t-norms defined over the finite chain Ln.
+
+        Returns:
+            An integer, representing the cardinality of the set of divisible t-norms.
+        """
+        return self.number_of_tnorms
+
+    def generate_operators(self) -> Generator:
+        """
+        Generates all possible divisible t-norms defined over the finite chain Ln.
+
+        Returns:
+            A Generator of numpy arrays, representing the matrices of the divisible t-norms.
+        """
+        for batch in self.generate_batches():
+            yield from batch
+
+    def generate_batches(self, batch_size: int = 4096, start: int = 0, stop: int = None) -> \
+            Generator[numpy.ndarray, None, None]:
+        """
+        Generates the divisible t-norms whose indices are in [start, stop), in blocks. Disjoint ranges of indices can
+        be assigned to different processes.
+
+        Args:
+            batch_size: An integer, representing the maximum number of t-norms of each block.
+            start: An integer, representing the index of the first t-norm to be generated.
+            stop: An integer, representing the index after the last t-norm to be generated. If it is not provided,
+                  the t-norms are generated until the last one.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1), whose elements are the matrices of the t-norms.
+        """
+        if stop is None:
+            stop = self.number_of_tnorms
+        if not 0 <= start <= stop <= self.number_of_tnorms:
+            raise Exception("The range of indices must be contained in the set of indices of the t-norms.")
+        if batch_size < 1:
+            raise Exception("The size of the blocks must be positive.")
+
+        for batch_start in range(start, stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            idempotent_masks = compute_idempotent_masks(n=self.n, start=batch_start, stop=batch_stop)
+            yield build_lukasiewicz_ordinal_sums(idempotent_masks, dtype=self.dtype)
+
+    def get_operator(self, idempotent_elements: [int]) -> numpy.ndarray:
+        """
+        Builds the divisible t-norm with the given idempotent elements.
+
+        Args:
+            idempotent_elements: A list of integers, representing the idempotent elements of the t-norm. The elements
+                                 0 and n are always idempotent, so they may be omitted.
+
+        Returns:
+            A numpy array of shape (n+1, n+1), representing the matrix of the t-norm.
+        """
+        if any(not 0 <= element <= self.n for element in idempotent_elements):
+            raise Exception("The idempotent elements must be contained in the finite chain.")
+        if self.archimedean and any(0 < element < self.n for element in idempotent_elements):
+            raise Exception("An archimedean t-norm has no idempotent elements apart from 0 and n.")
+
+        idempotent_mask = numpy.zeros((1, self.n + 1), dtype=bool)
+        idempotent_mask[0, list(idempotent_elements)] = True
+        idempotent_mask[0, [0, self.n]] = True
+        return build_lukasiewicz_ordinal_sums(idempotent_mask, dtype=self.dtype)[0]
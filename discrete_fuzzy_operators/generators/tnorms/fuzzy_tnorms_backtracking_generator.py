@@ -0,0 +1,132 @@
+import numpy
+
+from discrete_fuzzy_operators.base.generators.discrete_operator_constraint import DiscreteOperatorConstraint
+from discrete_fuzzy_operators.base.generators.discrete_operator_generator import DiscreteOperatorGenerator
+from discrete_fuzzy_operators.generators.tnorms.tnorms_backtracking_generator_utils.tnorms_backtracking_generator_utils \
+    import cell_lower_bound, enumerate_tnorms, generate_cell_order, initialize_tnorm_matrix
+from typing import Generator, Iterable
+
+
+class DiscreteTnormsBacktrackingGenerator(DiscreteOperatorGenerator):
+
+    def __init__(self, n: int, constraints: Iterable[DiscreteOperatorConstraint] = None):
+        """
+        Initializes the object that generates all possible t-norms over the finite chain Ln by backtracking.
+
+        The inner cells of the matrix are filled in place in a single array, column by column, and the associativity
+        is checked incrementally in the triples determined by each assigned cell, so that the candidates which are not
+        associative are discarded before their remaining cells are filled.
+
+        The enumeration is resumable: each call to next_batch continues from the point where the previous one stopped,
+        and the state of the enumeration is given by the attributes matrix and position.
+
+        If some constraints are given, they are enforced as bounds of the cells while the matrix is filled, so the
+        subtrees of candidates which violate them are never explored.
+
+        Args:
+            n: An integer, representing the dimension of the finite chain.
+            constraints: An iterable of DiscreteOperatorConstraint values, representing the properties that the
+                         generated t-norms must satisfy. Optional.
+        """
+        if n < 1:
+            raise Exception("The dimension of the finite chain must be positive to define a t-norm.")
+
+        super(DiscreteTnormsBacktrackingGenerator, self).__init__(n, constraints)
+        self.n = n
+        self.dtype = numpy.min_scalar_type(n)
+        self.cells = generate_cell_order(n)
+
+        # The upper bound of the cell (r, k) is min(r, k), since T(r,k) <= T(r,n) = r, and the boundary conditions are
+        # kept as bounds so that the constraints which contradict them produce an empty enumeration.
+        boundary = initialize_tnorm_matrix(n)
+        y, x = numpy.indices((n + 1, n + 1))
+        lower_bounds, upper_bounds = DiscreteOperatorConstraint.compute_cell_bounds(
+            constraints=self.constraints, n=n, lower_bounds=boundary, upper_bounds=numpy.minimum(x, y))
+        self.lower_bounds = numpy.maximum(lower_bounds, lower_bounds.T)
+        self.upper_bounds = numpy.minimum(upper_bounds, upper_bounds.T)
+        self.matrix = None
+        self.position = None
+        self.reset()
+
+    def reset(self):
+        """
+        Restarts the enumeration from the first t-norm.
+        """
+        self.matrix = initialize_tnorm_matrix(self.n)
+        self.position = 0 if (self.lower_bounds <= self.upper_bounds).all() else -1
+        if self.cells.shape[0] > 0:
+            r, k = self.cells[0]
+            self.matrix[r, k] = max(cell_lower_bound(self.matrix, r, k), self.lower_bounds[r, k]) - 1
+
+    def is_exhausted(self) -> bool:
+        """
+        Checks if all the t-norms have already been generated.
+        """
+        return self.position < 0
+
+    def next_batch(self, batch_size: int = 65536) -> numpy.ndarray:
+        """
+        Generates the next t-norms of the enumeration.
+
+        Args:
+            batch_size: An integer, representing the maximum number of t-norms to be generated.
+
+        Returns:
+            A numpy array of shape (K, n+1, n+1), with K <= batch_size, whose elements are the matrices of the
+            generated t-norms. It is empty if the enumeration has finished.
+        """
+        if batch_size < 1:
+            raise Exception("The size of the blocks must be positive.")
+
+        if self.is_exhausted():
+            return numpy.zeros((0, self.n + 1, self.n + 1), dtype=self.dtype)
+
+        if self.cells.shape[0] == 0:
+            # The only t-norm over L1 has no inner cells, so it is emitted without backtracking.
+            self.position = -1
+            return self.matrix.astype(self.dtype)[None, :, :]
+
+        output = numpy.empty((batch_size, self.n + 1, self.n + 1), dtype=self.dtype)
+        state = numpy.array([self.position], dtype=numpy.int64)
+        generated = enumerate_tnorms(self.matrix, self.cells, self.lower_bounds, self.upper_bounds, state, output)
+        self.position = int(state[0])
+        return output[:generated]
+
+    def generate_batches(self, batch_size: int = 65536) -> Generator[numpy.ndarray, None, None]:
+        """
+        Generates the remaining t-norms of the enumeration in blocks.
+
+        Args:
+            batch_size: An integer, representing the maximum number of t-norms of each block.
+
+        Returns:
+            A Generator of numpy arrays of shape (K, n+1, n+1), whose elements are the matrices of the t-norms.
+        """
+        while not self.is_exhausted():
+            batch = self.next_batch(batch_size)
+            if batch.shape[0] > 0:
+                yield batch
+
+    def generate_operators(self) -> Generator:
+        """
+        Generates all possible t-norms defined over the finite chain Ln.
+
+        Returns:
+            A Generator of numpy arrays, representing the matrices of the t-norms.
+        """
+        self.reset()
+        for batch in self.generate_batches():
+            yield from batch
+
+    def count_operators(self, batch_size: int = 65536) -> int:
+        """
+        Counts the number of t-norms defined over the finite chain Ln by enumerating all of them.
+
+        Args:
+            batch_size: An integer, representing the number of t-norms generated at once.
+
+        Returns:
+            An integer, representing the cardinality of the set of t-norms.
+        """
+        self.reset()
+        return sum(batch.shape[0] for batch in self.generate_batches(batch_size))
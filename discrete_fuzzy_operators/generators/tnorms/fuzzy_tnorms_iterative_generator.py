@@ -2,8 +2,14 @@ import numpy
 import os
 
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_aggregation_operator import DiscreteAggregationBinaryOperator
+from discrete_fuzzy_operators.generators.tnorms.fuzzy_tnorms_backtracking_generator import \
+    DiscreteTnormsBacktrackingGenerator
+from discrete_fuzzy_operators.generators.tnorms.divisible_tnorms_generator_utils.divisible_tnorms_generator_utils \
+    import is_lukasiewicz_ordinal_sum
 from discrete_fuzzy_operators.generators.tnorms.tnorms_iterative_generator_utils.tnorms_iterative_generator_utils import generate_increasing_rows, \
     generate_symmetric_matrix
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import FamilyBoundaryKind, \
+    save_operator_family
 from typing import List, Tuple
 
 
@@ -28,33 +34,36 @@ def generate_tnorms(n: int, save_results: bool, saving_path: str) -> Tuple[List,
     t_norms_archimedean = []
     t_norms_archimedean_divisible = []
 
-    for candidate_tnorm in generate_candidate_tnorms(n):
+    # The backtracking generator only yields t-norms, since the associativity is checked while the matrices are filled.
+    for tnorm_matrix in DiscreteTnormsBacktrackingGenerator(n).generate_operators():
+        tnorm = tnorm_matrix.astype(int)
+        operator = DiscreteAggregationBinaryOperator(n=n, operator_matrix=tnorm, check_properties_in_load=False)
+        t_norms.append(tnorm)
 
-        operator = DiscreteAggregationBinaryOperator(operator_matrix=candidate_tnorm)
-
-        # All matrices generated by generate_candidate_tnorms are increasing, commutative and verifies the boundary
-        # conditions. Indeed, only the associativity of the operator must be checked.
-        if operator.is_associative():
-            t_norms.append(candidate_tnorm)
-
-            if operator.is_divisible():
-                t_norms_divisible.append(candidate_tnorm)
-
-                if operator.is_archimedean():
-                    t_norms_archimedean_divisible.append(candidate_tnorm)
+        # A t-norm is divisible if and only if it is the ordinal sum of Lukasiewicz t-norms given by its idempotent
+        # elements, which is checked in O(n^2) operations instead of O(n^3).
+        if is_lukasiewicz_ordinal_sum(tnorm):
+            t_norms_divisible.append(tnorm)
 
             if operator.is_archimedean():
-                t_norms_archimedean.append(candidate_tnorm)
+                t_norms_archimedean_divisible.append(tnorm)
+
+        if operator.is_archimedean():
+            t_norms_archimedean.append(tnorm)
 
     if save_results:
         experiment_path = os.path.join(saving_path, f"N={n}")
         if not os.path.exists(experiment_path):
             os.mkdir(experiment_path)
 
-        numpy.save(os.path.join(experiment_path, "tnorms.npy"), t_norms)
-        numpy.save(os.path.join(experiment_path, "t_norms_divisible.npy"), t_norms_divisible)
-        numpy.save(os.path.join(experiment_path, "t_norms_archimedean.npy"), t_norms_archimedean)
-        numpy.save(os.path.join(experiment_path, "t_norms_archimedean_divisible.npy"), t_norms_archimedean_divisible)
+        save_operator_family(os.path.join(experiment_path, "tnorms.family"), t_norms,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "t_norms_divisible.family"), t_norms_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "t_norms_archimedean.family"), t_norms_archimedean,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM)
+        save_operator_family(os.path.join(experiment_path, "t_norms_archimedean_divisible.family"), t_norms_archimedean_divisible,
+                             n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM)
 
     return t_norms, t_norms_divisible, t_norms_archimedean, t_norms_archimedean_divisible
 
@@ -104,7 +113,7 @@ def generate_tnorm_matrix(n: int, inner_matrix: List[List]) -> numpy.ndarray:
     Returns:
         A numpy array, representing the matrix representation of a candidate to be a t-norm.
     """
-    tnorm = numpy.zeros((n+1, n+1), dtype=numpy.int)
+    tnorm = numpy.zeros((n+1, n+1), dtype=int)
     tnorm[:, n] = numpy.arange(0, n + 1)
     tnorm[n, :] = numpy.arange(0, n + 1)
 
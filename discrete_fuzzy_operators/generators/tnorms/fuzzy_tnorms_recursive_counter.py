@@ -1,30 +1,263 @@
+import itertools
 import numpy
+import time
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Tuple
+from discrete_fuzzy_operators.generators.tnorms.tnorms_checkpoint_utils.tnorms_checkpoint_utils import \
+    load_checkpoint, save_checkpoint
 from discrete_fuzzy_operators.generators.tnorms.tnorms_recursive_generator_utils.tnorms_recursive_generator_utils import \
-    check_fixed_associativity, generate_tnorm_candidate
+    build_tnorm_template, generate_tnorm_extensions
 
 
-def count_tnorms(depth_max: int) -> [int]:
+def count_tnorms(depth_max: int, workers: int = 1, frontier_depth: int = 6,
+                 progress_callback: Callable[[int, int], None] = None,
+                 checkpoint_path: str = None, checkpoint_interval: float = 60) -> [int]:
     """
     Determine the number of t-norms for certain values of n. Instead of generating all possible t-norms for each n,
     the t-norm tree is generated for successive n values.
 
+    The tree is expanded breadth-first up to the level frontier_depth, and the subtrees hanging from the t-norms of
+    that level are traversed depth-first. If more than one worker is requested, the subtrees are distributed in a pool
+    of processes; since their sizes vary a lot, each subtree is a separate task, which is assigned to the first idle
+    worker. The counts of the subtrees are added level by level.
+
+    If a checkpoint path is given, the finished subtrees and the partial counts are saved periodically, so that an
+    interrupted computation can be continued with resume_count_tnorms. With a single worker, the position of the
+    depth-first traversal inside the running subtree is saved as well, so no work is lost. With several workers, the
+    subtrees which are running when the computation is interrupted are traversed again, so the frontier_depth must be
+    large enough for each subtree to take a small fraction of the checkpoint interval.
+
     Args:
         depth_max: An integer which determines the maximum n to be reached.
+        workers: An integer, representing the number of processes used to traverse the subtrees.
+        frontier_depth: An integer, representing the level of the tree where the subtrees are split.
+        progress_callback: A function receiving the number of traversed subtrees and the total number of subtrees,
+                           which is called each time a subtree is finished. Optional.
+        checkpoint_path: A string, representing the path of the checkpoint file. Optional.
+        checkpoint_interval: A float, representing the minimum number of seconds between two checkpoints.
 
     Returns:
         A list of integers. Each value at position i in the list represents the cardinality of the set of t-norms for
         n=i+3.
     """
-    initial_seed = numpy.array([[0, 0], [0, 1]], dtype=int)
     counts = [0 for _ in range(depth_max-2)]
+    frontier = __expand_frontier(depth_max=depth_max, frontier_depth=frontier_depth, counts=counts)
+    state = {"kind": "count_tnorms", "depth_max": depth_max, "frontier_depth": frontier_depth,
+             "frontier_size": len(frontier), "finished_subtrees": [], "counts": counts}
+
+    return __traverse_frontier(frontier=frontier, state=state, workers=workers, progress_callback=progress_callback,
+                               checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+
+def resume_count_tnorms(checkpoint_path: str, workers: int = 1,
+                        progress_callback: Callable[[int, int], None] = None,
+                        checkpoint_interval: float = 60) -> [int]:
+    """
+    Continues the count of t-norms saved in a checkpoint by count_tnorms, traversing only the subtrees which were not
+    finished. The final counts are identical to the ones of an uninterrupted computation.
+
+    Args:
+        checkpoint_path: A string, representing the path of the checkpoint file, which keeps being updated.
+        workers: An integer, representing the number of processes used to traverse the subtrees.
+        progress_callback: A function receiving the number of traversed subtrees and the total number of subtrees,
+                           which is called each time a subtree is finished. Optional.
+        checkpoint_interval: A float, representing the minimum number of seconds between two checkpoints.
+
+    Returns:
+        A list of integers. Each value at position i in the list represents the cardinality of the set of t-norms for
+        n=i+3.
+    """
+    state = load_checkpoint(checkpoint_path, kind="count_tnorms")
+
+    # The expansion of the frontier is deterministic, so the subtrees are identified by their position in it. The
+    # counts of the expanded levels are already included in the checkpoint.
+    frontier = __expand_frontier(depth_max=state["depth_max"], frontier_depth=state["frontier_depth"],
+                                 counts=[0 for _ in range(state["depth_max"]-2)])
+    if len(frontier) != state["frontier_size"]:
+        raise Exception("The frontier of the t-norm tree does not match the one saved in the checkpoint.")
+
+    return __traverse_frontier(frontier=frontier, state=state, workers=workers, progress_callback=progress_callback,
+                               checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+
+def __traverse_frontier(frontier: List[Tuple[int, numpy.ndarray]], state: Dict, workers: int,
+                        progress_callback: Callable[[int, int], None], checkpoint_path: str,
+                        checkpoint_interval: float) -> [int]:
+    """
+    Traverses the subtrees of the frontier which are not finished in the given state, adding their counts to the
+    state and saving it periodically.
+
+    Args:
+        frontier: A list of tuples (n, t-norm), representing the roots of the subtrees.
+        state: A dictionary, containing the counts and the indices of the finished subtrees.
+        workers: An integer, representing the number of processes used to traverse the subtrees.
+        progress_callback: A function receiving the number of traversed subtrees and the total number of subtrees.
+        checkpoint_path: A string, representing the path of the checkpoint file, or None.
+        checkpoint_interval: A float, representing the minimum number of seconds between two checkpoints.
+
+    Returns:
+        A list of integers, representing the final counts.
+    """
+    counts = state["counts"]
+    finished = set(state["finished_subtrees"])
+    pending = [index for index in range(0, len(frontier)) if index not in finished]
+    running_subtree = state.get("running_subtree")
+    last_checkpoint = time.time()
+
+    def register_subtree(index: int, subtree_counts: List[int]):
+        nonlocal last_checkpoint
+        __merge_counts(counts, subtree_counts)
+        finished.add(index)
+        state["running_subtree"] = None
+        if progress_callback is not None:
+            progress_callback(len(finished), len(frontier))
+        if checkpoint_path is not None and time.time() - last_checkpoint >= checkpoint_interval:
+            state["finished_subtrees"] = sorted(finished)
+            save_checkpoint(checkpoint_path, state)
+            last_checkpoint = time.time()
+
+    if workers <= 1 or len(pending) <= 1:
+        for index in pending:
+            n, tnorm = frontier[index]
+            path, subtree_counts = None, None
+            if running_subtree is not None and running_subtree["index"] == index:
+                path, subtree_counts = running_subtree["path"], running_subtree["counts"]
+
+            def save_position(position: List[int], partial_counts: List[int], subtree_index: int = index):
+                nonlocal last_checkpoint
+                if time.time() - last_checkpoint >= checkpoint_interval:
+                    state["finished_subtrees"] = sorted(finished)
+                    state["running_subtree"] = {"index": subtree_index, "path": position, "counts": partial_counts}
+                    save_checkpoint(checkpoint_path, state)
+                    last_checkpoint = time.time()
+
+            register_subtree(index, __count_subtree(n=n, tnorm=tnorm, depth_max=state["depth_max"], path=path,
+                                                    subtree_counts=subtree_counts,
+                                                    position_callback=save_position if checkpoint_path else None))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(__count_subtree, frontier[index][0], frontier[index][1], state["depth_max"]):
+                       index for index in pending}
+            for future in as_completed(futures):
+                register_subtree(futures[future], future.result())
+
+    if checkpoint_path is not None:
+        state["finished_subtrees"] = sorted(finished)
+        state["running_subtree"] = None
+        save_checkpoint(checkpoint_path, state)
+    return counts
+
+
+def __expand_frontier(depth_max: int, frontier_depth: int, counts: List) -> List[Tuple[int, numpy.ndarray]]:
+    """
+    Expands breadth-first the t-norm tree up to the given level, counting the t-norms of the traversed levels.
+
+    Args:
+        depth_max: An integer, representing the maximum length of the tree.
+        frontier_depth: An integer, representing the level of the tree where the expansion stops.
+        counts: A list of integers, containing the cardinality of the different sets of t-norms.
+
+    Returns:
+        A list of tuples (n, t-norm), representing the roots of the subtrees that remain to be traversed.
+    """
+    frontier = [(2, numpy.array([[0, 0], [0, 1]], dtype=int))]
+    while frontier and frontier[0][0] < min(frontier_depth, depth_max):
+        next_frontier = []
+        for n, tnorm in frontier:
+            for matrix in __generate_children(n=n, tnorm_previous_step=tnorm):
+                counts[n-2] = counts[n-2]+1
+                next_frontier.append((n + 1, matrix))
+        frontier = next_frontier
+    return frontier
+
+
+def __count_subtree(n: int, tnorm: numpy.ndarray, depth_max: int, path: List[int] = None,
+                    subtree_counts: List[int] = None,
+                    position_callback: Callable[[List[int], List[int]], None] = None,
+                    position_interval: int = 65536) -> List[int]:
+    """
+    Counts the t-norms of the subtree generated from the given t-norm by an iterative depth-first traversal.
+
+    The position of the traversal is given by the number of children already generated at each level of the current
+    path; the last generated child of each level, except the deepest one, is the node whose subtree is being traversed.
+    Since the generation of the children is deterministic, the traversal can be resumed from a position by generating
+    again the children of each level of the path and skipping the ones already counted.
+
+    Args:
+        n: An integer, representing the dimension of the t-norms of the first level of the subtree.
+        tnorm: A numpy array, representing the root of the subtree.
+        depth_max: An integer, representing the maximum length of the tree.
+        path: A list of integers, representing the position where the traversal is resumed. Optional.
+        subtree_counts: A list of integers, representing the counts of the subtree up to the given position. Optional.
+        position_callback: A function receiving the position of the traversal and the counts of the subtree up to it,
+                           which is called every position_interval t-norms. Optional.
+        position_interval: An integer, representing the number of t-norms between two calls of position_callback.
+
+    Returns:
+        A list of integers, containing the number of t-norms of the subtree at each level of the tree.
+    """
+    counts = list(subtree_counts) if subtree_counts is not None else [0 for _ in range(depth_max-2)]
+    if n == depth_max:
+        return counts
+
+    # Each level of the stack contains its dimension, the generator of its children and the number of children
+    # already generated.
+    stack = []
+    level_n, level_tnorm = n, tnorm
+    for consumed in (path or []):
+        children = __generate_children(n=level_n, tnorm_previous_step=level_tnorm)
+        last_child = None
+        for last_child in itertools.islice(children, consumed):
+            pass
+        stack.append([level_n, children, consumed])
+        level_n, level_tnorm = level_n + 1, last_child
+    if not stack:
+        stack.append([n, __generate_children(n=n, tnorm_previous_step=tnorm), 0])
 
-    __generate_tree(n=2, tnorm_previous_step=initial_seed, depth_max=depth_max, counts=counts)
+    generated = 0
+    while stack:
+        level = stack[-1]
+        child = next(level[1], None)
+        if child is None:
+            stack.pop()
+            continue
 
+        level[2] += 1
+        counts[level[0]-2] = counts[level[0]-2]+1
+        if level[0] + 1 < depth_max:
+            stack.append([level[0] + 1, __generate_children(n=level[0] + 1, tnorm_previous_step=child), 0])
+
+        generated += 1
+        if position_callback is not None and generated % position_interval == 0:
+            position_callback([entry[2] for entry in stack], list(counts))
     return counts
 
 
+def __merge_counts(counts: List, subtree_counts: List):
+    """
+    Adds level by level the counts of a subtree to the global counts.
+    """
+    for level in range(0, len(counts)):
+        counts[level] = counts[level]+subtree_counts[level]
+
+
+def __generate_children(n: int, tnorm_previous_step: numpy.ndarray):
+    """
+    Generates the t-norms of dimension n whose kernel is the given t-norm.
+
+    Args:
+        n: An integer, representing the dimension of the new t-norms.
+        tnorm_previous_step: A numpy array, representing the t-norm from which the new t-norms will be generated.
+
+    Returns:
+        A Generator of numpy arrays, representing the new t-norms.
+    """
+    tnorm_template = build_tnorm_template(n=n, tnorm=tnorm_previous_step)
+    for tnorms in generate_tnorm_extensions(matrix=tnorm_template, n=n):
+        yield from tnorms
+
+
 def __generate_tree(n: int,
                     tnorm_previous_step: numpy.ndarray,
                     depth_max: int,
@@ -41,15 +274,7 @@ def __generate_tree(n: int,
     if n == depth_max:
         pass
     else:
-        submatrix = tnorm_previous_step[0:(n - 1), 0:(n - 1)]
-
-        tnorm_template = numpy.zeros((n + 1, n + 1), dtype=numpy.int)
-        tnorm_template[0:(n - 1), 0:(n - 1)] = submatrix
-        tnorm_template[:, n] = numpy.arange(n + 1)
-        tnorm_template[n, :] = numpy.arange(n + 1)
-
-        for matrix in generate_tnorm_candidate(matrix=tnorm_template, n=n):
-            if check_fixed_associativity(tnorm_candidate_matrix=matrix, n=n):
-                counts[n-2] = counts[n-2]+1
+        for matrix in __generate_children(n=n, tnorm_previous_step=tnorm_previous_step):
+            counts[n-2] = counts[n-2]+1
 
-                __generate_tree(n=n + 1, tnorm_previous_step=matrix, depth_max=depth_max, counts=counts)
+            __generate_tree(n=n + 1, tnorm_previous_step=matrix, depth_max=depth_max, counts=counts)
@@ -1,12 +1,21 @@
 import math
 import numpy
-from typing import List, Tuple
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import DiscreteOperatorFamilyFile, \
+    DiscreteOperatorFamilyReader, DiscreteOperatorFamilyWriter, FamilyBoundaryKind
 from discrete_fuzzy_operators.generators.tnorms.tnorms_recursive_generator_utils.tnorms_recursive_generator_utils import \
-    generate_tnorm_candidate, check_fixed_associativity
+    build_tnorm_candidates, build_tnorm_template, check_fixed_associativity_batch, generate_tnorm_candidate_vectors, \
+    generate_tnorm_extensions
+from discrete_fuzzy_operators.generators.tnorms.tnorms_checkpoint_utils.tnorms_checkpoint_utils import \
+    load_checkpoint, save_checkpoint
 
 
-def generate_tnorms(n: int, tnorms_previous_step: List[numpy.ndarray]) -> Tuple[numpy.ndarray, bool]:
+def generate_tnorms(n: int, tnorms_previous_step: List[numpy.ndarray],
+                    include_non_associative: bool = False) -> Tuple[numpy.ndarray, bool]:
     """
     Generates all possible t-norms over the finite chain L={0,1,...,n,n+1} from all the t-norms defined over the
     finite chain of size n.
@@ -19,27 +28,19 @@ def generate_tnorms(n: int, tnorms_previous_step: List[numpy.ndarray]) -> Tuple[
         n: An integer, representing the size of the chain where the given t-norms are defined.
         tnorms_previous_step: A list of numpy arrays, representing the set of all t-norms defined over the finite
                               chain of size n.
+        include_non_associative: A boolean, indicating if the candidates which are not associative are also
+                                 generated. By default, only the t-norms are generated.
 
     Returns:
         A numpy array, representing the matrix expression of a t-norm and a boolean, representing if the operator
         is associative.
     """
     for tnorm in tnorms_previous_step:
-        submatrix = tnorm[0:(n-1), 0:(n-1)]
+        yield from generate_tnorm_children(n=n, tnorm=tnorm, include_non_associative=include_non_associative)
 
-        tnorm_template = numpy.zeros((n + 1, n + 1), dtype=numpy.byte)
-        tnorm_template[0:(n - 1), 0:(n - 1)] = submatrix
-        tnorm_template[:, n] = numpy.arange(n + 1)
-        tnorm_template[n, :] = numpy.arange(n + 1)
 
-        for matrix in generate_tnorm_candidate(matrix=tnorm_template, n=n):
-            if check_fixed_associativity(tnorm_candidate_matrix=matrix, n=n):
-                yield matrix, True
-            else:
-                yield matrix, False
-
-
-def generate_tnorms_from_codification(n: int, encoded_tnorms_previous_step: List[numpy.ndarray]) -> Tuple[numpy.ndarray, bool]:
+def generate_tnorms_from_codification(n: int, encoded_tnorms_previous_step: List[numpy.ndarray],
+                                      include_non_associative: bool = False) -> Tuple[numpy.ndarray, bool]:
     """
     Generates all possible t-norms over the finite chain L={0,1,...,n,n+1} from all the t-norms defined over the
     finite chain of size n.
@@ -52,24 +53,264 @@ def generate_tnorms_from_codification(n: int, encoded_tnorms_previous_step: List
         n: An integer, representing the size of the chain where the given t-norms are defined.
         encoded_tnorms_previous_step: A list of numpy arrays, representing the set of all t-norms defined over the finite
                               chain of size n and its matrix expression is codified.
+        include_non_associative: A boolean, indicating if the candidates which are not associative are also
+                                 generated. By default, only the t-norms are generated.
 
     Returns:
-        A numpy array, representing the matrix expression of a t-norm.
+        A numpy array, representing the matrix expression of a t-norm and a boolean, representing if the operator
+        is associative.
     """
     for codified_tnorm in encoded_tnorms_previous_step:
-        tnorm = decode_tnorm(codified_tnorm)
-        submatrix = tnorm[0:(n-1), 0:(n-1)]
+        yield from generate_tnorm_children(n=n, tnorm=decode_tnorm(codified_tnorm),
+                                           include_non_associative=include_non_associative)
 
-        tnorm_template = numpy.zeros((n + 1, n + 1), dtype=numpy.byte)
-        tnorm_template[0:(n - 1), 0:(n - 1)] = submatrix
-        tnorm_template[:, n] = numpy.arange(n + 1)
-        tnorm_template[n, :] = numpy.arange(n + 1)
 
-        for matrix in generate_tnorm_candidate(matrix=tnorm_template, n=n):
-            if check_fixed_associativity(tnorm_candidate_matrix=matrix, n=n):
+def generate_tnorm_children(n: int, tnorm: numpy.ndarray,
+                            include_non_associative: bool = False) -> Tuple[numpy.ndarray, bool]:
+    """
+    Generates the t-norms over the finite chain L={0,1,...,n,n+1} which extend the given t-norm, defined over the
+    finite chain of size n.
+
+    Args:
+        n: An integer, representing the size of the chain where the given t-norm is defined.
+        tnorm: A numpy array, representing the matrix expression of the t-norm.
+        include_non_associative: A boolean, indicating if the candidates which are not associative are also
+                                 generated.
+
+    Returns:
+        A numpy array, representing the matrix expression of a t-norm and a boolean, representing if the operator
+        is associative.
+    """
+    if not include_non_associative:
+        # Only the t-norms are requested, so the candidates are enumerated in place by the compiled kernel.
+        tnorm_template = build_tnorm_template(n=n, tnorm=tnorm)
+        for tnorms in generate_tnorm_extensions(matrix=tnorm_template, n=n):
+            for matrix in tnorms:
                 yield matrix, True
-            else:
-                yield matrix, False
+        return
+
+    candidates, associative = generate_tnorm_children_batch(n=n, tnorm=tnorm, include_non_associative=True)
+    for matrix, is_associative in zip(candidates, associative):
+        yield matrix, bool(is_associative)
+
+
+def generate_tnorm_children_batch(n: int, tnorm: numpy.ndarray,
+                                  include_non_associative: bool = False) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Generates at once all the candidates over the finite chain L={0,1,...,n,n+1} which extend the given t-norm,
+    defined over the finite chain of size n, and checks their fixed associativity with a vectorized gather over the
+    whole batch instead of one candidate at a time.
+
+    Args:
+        n: An integer, representing the size of the chain where the given t-norm is defined.
+        tnorm: A numpy array, representing the matrix expression of the t-norm.
+        include_non_associative: A boolean, indicating if the candidates which are not associative are also
+                                 returned.
+
+    Returns:
+        A numpy array of shape (K, n+1, n+1), representing the matrix expressions of the candidates, and a numpy array
+        of booleans of shape (K,), representing which candidates are associative.
+    """
+    tnorm_template = build_tnorm_template(n=n, tnorm=tnorm)
+    candidate_vectors = generate_tnorm_candidate_vectors(matrix=tnorm_template, n=n)
+    associative = check_fixed_associativity_batch(matrix=tnorm_template, candidate_vectors=candidate_vectors, n=n)
+    if not include_non_associative:
+        candidate_vectors = candidate_vectors[associative]
+        associative = associative[associative]
+    return build_tnorm_candidates(matrix=tnorm_template, candidate_vectors=candidate_vectors, n=n), associative
+
+
+def extend_tnorms_level(input_path: str, output_path: str, workers: int = 1, chunk_size: int = 1024,
+                        write_batch_size: int = 65536) -> int:
+    """
+    Generates all possible t-norms of the next level of the t-norm tree from the t-norms stored in a family file, and
+    writes them to another family file, without loading any of the levels in memory.
+
+    The t-norms of the input file are split in chunks of consecutive t-norms. The children of each chunk are written
+    to a part file, in batches of at most write_batch_size t-norms, and the part files are concatenated in order at
+    the end, so the output does not depend on the number of workers. If more than one worker is requested, the chunks
+    are distributed in a pool of processes.
+
+    Args:
+        input_path: A string, representing the path of the family file of the t-norms over L_n.
+        output_path: A string, representing the path of the family file where the t-norms over L_{n+1} are written.
+        workers: An integer, representing the number of processes used to extend the chunks.
+        chunk_size: An integer, representing the number of t-norms of the input file extended by each task.
+        write_batch_size: An integer, representing the maximum number of t-norms kept in memory before writing them.
+
+    Returns:
+        An integer, representing the number of t-norms written in the output file.
+    """
+    layout, count = DiscreteOperatorFamilyFile.read_header(input_path)
+    if not layout.symmetric or layout.boundary != FamilyBoundaryKind.TNORM:
+        raise Exception("The input file must contain a family of t-norms.")
+
+    parts_path = f"{output_path}.parts"
+    os.makedirs(parts_path, exist_ok=True)
+    tasks = [(input_path, start, min(start + chunk_size, count), os.path.join(parts_path, f"{index}.family"),
+              write_batch_size) for index, start in enumerate(range(0, count, chunk_size))]
+
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            __extend_tnorms_chunk(*task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(__extend_tnorms_chunk, *task) for task in tasks]:
+                future.result()
+
+    with DiscreteOperatorFamilyWriter(output_path, n=layout.n + 1, symmetric=True,
+                                      boundary=FamilyBoundaryKind.TNORM) as writer:
+        for task in tasks:
+            writer.append_family(task[3])
+            os.remove(task[3])
+        written = writer.count
+    os.rmdir(parts_path)
+    return written
+
+
+def __extend_tnorms_chunk(input_path: str, start: int, stop: int, part_path: str, write_batch_size: int) -> int:
+    """
+    Extends the t-norms of a chunk of a family file and writes the children to a part file.
+
+    Args:
+        input_path: A string, representing the path of the family file of the t-norms over L_n.
+        start: An integer, representing the index of the first t-norm of the chunk.
+        stop: An integer, representing the index after the last t-norm of the chunk.
+        part_path: A string, representing the path of the family file where the children are written.
+        write_batch_size: An integer, representing the maximum number of t-norms kept in memory before writing them.
+
+    Returns:
+        An integer, representing the number of t-norms written in the part file.
+    """
+    reader = DiscreteOperatorFamilyReader(input_path)
+    n = reader.n + 1
+
+    with DiscreteOperatorFamilyWriter(part_path, n=n, symmetric=True, boundary=FamilyBoundaryKind.TNORM) as writer:
+        batch = []
+        batch_length = 0
+        for tnorms in reader.iterate_chunks(start=start, stop=stop):
+            for tnorm in tnorms:
+                template = build_tnorm_template(n=n, tnorm=tnorm)
+                for children in generate_tnorm_extensions(matrix=template, n=n, batch_size=write_batch_size):
+                    batch.append(children)
+                    batch_length = batch_length + children.shape[0]
+                    if batch_length >= write_batch_size:
+                        writer.append(numpy.concatenate(batch))
+                        batch = []
+                        batch_length = 0
+        if batch:
+            writer.append(numpy.concatenate(batch))
+        return writer.count
+
+
+def extend_encoded_tnorms(n: int, encoded_tnorms_previous_step: List[numpy.ndarray], output_path: str,
+                          checkpoint_path: str = None, checkpoint_interval: float = 60) -> int:
+    """
+    Generates all possible t-norms over the finite chain L={0,1,...,n,n+1} from the codified t-norms defined over the
+    finite chain of size n, as generate_tnorms_from_codification does, and appends the codifications of the
+    associative ones to a binary file, one row of unsigned bytes per t-norm. The file can be read with
+    load_encoded_tnorms.
+
+    If a checkpoint path is given, the number of processed t-norms of the previous step and the number of written
+    t-norms are saved periodically, after the output file has been synchronised with the disk, so that an interrupted
+    extension can be continued with resume_extend_encoded_tnorms.
+
+    Args:
+        n: An integer, representing the size of the chain where the given t-norms are defined.
+        encoded_tnorms_previous_step: A list of numpy arrays, representing the codified t-norms of the previous step.
+        output_path: A string, representing the path of the binary file where the new t-norms are written.
+        checkpoint_path: A string, representing the path of the checkpoint file. Optional.
+        checkpoint_interval: A float, representing the minimum number of seconds between two checkpoints.
+
+    Returns:
+        An integer, representing the number of t-norms written in the output file.
+    """
+    state = {"kind": "extend_encoded_tnorms", "n": n, "output_path": output_path,
+             "number_of_parents": len(encoded_tnorms_previous_step), "processed_parents": 0, "written_tnorms": 0}
+    with open(output_path, "wb"):
+        pass
+
+    return __extend_encoded_tnorms_from_state(encoded_tnorms_previous_step=encoded_tnorms_previous_step, state=state,
+                                              checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+
+def resume_extend_encoded_tnorms(encoded_tnorms_previous_step: List[numpy.ndarray], checkpoint_path: str,
+                                 checkpoint_interval: float = 60) -> int:
+    """
+    Continues an extension of codified t-norms saved in a checkpoint by extend_encoded_tnorms. The output file is
+    truncated to the t-norms written before the checkpoint, and the extension continues from the first t-norm of the
+    previous step which was not processed, so the final file is identical to the one of an uninterrupted extension.
+
+    Args:
+        encoded_tnorms_previous_step: A list of numpy arrays, representing the same codified t-norms of the previous
+                                      step that were given to extend_encoded_tnorms.
+        checkpoint_path: A string, representing the path of the checkpoint file, which keeps being updated.
+        checkpoint_interval: A float, representing the minimum number of seconds between two checkpoints.
+
+    Returns:
+        An integer, representing the number of t-norms written in the output file.
+    """
+    state = load_checkpoint(checkpoint_path, kind="extend_encoded_tnorms")
+    if len(encoded_tnorms_previous_step) != state["number_of_parents"]:
+        raise Exception("The t-norms of the previous step do not match the ones saved in the checkpoint.")
+
+    with open(state["output_path"], "r+b") as file:
+        file.truncate(state["written_tnorms"] * __encoded_length(state["n"]))
+
+    return __extend_encoded_tnorms_from_state(encoded_tnorms_previous_step=encoded_tnorms_previous_step, state=state,
+                                              checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+
+def load_encoded_tnorms(path: str, n: int) -> numpy.ndarray:
+    """
+    Loads the codified t-norms written by extend_encoded_tnorms.
+
+    Args:
+        path: A string, representing the path of the binary file.
+        n: An integer, representing the size of the chain where the t-norms of the previous step are defined.
+
+    Returns:
+        A numpy array of shape (K, l), whose rows are the codifications of the t-norms.
+    """
+    return numpy.fromfile(path, dtype=numpy.uint8).reshape(-1, __encoded_length(n))
+
+
+def __extend_encoded_tnorms_from_state(encoded_tnorms_previous_step: List[numpy.ndarray], state: Dict,
+                                       checkpoint_path: str, checkpoint_interval: float) -> int:
+    """
+    Extends the codified t-norms of the previous step from the position given by the state, appending the new
+    t-norms to the output file and saving the state periodically.
+    """
+    n = state["n"]
+    last_checkpoint = time.time()
+
+    with open(state["output_path"], "ab") as file:
+        for parent in range(state["processed_parents"], state["number_of_parents"]):
+            tnorm = decode_tnorm(encoded_tnorms_previous_step[parent])
+            for matrix, _ in generate_tnorm_children(n=n, tnorm=tnorm):
+                file.write(encode_matrix(matrix).astype(numpy.uint8).tobytes())
+                state["written_tnorms"] += 1
+            state["processed_parents"] = parent + 1
+
+            if checkpoint_path is not None and time.time() - last_checkpoint >= checkpoint_interval:
+                file.flush()
+                os.fsync(file.fileno())
+                save_checkpoint(checkpoint_path, state)
+                last_checkpoint = time.time()
+
+        file.flush()
+        os.fsync(file.fileno())
+
+    if checkpoint_path is not None:
+        save_checkpoint(checkpoint_path, state)
+    return state["written_tnorms"]
+
+
+def __encoded_length(n: int) -> int:
+    """
+    Computes the length of the codification of the t-norms generated from the t-norms of the chain of size n.
+    """
+    return (n - 1) * n // 2
 
 
 def encode_matrix(matrix: numpy.ndarray) -> numpy.ndarray:
@@ -0,0 +1,145 @@
+import numpy
+from numba import jit
+
+
+def generate_cell_order(n: int) -> numpy.ndarray:
+    """
+    Computes the order in which the inner cells of the matrix of a t-norm are filled. Since the matrix is symmetric,
+    only the cells (r, k) with 1 <= r <= k <= n-1 are considered, column by column and from top to bottom; this way,
+    once the column k has been filled, the restriction of the t-norm to {0, 1, ..., k} is completely known.
+
+    Args:
+        n: An integer, representing the size of the finite chain.
+
+    Returns:
+        A numpy array of shape (m, 2), whose rows are the cells (r, k) in the order of filling.
+    """
+    return numpy.array([(r, k) for k in range(1, n) for r in range(1, k + 1)], dtype=numpy.int64).reshape(-1, 2)
+
+
+def initialize_tnorm_matrix(n: int) -> numpy.ndarray:
+    """
+    Initializes the matrix where the t-norms are built in place, with the boundary conditions T(x,0)=0 and T(x,n)=x.
+
+    Args:
+        n: An integer, representing the size of the finite chain.
+
+    Returns:
+        A numpy array of shape (n+1, n+1).
+    """
+    matrix = numpy.zeros((n + 1, n + 1), dtype=numpy.int64)
+    matrix[:, n] = numpy.arange(0, n + 1)
+    matrix[n, :] = numpy.arange(0, n + 1)
+    return matrix
+
+
+@jit(nopython=True)
+def cell_lower_bound(matrix: numpy.ndarray, r: int, k: int) -> int:
+    """
+    Computes the smallest value of the cell (r, k) which keeps the matrix increasing, given the cells filled before.
+    """
+    lower_bound = matrix[r - 1, k]
+    if r < k and matrix[r, k - 1] > lower_bound:
+        lower_bound = matrix[r, k - 1]
+    return lower_bound
+
+
+@jit(nopython=True)
+def check_cell_associativity(matrix: numpy.ndarray, r: int, k: int) -> bool:
+    """
+    Verifies the associativity of the triples of {1, ..., k} which contain k and whose lookups have just been
+    determined by the assignment of the cell (r, k).
+
+    When r < k, these are the triples in which k appears once and r is the largest of the other elements; all the
+    lookups are then known since T(x,y) <= min(x,y). When r = k, the cell T(k,k) determines the triples in which k
+    appears twice. By commutativity, only one triple of each pair (a,b,c), (c,b,a) is checked, so every triple of the
+    chain is checked exactly once along the filling of the matrix.
+
+    Args:
+        matrix: A numpy array, representing the partially filled matrix of the t-norm.
+        r: An integer, representing the row of the assigned cell.
+        k: An integer, representing the column of the assigned cell.
+
+    Returns:
+        A boolean, indicating if no triple determined by the cell violates the associativity.
+    """
+    if r < k:
+        for x in range(1, r + 1):
+            # T(k, T(r, x)) = T(T(k, r), x) and T(k, T(x, r)) = T(T(k, x), r).
+            if matrix[k, matrix[r, x]] != matrix[matrix[k, r], x]:
+                return False
+            if matrix[k, matrix[x, r]] != matrix[matrix[k, x], r]:
+                return False
+            # T(x, T(k, r)) = T(T(x, k), r).
+            if matrix[x, matrix[k, r]] != matrix[matrix[x, k], r]:
+                return False
+    else:
+        for x in range(1, k):
+            # T(k, T(k, x)) = T(T(k, k), x) and T(k, T(x, k)) = T(T(k, x), k).
+            if matrix[k, matrix[k, x]] != matrix[matrix[k, k], x]:
+                return False
+            if matrix[k, matrix[x, k]] != matrix[matrix[k, x], k]:
+                return False
+    return True
+
+
+@jit(nopython=True)
+def enumerate_tnorms(matrix: numpy.ndarray, cells: numpy.ndarray, lower_bounds: numpy.ndarray,
+                     upper_bounds: numpy.ndarray, state: numpy.ndarray, output: numpy.ndarray) -> int:
+    """
+    Enumerates the t-norms by backtracking over the inner cells of a single matrix, which is modified in place.
+
+    Each cell takes the values between its lower bound, given by the increasingness and the lower bound of the cell,
+    and the upper bound of the cell, which is at most its row r, since T(r,k) <= T(r,n) = r. After each assignment,
+    the associativity is checked in the triples determined by the cell, so that whole subtrees of candidates are
+    discarded as soon as a violation appears.
+
+    The enumeration stops when the output buffer is full, and it can be resumed calling again the function with the
+    same matrix and state.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the matrix where the t-norms are built.
+        cells: A numpy array of shape (m, 2), representing the order of filling of the cells, with m >= 1.
+        lower_bounds: A numpy array of shape (n+1, n+1), representing the lower bounds of the cells.
+        upper_bounds: A numpy array of shape (n+1, n+1), representing the upper bounds of the cells, which must not
+                      exceed min(r, k) in the cell (r, k).
+        state: A numpy array of shape (1,), containing the position of the cell to be incremented, or -1 if the
+               enumeration has finished.
+        output: A numpy array of shape (K, n+1, n+1), where the generated t-norms are written.
+
+    Returns:
+        An integer, representing the number of t-norms written in the output buffer.
+    """
+    size = matrix.shape[0]
+    last_position = cells.shape[0] - 1
+    position = state[0]
+    generated = 0
+
+    while position >= 0:
+        r = cells[position, 0]
+        k = cells[position, 1]
+        value = matrix[r, k] + 1
+        if value > upper_bounds[r, k]:
+            position -= 1
+            continue
+
+        matrix[r, k] = value
+        matrix[k, r] = value
+        if not check_cell_associativity(matrix, r, k):
+            continue
+
+        if position == last_position:
+            for i in range(0, size):
+                for j in range(0, size):
+                    output[generated, i, j] = matrix[i, j]
+            generated += 1
+            if generated == output.shape[0]:
+                break
+        else:
+            position += 1
+            r = cells[position, 0]
+            k = cells[position, 1]
+            matrix[r, k] = max(cell_lower_bound(matrix, r, k), lower_bounds[r, k]) - 1
+
+    state[0] = position
+    return generated
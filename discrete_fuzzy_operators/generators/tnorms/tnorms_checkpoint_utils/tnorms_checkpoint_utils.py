@@ -0,0 +1,41 @@
+import json
+import os
+
+from typing import Dict
+
+
+def save_checkpoint(checkpoint_path: str, state: Dict):
+    """
+    Saves the state of a long-running traversal as a JSON file. The state is first written in a temporary file of the
+    same directory, which is synchronised with the disk and then renamed onto the checkpoint; since the renaming is
+    atomic, the checkpoint always contains a complete state, even if the process is interrupted while saving it.
+
+    Args:
+        checkpoint_path: A string, representing the path of the checkpoint file.
+        state: A dictionary, representing the state to be saved. Its values must be serialisable as JSON.
+    """
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(state, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path: str, kind: str) -> Dict:
+    """
+    Loads the state of a long-running traversal from a checkpoint file.
+
+    Args:
+        checkpoint_path: A string, representing the path of the checkpoint file.
+        kind: A string, representing the kind of traversal that the checkpoint must belong to.
+
+    Returns:
+        A dictionary, representing the saved state.
+    """
+    with open(checkpoint_path, "r") as file:
+        state = json.load(file)
+
+    if state.get("kind") != kind:
+        raise Exception(f"The checkpoint does not belong to a traversal of kind {kind}.")
+    return state
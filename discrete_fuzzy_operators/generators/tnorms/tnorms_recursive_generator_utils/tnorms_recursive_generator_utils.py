@@ -53,3 +53,227 @@ def check_fixed_associativity(tnorm_candidate_matrix: numpy.ndarray, n: int) ->
             if not tnorm_candidate_matrix[x, tnorm_candidate_matrix[n - 1, y]] == tnorm_candidate_matrix[n - 1, tnorm_candidate_matrix[x, y]]:
                 return False
     return True
+
+
+@jit(nopython=True)
+def check_row_fixed_associativity(tnorm_candidate_matrix: numpy.ndarray, n: int, r: int) -> bool:
+    """
+    Verifies the fixed associativity T(x,T(n-1,y))=T(n-1,T(x,y)) in the equations determined by the assignment of the
+    cell (r, n-1) of the new row/column, once the cells (1, n-1), ..., (r, n-1) have been assigned.
+
+    When r < n-1, these are the equations with y=r, whose lookups only involve the kernel and the cells (y, n-1) with
+    y <= r, since T(x,y) <= min(x,y). When r = n-1, the cell T(n-1,n-1) determines the equations with y=n-1. The
+    equations with x in {0, n-1, n} or y in {0, n} are trivial, so all the equations of check_fixed_associativity are
+    verified once the last cell has been assigned.
+
+    Args:
+        tnorm_candidate_matrix: A numpy array, representing the partially filled matrix of the t-norm.
+        n: An integer, representing the size of the finite chain where the new t-norm is defined.
+        r: An integer, representing the row of the assigned cell.
+
+    Returns:
+        A boolean, indicating if no equation determined by the cell is violated.
+    """
+    m = n - 1
+    for x in range(1, m):
+        if not tnorm_candidate_matrix[x, tnorm_candidate_matrix[m, r]] == tnorm_candidate_matrix[m, tnorm_candidate_matrix[x, r]]:
+            return False
+    return True
+
+
+@jit(nopython=True)
+def extension_cell_lower_bound(matrix: numpy.ndarray, n: int, r: int) -> int:
+    """
+    Computes the smallest value of the cell (r, n-1) which keeps the matrix increasing, given the kernel and the
+    cells of the previous rows.
+    """
+    lower_bound = matrix[r - 1, n - 1]
+    if r < n - 1 and matrix[r, n - 2] > lower_bound:
+        lower_bound = matrix[r, n - 2]
+    return lower_bound
+
+
+@jit(nopython=True)
+def enumerate_tnorm_extensions(matrix: numpy.ndarray, n: int, state: numpy.ndarray, output: numpy.ndarray) -> int:
+    """
+    Enumerates the t-norms which extend a kernel filling the penultimate row/column in place, with an explicit
+    backtracking over the cells (1, n-1), ..., (n-1, n-1). Each cell takes the values between its lower bound, given
+    by the increasingness, and its row r, and the fixed associativity is checked after each assignment, so the
+    prefixes which cannot be completed are discarded.
+
+    The enumeration stops when the output buffer is full, and it can be resumed calling again the function with the
+    same matrix and state.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm, with the kernel and the
+                boundary conditions.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+        state: A numpy array of shape (1,), containing the row of the cell to be incremented, or 0 if the
+               enumeration has finished. It must be initialised with initialize_tnorm_extensions.
+        output: A numpy array of shape (K, n+1, n+1), where the generated t-norms are written.
+
+    Returns:
+        An integer, representing the number of t-norms written in the output buffer.
+    """
+    m = n - 1
+    r = state[0]
+    generated = 0
+
+    while r >= 1:
+        value = matrix[r, m] + 1
+        if value > r:
+            r -= 1
+            continue
+
+        matrix[r, m] = value
+        matrix[m, r] = value
+        if not check_row_fixed_associativity(matrix, n, r):
+            continue
+
+        if r == m:
+            output[generated, :, :] = matrix
+            generated += 1
+            if generated == output.shape[0]:
+                break
+        else:
+            r += 1
+            matrix[r, m] = extension_cell_lower_bound(matrix, n, r) - 1
+
+    state[0] = r
+    return generated
+
+
+def build_tnorm_template(n: int, tnorm: numpy.ndarray) -> numpy.ndarray:
+    """
+    Builds the template of the t-norms over the finite chain of size n whose kernel is the given t-norm; that is, the
+    matrix of shape (n+1, n+1) with the kernel, the boundary conditions and the penultimate row/column to be filled.
+
+    Args:
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+        tnorm: A numpy array, representing the t-norm over the finite chain of size n-1.
+
+    Returns:
+        A numpy array of shape (n+1, n+1), representing the template.
+    """
+    tnorm_template = numpy.zeros((n + 1, n + 1), dtype=numpy.byte)
+    tnorm_template[0:(n - 1), 0:(n - 1)] = tnorm[0:(n - 1), 0:(n - 1)]
+    tnorm_template[:, n] = numpy.arange(n + 1)
+    tnorm_template[n, :] = numpy.arange(n + 1)
+    return tnorm_template
+
+
+def initialize_tnorm_extensions(matrix: numpy.ndarray, n: int) -> numpy.ndarray:
+    """
+    Prepares the template of a t-norm to enumerate its extensions with enumerate_tnorm_extensions.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm, which is modified.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+
+    Returns:
+        A numpy array of shape (1,), representing the initial state of the enumeration.
+    """
+    matrix[1, n - 1] = extension_cell_lower_bound(matrix, n, 1) - 1
+    return numpy.array([1], dtype=numpy.int64)
+
+
+def generate_tnorm_extensions(matrix: numpy.ndarray, n: int, batch_size: int = 4096) -> numpy.ndarray:
+    """
+    Generates all the t-norms which extend the template of a t-norm filling the penultimate row/column, using the
+    compiled kernel enumerate_tnorm_extensions.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm. It is not modified.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+        batch_size: An integer, representing the size of the output buffer of the kernel.
+
+    Returns:
+        A Generator of numpy arrays of shape (K, n+1, n+1), containing the t-norms.
+    """
+    matrix = matrix.copy()
+    state = initialize_tnorm_extensions(matrix, n)
+    while state[0] >= 1:
+        output = numpy.empty((batch_size, n + 1, n + 1), dtype=matrix.dtype)
+        generated = enumerate_tnorm_extensions(matrix, n, state, output)
+        if generated > 0:
+            yield output[:generated]
+
+
+def generate_tnorm_candidate_vectors(matrix: numpy.ndarray, n: int) -> numpy.ndarray:
+    """
+    Generates, at once, the penultimate row/column of all the candidates generated by generate_tnorm_candidate from the
+    given template, in the same order. Since all the candidates share the kernel and the boundary conditions, each of
+    them is determined by the vector (T(n-1,0), T(n-1,1), ..., T(n-1,n)).
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+
+    Returns:
+        A numpy array of shape (K, n+1), whose rows are the vectors of the candidates.
+    """
+    vectors = numpy.zeros((1, n + 1), dtype=matrix.dtype)
+    vectors[:, n] = n - 1
+    for step in range(1, n):
+        lower_bounds = vectors[:, step - 1].astype(int)
+        if step < n - 1:
+            lower_bounds = numpy.maximum(lower_bounds, matrix[step, n - 2])
+        lengths = step - lower_bounds + 1
+
+        # Each partial vector is repeated once for each admissible value of the cell, in increasing order.
+        starts = numpy.cumsum(lengths) - lengths
+        vectors = numpy.repeat(vectors, lengths, axis=0)
+        vectors[:, step] = numpy.repeat(lower_bounds - starts, lengths) + numpy.arange(0, vectors.shape[0])
+    return vectors
+
+
+def build_tnorm_candidates(matrix: numpy.ndarray, candidate_vectors: numpy.ndarray, n: int) -> numpy.ndarray:
+    """
+    Builds the stack of matrices of the candidates given by the template and the vectors of their penultimate
+    row/column.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm.
+        candidate_vectors: A numpy array of shape (K, n+1), representing the vectors of the candidates.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+
+    Returns:
+        A numpy array of shape (K, n+1, n+1), representing the matrices of the candidates.
+    """
+    candidates = numpy.repeat(matrix[None, :, :], candidate_vectors.shape[0], axis=0)
+    candidates[:, n - 1, :] = candidate_vectors
+    candidates[:, :, n - 1] = candidate_vectors
+    return candidates
+
+
+def check_fixed_associativity_batch(matrix: numpy.ndarray, candidate_vectors: numpy.ndarray, n: int) -> numpy.ndarray:
+    """
+    Verifies the fixed associativity T(x,T(n-1,y))=T(n-1,T(x,y)) of all the candidates at once, with a single gather
+    for each side of the equations.
+
+    Args:
+        matrix: A numpy array of shape (n+1, n+1), representing the template of the t-norm.
+        candidate_vectors: A numpy array of shape (K, n+1), representing the vectors of the candidates.
+        n: An integer, representing the size of the finite chain where the new t-norms are defined.
+
+    Returns:
+        A numpy array of booleans of shape (K,), indicating which candidates verify the fixed associativity.
+    """
+    size = n + 1
+    k = candidate_vectors.shape[0]
+    candidates = build_tnorm_candidates(matrix=matrix, candidate_vectors=candidate_vectors, n=n)
+    vectors = candidate_vectors.astype(numpy.intp)
+
+    # The equations with x in {0, n-1, n} or y in {0, n} are trivial, so only the inner block is gathered. The gathers
+    # are done over the flattened arrays, with the offset of each candidate added to the indices.
+    rows = numpy.arange(1, n - 1)
+    columns = numpy.arange(1, n)
+    offsets = numpy.arange(0, k)[:, None, None]
+
+    # T(x, T(n-1,y)): for each candidate, the columns of its matrix are gathered with its own vector.
+    left_indices = offsets * (size * size) + rows[None, :, None] * size + vectors[:, None, columns]
+    left_side = numpy.take(candidates, left_indices)
+    # T(n-1, T(x,y)): for each candidate, its vector is gathered with its own matrix.
+    right_indices = offsets * size + candidates[:, 1:(n - 1), 1:n]
+    right_side = numpy.take(vectors, right_indices)
+    return (left_side == right_side).all(axis=(1, 2))
@@ -0,0 +1,149 @@
+import numpy
+import time
+
+from discrete_fuzzy_operators.generators.conjunctions.discrete_conjunctions_recursive_generator import \
+    DiscreteConjunctionsRecursiveGenerator
+from typing import Generator, List
+
+
+# region Baseline: nested recursion of increasing vectors
+def __baseline_conjunction_generator(n: int, k: int = 1, previous_conjunction_matrix: numpy.ndarray = None) -> \
+        Generator[numpy.ndarray, None, None]:
+    """
+    Reproduces the original recursive generator of discrete conjunctions, which is kept as the baseline of the
+    benchmark. In the step k, it fills the k-th row and column with all possible increasing vectors bounded below by
+    the previous row and column, and then the diagonal element (k, k), copying the lists and matrices in each step.
+
+    Args:
+        n: An integer, representing the size of the finite chain where the conjunctions are defined.
+        k: An integer, representing the recursive step.
+        previous_conjunction_matrix: A numpy array, representing the temporal matrix which is candidate to be a
+                                     conjunction.
+
+    Returns:
+        A Generator of numpy arrays, representing the matrices of the conjunctions.
+    """
+    if previous_conjunction_matrix is None:
+        previous_conjunction_matrix = numpy.zeros(shape=(n + 1, n + 1), dtype=int)
+        previous_conjunction_matrix[n, n] = n
+
+    if n == 1:
+        yield previous_conjunction_matrix
+    elif k == 1:
+        for w in range(0, n + 1):
+            conjunction_matrix = previous_conjunction_matrix.copy()
+            conjunction_matrix[k, k] = w
+            yield from __baseline_conjunction_generator(n=n, k=k + 1, previous_conjunction_matrix=conjunction_matrix)
+    else:
+        if k == 2:
+            restrictions_column = [previous_conjunction_matrix[1, 1]]
+            restrictions_row = [previous_conjunction_matrix[1, 1]]
+        else:
+            restrictions_column = previous_conjunction_matrix[1:k, k - 1]
+            restrictions_row = previous_conjunction_matrix[k - 1, 1:k]
+
+        for increasing_vector_row in __baseline_increasing_vector_generator(position=0, n=n,
+                                                                            restrictions=restrictions_row):
+            for increasing_vector_column in __baseline_increasing_vector_generator(position=0, n=n,
+                                                                                   restrictions=restrictions_column):
+                next_step_conjunction_template = previous_conjunction_matrix.copy()
+                next_step_conjunction_template[1:k, k] = increasing_vector_column
+                next_step_conjunction_template[k, 1:k] = increasing_vector_row
+
+                if k < n:
+                    lower_bound = max(max(increasing_vector_row), max(increasing_vector_column))
+                    for w in range(lower_bound, n + 1):
+                        next_step_conjunction = next_step_conjunction_template.copy()
+                        next_step_conjunction[k, k] = w
+                        yield from __baseline_conjunction_generator(n=n, k=k + 1,
+                                                                    previous_conjunction_matrix=next_step_conjunction)
+                else:
+                    yield next_step_conjunction_template
+
+
+def __baseline_increasing_vector_generator(position: int, n: int, restrictions: List[int], vector: List[int] = None) \
+        -> Generator[List[int], None, None]:
+    """
+    Constructs all possible increasing vectors whose components are in the finite chain and are greater than or equal
+    to the restriction at the same index, as the original recursive generator of discrete conjunctions did.
+
+    Args:
+        position: An integer, representing the index of the component to be set.
+        n: An integer, representing the size of the finite chain.
+        restrictions: A list of integers, representing the lower bounds of the components of the vectors.
+        vector: A list of integers, representing the temporal vector, whose components before position are set.
+
+    Returns:
+        A Generator of lists of integers, representing the increasing vectors.
+    """
+    if vector is None:
+        vector = [0] * (len(restrictions))
+
+    if position == 0:
+        for x in range(restrictions[0], n + 1):
+            temp_vec = vector.copy()
+            temp_vec[0] = x
+
+            if len(vector) == 1:
+                yield temp_vec
+            else:
+                yield from __baseline_increasing_vector_generator(position=position + 1, n=n,
+                                                                  restrictions=restrictions, vector=temp_vec)
+    elif 1 <= position < len(restrictions) - 1:
+        for x in range(max(restrictions[position], vector[position - 1]), n + 1):
+            temp_vec = vector.copy()
+            temp_vec[position] = x
+
+            yield from __baseline_increasing_vector_generator(position=position + 1, n=n,
+                                                              restrictions=restrictions, vector=temp_vec)
+    elif position == len(restrictions) - 1:
+        for x in range(max(restrictions[position], vector[position - 1]), n + 1):
+            vector[len(restrictions) - 1] = x
+            yield vector
+# endregion
+
+
+if __name__ == "__main__":
+
+    # EXAMPLE: Throughput of the enumeration of discrete conjunctions, with and without the compiled kernel, against the
+    # original recursive generator, which built the conjunctions row by row from increasing vectors. Since the number
+    # of conjunctions grows very fast, at most the first 10^6 conjunctions are generated for each n.
+    generation_limit = 10 ** 6
+    for n in range(3, 7):
+        number_of_conjunctions = DiscreteConjunctionsRecursiveGenerator(n=n).count_operators()
+        stop = min(number_of_conjunctions, generation_limit)
+
+        # Both generators enumerate the conjunctions in different orders, so they are compared as sets when the whole
+        # family can be generated.
+        if number_of_conjunctions <= generation_limit:
+            baseline_conjunctions = {conjunction.astype(numpy.int64).tobytes()
+                                     for conjunction in __baseline_conjunction_generator(n=n)}
+            conjunctions = {conjunction.astype(numpy.int64).tobytes()
+                            for conjunction in DiscreteConjunctionsRecursiveGenerator(n=n).generate_operators()}
+            if baseline_conjunctions != conjunctions or len(conjunctions) != number_of_conjunctions:
+                raise Exception("The original generator and the current one do not generate the same conjunctions.")
+            print(f"n={n}: BOTH GENERATORS GENERATE THE SAME {len(conjunctions)} CONJUNCTIONS")
+
+        t = time.time()
+        generated = 0
+        for _ in __baseline_conjunction_generator(n=n):
+            generated += 1
+            if generated == stop:
+                break
+        elapsed_time = time.time() - t
+        print(f"n={n}, ORIGINAL RECURSIVE GENERATOR: {generated} CONJUNCTIONS "
+              f"IN {elapsed_time:.3f} s ({generated / elapsed_time:.0f} CONJUNCTIONS/s)")
+
+        for use_numba in [False, True]:
+            generator = DiscreteConjunctionsRecursiveGenerator(n=n, use_numba=use_numba)
+
+            # The first batch compiles the kernel, so it is not measured.
+            generator.reset()
+            generator.next_batch(batch_size=1)
+
+            t = time.time()
+            generated = sum(batch.shape[0] for batch in generator.generate_batches(stop=stop))
+            elapsed_time = time.time() - t
+
+            print(f"n={n}, NUMBA={use_numba}: {generated} OF {generator.count_operators()} CONJUNCTIONS "
+                  f"IN {elapsed_time:.3f} s ({generated / elapsed_time:.0f} CONJUNCTIONS/s)")
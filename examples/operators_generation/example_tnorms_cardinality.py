@@ -1,7 +1,9 @@
+import os
 import time
 import pickle
 
-from discrete_fuzzy_operators.generators.tnorms.fuzzy_tnorms_recursive_counter import count_tnorms
+from discrete_fuzzy_operators.generators.tnorms.fuzzy_tnorms_recursive_counter import count_tnorms, \
+    resume_count_tnorms
 
 
 if __name__ == "__main__":
@@ -9,7 +11,17 @@ if __name__ == "__main__":
     t = time.time()
 
     generation_limit = 20
-    count = count_tnorms(depth_max=generation_limit)
+    checkpoint_path = "count_tnorms_checkpoint.json"
+    progress_callback = lambda finished, total: print(f"SUBTREES: {finished}/{total}")
+
+    # With several workers, the subtrees running when the computation is interrupted are traversed again, so the
+    # frontier is deep enough to split the tree in small subtrees.
+    if os.path.exists(checkpoint_path):
+        count = resume_count_tnorms(checkpoint_path=checkpoint_path, workers=os.cpu_count(),
+                                    progress_callback=progress_callback)
+    else:
+        count = count_tnorms(depth_max=generation_limit, workers=os.cpu_count(), frontier_depth=9,
+                             progress_callback=progress_callback, checkpoint_path=checkpoint_path)
 
     print(f"NUMBER OF T-NORMS UP TO n={generation_limit}")
     print(count)
@@ -1,12 +1,12 @@
 from typing import Set
 
-import numpy
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import load_operator_family
 
 if __name__ == "__main__":
 
     # EXAMPLE: Load the generated data as a set in order to be able to find intersections, unions and complements.
     def load_set(file_path: str) -> Set:
-        example_operators = list(numpy.load(file_path))
+        example_operators = list(load_operator_family(file_path))
         example_operators = [operator_matrix.flatten() for operator_matrix in example_operators]
         example_operators = {tuple(operator) for operator in example_operators}
 
@@ -14,16 +14,15 @@ if __name__ == "__main__":
 
     root_path = r"Experiments\E1\N=4\\"
 
-    copulas = load_set(file_path=root_path+"copulas.npy")
-    copulas_associative = load_set(file_path=root_path+"copulas_associative.npy")
-    copulas_commutative = load_set(file_path=root_path+"copulas_commutatuve.npy")
-    copulas_divisible = load_set(file_path=root_path+"copulas_divisible.npy")
-    copulas_archimedean = load_set(file_path=root_path+"copulas_archimedean.npy")
-    copulas_archimedean_divisible = load_set(file_path=root_path+"copulas_archimedean.npy")
+    copulas = load_set(file_path=root_path+"copulas.family")
+    copulas_associative = load_set(file_path=root_path+"copulas_associative.family")
+    copulas_commutative = load_set(file_path=root_path+"copulas_commutatuve.family")
+    copulas_divisible = load_set(file_path=root_path+"copulas_divisible.family")
+    copulas_archimedean_divisible = load_set(file_path=root_path+"copulas_archimedean_divisible.family")
 
-    tnorms = load_set(file_path=root_path+"tnorms.npy")
-    tnorms_archimedean = load_set(file_path=root_path+"t_norms_archimedean.npy")
-    tnorms_divisible = load_set(file_path=root_path+"t_norms_divisible.npy")
+    tnorms = load_set(file_path=root_path+"tnorms.family")
+    tnorms_archimedean = load_set(file_path=root_path+"t_norms_archimedean.family")
+    tnorms_divisible = load_set(file_path=root_path+"t_norms_divisible.family")
 
 
 
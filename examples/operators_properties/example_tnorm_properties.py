@@ -1,5 +1,6 @@
 import numpy
 
+from discrete_fuzzy_operators.base.storage.discrete_operator_family_file import load_operator_family
 from discrete_fuzzy_operators.base.operators.binary_operators.discrete.suboperators.fuzzy_discrete_aggregation_operator import \
     DiscreteAggregationBinaryOperator
 
@@ -43,7 +44,7 @@ if __name__ == "__main__":
     discrete_dataset_path = r"C:\Users\Usuario\OneDrive - Universitat de les Illes Balears\UIB\Tesi\Experiments\DiscreteDataset"
 
     for n in range(2, 11 + 1):
-        tnorms = numpy.load(discrete_dataset_path + rf"\N={n}\tnorms.npy", allow_pickle=True)
+        tnorms = load_operator_family(discrete_dataset_path + rf"\N={n}\tnorms.family")
         count = 0
 
         for tnorm in tnorms: